@@ -0,0 +1,14 @@
+"""Timing helpers shared by the benchmark scripts."""
+
+import timeit
+from typing import Any, Callable
+
+
+def best_ms(fn: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """The fastest of `repeat` runs, in milliseconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1000
+
+
+def report(name: str, ms: float, baseline: float | None = None) -> None:
+    speedup = f"  ({baseline / ms:.1f}x)" if baseline else ""
+    print(f"{name:<40} {ms:10.3f} ms{speedup}")
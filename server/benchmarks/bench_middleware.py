@@ -0,0 +1,74 @@
+"""
+Per-request overhead of the middleware stack: the HTTPS middleware as a
+BaseHTTPMiddleware subclass with SessionMiddleware on every request (before),
+against the plain ASGI ForceHTTPSRedirectMiddleware with SessionMiddleware
+scoped to the login routes (after). Both apps otherwise have the same stack
+as the real app and one trivial route, called through TestClient.
+
+Run from the server directory against a configured database (the same
+environment as the app, which is imported for its middleware):
+
+    python -m benchmarks.bench_middleware
+"""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.middleware.trustedhost import TrustedHostMiddleware
+
+from jeffersonlab_phonebook.api.compression import CompressionMiddleware
+from jeffersonlab_phonebook.main import ForceHTTPSRedirectMiddleware, PathPrefixMiddleware
+
+from ._timing import best_ms, report
+
+HOST = "vulcan.jlab.org"
+NUMBER = 500
+SECRET_KEY = "benchmark"
+
+
+class BaseHTTPForceHTTPSMiddleware(BaseHTTPMiddleware):
+    """The HTTPS middleware as it was before."""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.headers.get("x-forwarded-proto") == "https":
+            request.scope["scheme"] = "https"
+        return await call_next(request)
+
+
+def make_app(before: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping(request: Request):
+        return {"scheme": request.url.scheme}
+
+    app.add_middleware(CompressionMiddleware)
+    if before:
+        app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
+        app.add_middleware(BaseHTTPForceHTTPSMiddleware)
+    else:
+        app.add_middleware(
+            PathPrefixMiddleware,
+            middleware=SessionMiddleware,
+            prefix="/user",
+            secret_key=SECRET_KEY,
+        )
+        app.add_middleware(ForceHTTPSRedirectMiddleware)
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=[HOST])
+    return app
+
+
+def main() -> None:
+    headers = {"X-Forwarded-Proto": "https"}
+    results = []
+    for before in (True, False):
+        with TestClient(make_app(before), base_url=f"http://{HOST}") as client:
+            assert client.get("/ping", headers=headers).json() == {"scheme": "https"}
+            results.append(best_ms(lambda: client.get("/ping", headers=headers), NUMBER))
+    report("before: BaseHTTPMiddleware + sessions", results[0])
+    report("after: plain ASGI, scoped sessions", results[1], results[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+A 1,000-row list endpoint: returning ORM objects and letting FastAPI
+serialize them through `response_model` (before), against returning
+OrmJSON(...).response(...) (after).
+
+The serialization step is timed on its own, with the before path spelled
+out as FastAPI 0.116 (the version in uv.lock) runs it: validate, dump to
+JSON-compatible Python, then json.dumps in JSONResponse. Whole requests are
+timed against the installed FastAPI; releases that write response_model
+bodies with pydantic's dump_json close most of the gap.
+
+The rows are transient Member objects with their institution, shaped like
+the /members/ list, so no database is needed:
+
+    python -m benchmarks.bench_orm_json
+"""
+
+import json
+from datetime import date
+from typing import List
+
+import fastapi
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from jeffersonlab_phonebook.api.serialization import OrmJSON
+from jeffersonlab_phonebook.db.models import Institution, Member
+from jeffersonlab_phonebook.schemas.response_schemas import MemberLiteResponse
+
+from ._timing import best_ms, report
+
+ROWS = 1000
+NUMBER = 20
+
+
+def make_members(rows: int) -> list[Member]:
+    institutions = [
+        Institution(
+            id=i,
+            entityid=f"inst-{i}",
+            full_name=f"Institution {i}",
+            short_name=f"I{i}",
+            country="US",
+            city="Newport News",
+            date_added=date(2020, 1, 1),
+            is_active=True,
+        )
+        for i in range(50)
+    ]
+    return [
+        Member(
+            id=i,
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            email=f"member{i}@example.org",
+            orcid=f"0000-0000-0000-{i:04d}",
+            institution_id=institutions[i % 50].id,
+            institution=institutions[i % 50],
+            date_joined=date(2021, 1, 1),
+            is_active=True,
+        )
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    members = make_members(ROWS)
+    serializer = OrmJSON(List[MemberLiteResponse])
+    adapter = serializer.adapter
+
+    def before_serialize() -> bytes:
+        value = adapter.validate_python(members, from_attributes=True)
+        return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+    assert json.loads(before_serialize()) == json.loads(serializer.dump(members))
+    before_ms = best_ms(before_serialize, NUMBER)
+    report(f"before: validate + json.dumps, {ROWS} rows", before_ms)
+    report(f"after: OrmJSON.dump, {ROWS} rows", best_ms(lambda: serializer.dump(members), NUMBER), before_ms)
+
+    app = FastAPI()
+
+    @app.get("/before", response_model=List[MemberLiteResponse])
+    def before():
+        return members
+
+    @app.get("/after", response_model=List[MemberLiteResponse])
+    def after():
+        return serializer.response(members)
+
+    client = TestClient(app)
+    assert client.get("/before").json() == client.get("/after").json()
+
+    print(f"whole requests, FastAPI {fastapi.__version__}:")
+    before_ms = best_ms(lambda: client.get("/before"), NUMBER)
+    report(f"before: response_model, {ROWS} rows", before_ms)
+    report(f"after: OrmJSON, {ROWS} rows", best_ms(lambda: client.get("/after"), NUMBER), before_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Dashboard summary counters: one query per counter, as the dashboard used to
+fetch them, against StatsRepository.get_summary's single statement and the
+cached route path.
+
+Run from the server directory against a configured database (the same
+environment as the app):
+
+    python -m benchmarks.bench_stats_summary
+"""
+
+from datetime import date
+
+from sqlalchemy import exists, func, select
+
+from jeffersonlab_phonebook.db.models import (
+    Conference,
+    Group,
+    Institution,
+    Member,
+    Talk,
+    TalkAssignment,
+)
+from jeffersonlab_phonebook.db.session import SessionLocal
+from jeffersonlab_phonebook.repositories.stats_repository import (
+    SUMMARY_TABLES,
+    StatsRepository,
+)
+from jeffersonlab_phonebook.services.cache import stats_cache
+
+from ._timing import best_ms, report
+
+NUMBER = 200
+
+
+def summary_per_counter(db, today: date) -> dict[str, int]:
+    """The counters as separate round trips, one per statement."""
+    has_assignment = exists().where(TalkAssignment.talk_id == Talk.id)
+    return {
+        "active_members": db.scalar(
+            select(func.count(Member.id)).where(Member.is_active.is_(True))
+        ),
+        "active_institutions": db.scalar(
+            select(func.count(Institution.id)).where(Institution.is_active.is_(True))
+        ),
+        "active_groups": db.scalar(
+            select(func.count(Group.id)).where(Group.is_active.is_(True))
+        ),
+        "upcoming_conferences": db.scalar(
+            select(func.count(Conference.id)).where(Conference.start_date >= today)
+        ),
+        "unassigned_talks": db.scalar(
+            select(func.count(Talk.id)).where(~has_assignment)
+        ),
+    }
+
+
+def main() -> None:
+    today = date.today()
+    with SessionLocal() as db:
+        repo = StatsRepository(db)
+        assert summary_per_counter(db, today) == repo.get_summary(today)
+
+        before = best_ms(lambda: summary_per_counter(db, today), NUMBER)
+        report("before: one query per counter", before)
+        report("after: single statement", best_ms(lambda: repo.get_summary(today), NUMBER), before)
+        report(
+            "after: cached",
+            best_ms(
+                lambda: stats_cache.get_or_load(
+                    db,
+                    f"summary:{today.isoformat()}",
+                    SUMMARY_TABLES,
+                    lambda: repo.get_summary(today),
+                ),
+                NUMBER,
+            ),
+            before,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Response compression negotiated from Accept-Encoding.
+
+A pure ASGI middleware: response messages are passed on as they arrive, so
+streaming exports are compressed chunk by chunk and never buffered. Brotli is
+preferred when the optional `brotli` package is installed and the client
+accepts it, gzip otherwise. Bodies sent in one message are left alone below
+a size threshold.
+
+A compressed body is a different representation from the identity one, so
+its strong ETag gets the encoding as a suffix ("<tag>-gzip"). The suffix of
+the encoding negotiated for the request is removed from If-None-Match before
+the request reaches the application, which keeps TableETag's 304 responses
+working; tags of another encoding are left as they are and do not match. Responses with a strong ETag are
+deterministic for that tag, so their compressed bodies are kept in a small
+LRU cache keyed by ETag and encoding and reused until the tables change.
+"""
+
+import zlib
+from collections import OrderedDict
+from typing import Any, Optional
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+)
+# Bodies at least this large are compressed in a worker thread.
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def _brotli() -> Any:
+    try:
+        # Optional dependency, only needed for brotli compression.
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """The codings named in an Accept-Encoding header and their q-values."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            accepted[coding.lower()] = quality
+    return accepted
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return (
+        content_type.startswith(COMPRESSIBLE_TYPES)
+        or "+json" in content_type
+        or "+xml" in content_type
+    ) and "no-transform" not in headers.get("cache-control", "")
+
+
+class _Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        if encoding == "br":
+            self._brotli = _brotli().Compressor(quality=brotli_quality)
+            self._zlib = None
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses `data` and flushes it, so the client can decode it now."""
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush()
+
+
+class CompressedBodyCache:
+    """Compressed bodies by (ETag, encoding), bounded by their total size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, int], bytes] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: tuple[str, str, int]) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def set(self, key: tuple[str, str, int], body: bytes) -> None:
+        if len(body) > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = body
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        cache_max_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = CompressedBodyCache(cache_max_bytes)
+        self.brotli_available = _brotli() is not None
+
+    def _negotiate(self, headers: Headers) -> Optional[str]:
+        accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+        wildcard = accepted.get("*", 0.0)
+        if self.brotli_available and accepted.get("br", wildcard) > 0:
+            return "br"
+        if accepted.get("gzip", wildcard) > 0:
+            return "gzip"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = self._negotiate(headers)
+        suffix = f'-{encoding}"'
+        revalidating = encoding is not None and suffix in headers.get("if-none-match", "")
+        if revalidating:
+            scope = dict(scope)
+            scope["headers"] = [
+                (name, value.decode("latin-1").replace(suffix, '"').encode("latin-1"))
+                if name == b"if-none-match"
+                else (name, value)
+                for name, value in scope["headers"]
+            ]
+        responder = _CompressionResponder(self, encoding, revalidating, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: Optional[str],
+        revalidating: bool,
+        send: Send,
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        # Whether the client's If-None-Match named a compressed representation.
+        self.revalidating = revalidating
+        self._send = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if message["status"] == 304:
+                # A 304 has no Content-Type, but the representation it
+                # validates may vary with the encoding.
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+                if self.revalidating:
+                    # It carries the ETag of the representation the client has.
+                    self._tag_etag(MutableHeaders(raw=message["headers"]))
+            if (
+                message["status"] in (204, 304)
+                or not _compressible(headers)
+                or "content-encoding" in headers
+            ):
+                self.passthrough = True
+                await self._send(message)
+                return
+            MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            if self.encoding is None:
+                self.passthrough = True
+                await self._send(message)
+                return
+            # Held back until the first body message shows whether the
+            # response is small or streamed.
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            if not more_body:
+                await self._send_whole(start, body)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            self._set_encoding(headers)
+            del headers["content-length"]
+            await self._send(start)
+            self.compressor = self._new_compressor()
+
+        assert self.compressor is not None
+        if more_body:
+            data = self.compressor.compress(body) if body else b""
+        else:
+            data = self.compressor.finish(body)
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _new_compressor(self) -> _Compressor:
+        assert self.encoding is not None
+        return _Compressor(
+            self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+        )
+
+    async def _send_whole(self, start: Message, body: bytes) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        if len(body) < self.middleware.minimum_size:
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        assert self.encoding is not None
+        etag = headers.get("etag")
+        key = None
+        compressed = None
+        if etag and not etag.startswith("W/"):
+            key = (etag, self.encoding, len(body))
+            compressed = self.middleware.cache.get(key)
+        if compressed is None:
+            if len(body) >= THREAD_MINIMUM_SIZE:
+                compressed = await anyio.to_thread.run_sync(
+                    self._new_compressor().finish, body
+                )
+            else:
+                compressed = self._new_compressor().finish(body)
+            if key is not None:
+                self.middleware.cache.set(key, compressed)
+
+        self._set_encoding(headers)
+        headers["content-length"] = str(len(compressed))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    def _set_encoding(self, headers: MutableHeaders) -> None:
+        assert self.encoding is not None
+        headers["content-encoding"] = self.encoding
+        self._tag_etag(headers)
+
+    def _tag_etag(self, headers: MutableHeaders) -> None:
+        etag = headers.get("etag")
+        if etag and etag.endswith('"'):
+            headers["etag"] = f'{etag[:-1]}-{self.encoding}"'
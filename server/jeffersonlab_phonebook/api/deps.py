@@ -1,11 +1,20 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import jwt
 from authlib.integrations.starlette_client import OAuth
-from fastapi import HTTPException, Request, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
 from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.db.models import Base
+from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.repositories.table_version_repository import (
+    TableVersionRepository,
+)
 
 
 def get_oauth() -> OAuth:
@@ -77,3 +86,83 @@ def get_current_user(request: Request):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         ) from exc
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Weak comparison of an ETag against an If-None-Match header, as required
+    for conditional GETs.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+class TableETag:
+    """
+    Dependency deriving a strong ETag for a GET route from the version
+    counters of the tables its response is built from.
+
+    If the request's If-None-Match matches, a 304 Not Modified is raised
+    before the route body runs, so the only query made is the counter lookup.
+    Otherwise the ETag is set on the response and returned, for routes that
+    build their own Response. The versions read are kept on `request.state`.
+    """
+
+    def __init__(self, *models: type[Base]):
+        self.tables = frozenset(model.__tablename__ for model in models)
+
+    def __call__(
+        self, request: Request, response: Response, db: Session = Depends(get_db)
+    ) -> str:
+        versions = TableVersionRepository(db).get_versions(self.tables)
+        # Reused by cached_json_response to stamp cache entries.
+        request.state.table_versions = versions
+        fingerprint = "|".join(
+            [str(request.url.path), str(request.url.query)]
+            + [f"{table}={version}" for table, version in versions.items()]
+        )
+        etag = f'"{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"'
+        if _etag_matches(etag, request.headers.get("if-none-match")):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
+        return etag
+
+
+class FieldSelection:
+    """
+    Dependency parsing the `fields` query parameter of a list route: a comma
+    separated subset of the fields of the route's response schema. Returns
+    None when the parameter is absent, meaning every field.
+
+    Unknown field names are rejected with a 400 listing the allowed ones.
+    """
+
+    def __init__(self, schema: type[BaseModel]):
+        self.allowed = tuple(schema.model_fields)
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(
+            None,
+            description="Comma separated names of the fields to return for each item; all fields when omitted.",
+        ),
+    ) -> Optional[frozenset[str]]:
+        if fields is None:
+            return None
+        selected = frozenset(name.strip() for name in fields.split(",") if name.strip())
+        unknown = sorted(selected.difference(self.allowed))
+        if not selected or unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Unknown fields: {', '.join(unknown) or '(none given)'}. "
+                    f"Allowed fields: {', '.join(self.allowed)}"
+                ),
+            )
+        return selected
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from jeffersonlab_phonebook.api.routes import institutions, login, members, board_members, groups, utils, role, talk_conference, talk_assignment
+from jeffersonlab_phonebook.api.routes import institutions, login, members, board_members, groups, utils, role, talk_conference, talk_assignment, stats, author_list, export
 
 api_router = APIRouter()
 api_router.include_router(login.router)
@@ -13,3 +13,6 @@ api_router.include_router(role.router)
 api_router.include_router(talk_conference.conference_router)
 api_router.include_router(talk_conference.router)
 api_router.include_router(talk_assignment.router)
+api_router.include_router(stats.router)
+api_router.include_router(author_list.router)
+api_router.include_router(export.router)
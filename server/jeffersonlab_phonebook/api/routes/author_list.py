@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.schemas.author_list_schemas import (
+    AuthorListFormat,
+    AuthorListResponse,
+)
+from jeffersonlab_phonebook.services.author_list import author_list_cache
+
+from ..deps import get_current_user
+
+router = APIRouter(prefix="/author-list", tags=["author-list"])
+
+_MEDIA_TYPES = {
+    AuthorListFormat.REVTEX: "application/x-tex",
+    AuthorListFormat.TEXT: "text/plain",
+}
+
+
+@router.get(
+    "/",
+    response_model=AuthorListResponse,
+    summary="Generate the collaboration author list",
+    description="Builds the ordered author list of active members with numbered affiliations, as JSON, REVTeX or plain text.",
+    responses={
+        200: {
+            "content": {
+                "application/x-tex": {"schema": {"type": "string"}},
+                "text/plain": {"schema": {"type": "string"}},
+            }
+        }
+    },
+)
+def get_author_list(
+    format: AuthorListFormat = AuthorListFormat.JSON,
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    """
+    Returns the author list in the requested format. The list is only rebuilt
+    when members, institutions or affiliation history change.
+    """
+    result = author_list_cache.get(db, format)
+    if format is AuthorListFormat.JSON:
+        return result
+    return PlainTextResponse(result, media_type=_MEDIA_TYPES[format])
@@ -12,12 +12,18 @@ from jeffersonlab_phonebook.schemas.board_schemas import (
 )
 from jeffersonlab_phonebook.schemas.response_schemas import InstitutionalBoardMemberResponse
 from jeffersonlab_phonebook.db.constants import BoardType
+from jeffersonlab_phonebook.db.models import Institution, InstitutionalBoardMember, Member, Role
 
 from jeffersonlab_phonebook.db.session import get_db
-from ..deps import get_current_user
+from jeffersonlab_phonebook.services.notifications import BOARD_APPOINTED, notify
+from ..deps import TableETag, get_current_user
+from ..serialization import OrmJSON
 
 router = APIRouter(prefix="/board-members", tags=["Board Members"])
 
+_board_membership = OrmJSON(InstitutionalBoardMemberResponse)
+_board_membership_list = OrmJSON(List[InstitutionalBoardMemberResponse])
+
 
 @router.get(
     "/",
@@ -33,6 +39,7 @@ def list_board_memberships(
     member_id: Optional[int] = None,
     institution_id: Optional[int] = None,
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(InstitutionalBoardMember, Member, Institution, Role)),
 ):
     ibm_repo = InstitutionalBoardMemberRepository(db)
     board_memberships_orms = ibm_repo.get_all(
@@ -42,7 +49,7 @@ def list_board_memberships(
         member_id=member_id,
         institution_id=institution_id,
     )
-    return board_memberships_orms
+    return _board_membership_list.response(board_memberships_orms, etag=etag)
 
 
 @router.post(
@@ -58,6 +65,16 @@ def create_board_membership(
     _=Depends(get_current_user),
 ):
     ibm_repo = InstitutionalBoardMemberRepository(db)
+    notify(
+        db,
+        ibm_in.member_id,
+        BOARD_APPOINTED,
+        {
+            "institution_id": ibm_in.institution_id,
+            "board_type": ibm_in.board_type.value,
+            "role_id": ibm_in.role_id,
+        },
+    )
     db_ibm = ibm_repo.create(ibm_in=ibm_in)
     return db_ibm
 
@@ -72,6 +89,7 @@ def get_board_membership(
     ibm_id: int,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(InstitutionalBoardMember, Member, Institution, Role)),
 ):
     ibm_repo = InstitutionalBoardMemberRepository(db)
     ibm = ibm_repo.get(ibm_id)
@@ -79,7 +97,7 @@ def get_board_membership(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board membership not found"
         )
-    return ibm
+    return _board_membership.response(ibm, etag=etag)
 
 
 @router.put(
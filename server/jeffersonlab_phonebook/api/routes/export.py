@@ -0,0 +1,227 @@
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import (
+    Group,
+    GroupMember,
+    Institution,
+    InstitutionalBoardMember,
+    Member,
+    Role,
+)
+from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.schemas.export_schemas import ExportFormat, SnapshotStatus
+from jeffersonlab_phonebook.services.export import (
+    iter_members_csv,
+    iter_members_ldif,
+    iter_members_ndjson,
+    iter_members_vcard,
+)
+from jeffersonlab_phonebook.services.snapshots import (
+    DIRECTORY_JOB,
+    SNAPSHOT_NAMES,
+    current_directory,
+    current_snapshot,
+    request_build,
+    snapshots_available,
+)
+
+from ..deps import TableETag, get_current_user
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+_GROUP_FILTER = Query(None, description="Only the current members of this working group.")
+_INSTITUTION_FILTER = Query(None, description="Only the members of this institution.")
+
+
+@router.get(
+    "/members",
+    summary="Export the whole member directory",
+    description="Streams every member with their institution's name, location and ROR ID, as newline-delimited JSON or CSV.",
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            }
+        }
+    },
+)
+def export_members(
+    format: ExportFormat = ExportFormat.NDJSON,
+    group_id: Optional[int] = _GROUP_FILTER,
+    institution_id: Optional[int] = _INSTITUTION_FILTER,
+    _=Depends(get_current_user),
+):
+    """
+    Returns the directory in one response instead of page by page. Rows are
+    streamed from a server-side cursor as they are read, so the export's
+    memory use does not depend on the number of members.
+    """
+    if format is ExportFormat.CSV:
+        body = iter_members_csv(group_id=group_id, institution_id=institution_id)
+    else:
+        body = iter_members_ndjson(group_id=group_id, institution_id=institution_id)
+    return StreamingResponse(
+        body,
+        media_type=_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="members.{format.value}"'},
+    )
+
+
+@router.get(
+    "/members.vcf",
+    summary="Export active members as vCards",
+    description="Streams a vCard 4.0 for every active member, with their institution as organization and work address, for import into address books. Supports If-None-Match.",
+    responses={200: {"content": {"text/vcard": {"schema": {"type": "string"}}}}},
+)
+def export_members_vcard(
+    group_id: Optional[int] = _GROUP_FILTER,
+    institution_id: Optional[int] = _INSTITUTION_FILTER,
+    _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Member, Institution, GroupMember)),
+):
+    return StreamingResponse(
+        iter_members_vcard(group_id=group_id, institution_id=institution_id),
+        media_type="text/vcard",
+        headers={"Content-Disposition": 'attachment; filename="members.vcf"', "ETag": etag},
+    )
+
+
+@router.get(
+    "/members.ldif",
+    summary="Export active members as LDIF",
+    description="Streams an inetOrgPerson entry for every active member, for loading into an LDAP directory. Entries are placed under the configured LDIF_BASE_DN. Supports If-None-Match.",
+    responses={200: {"content": {"text/x-ldif": {"schema": {"type": "string"}}}}},
+)
+def export_members_ldif(
+    group_id: Optional[int] = _GROUP_FILTER,
+    institution_id: Optional[int] = _INSTITUTION_FILTER,
+    _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Member, Institution, GroupMember)),
+):
+    return StreamingResponse(
+        iter_members_ldif(group_id=group_id, institution_id=institution_id),
+        media_type="text/x-ldif",
+        headers={"Content-Disposition": 'attachment; filename="members.ldif"', "ETag": etag},
+    )
+
+
+def _require_snapshots() -> None:
+    if not snapshots_available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Parquet snapshots require the pyarrow package",
+        )
+
+
+def _building() -> JSONResponse:
+    return JSONResponse(
+        {"detail": "Snapshot is being built"},
+        status_code=status.HTTP_202_ACCEPTED,
+        headers={"Retry-After": "10"},
+    )
+
+
+@router.get(
+    "/snapshots",
+    response_model=List[SnapshotStatus],
+    summary="List the Parquet snapshots",
+    description="Lists the columnar snapshots of members, institutions, group memberships, board memberships and talk assignments, and whether each is up to date. Snapshots that are out of date are rebuilt in the background.",
+)
+def list_snapshots(
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    _require_snapshots()
+    snapshots = []
+    for name in SNAPSHOT_NAMES:
+        version, path = current_snapshot(db, name)
+        snapshots.append(
+            SnapshotStatus(
+                name=name,
+                version=version,
+                ready=path is not None,
+                size_bytes=os.path.getsize(path) if path else None,
+            )
+        )
+    if not all(snapshot.ready for snapshot in snapshots):
+        request_build(db)
+        db.commit()
+    return snapshots
+
+
+@router.get(
+    "/snapshots/{name}",
+    summary="Download a Parquet snapshot",
+    description="Downloads the current version of a snapshot as a Parquet file. If it is still being built, responds 202 with Retry-After.",
+    responses={
+        200: {"content": {"application/vnd.apache.parquet": {"schema": {"type": "string", "format": "binary"}}}},
+        202: {"description": "The snapshot is being built."},
+    },
+)
+def download_snapshot(
+    name: str,
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    """
+    A snapshot is only rebuilt after one of the tables it is read from
+    changed; its version doubles as the ETag.
+    """
+    if name not in SNAPSHOT_NAMES:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Snapshot not found")
+    _require_snapshots()
+    version, path = current_snapshot(db, name)
+    if path is None:
+        request_build(db)
+        db.commit()
+        return _building()
+    return FileResponse(
+        path,
+        media_type="application/vnd.apache.parquet",
+        filename=f"{name}.parquet",
+        headers={"ETag": f'"{version}"'},
+    )
+
+
+@router.get(
+    "/directory.sqlite",
+    summary="Download the active directory as SQLite",
+    description="Downloads a read-only SQLite database of the active institutions, members, groups, roles, group memberships and board memberships, for offline use. Supports If-None-Match; responds 202 with Retry-After while a new version is being built.",
+    responses={
+        200: {"content": {"application/vnd.sqlite3": {"schema": {"type": "string", "format": "binary"}}}},
+        202: {"description": "The snapshot is being built."},
+    },
+)
+def download_directory(
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+    etag: str = Depends(
+        TableETag(Institution, Member, Group, Role, GroupMember, InstitutionalBoardMember)
+    ),
+):
+    """
+    The file is rebuilt in the background after any of its tables changed,
+    reloading only the tables that did.
+    """
+    _, _, path = current_directory(db)
+    if path is None:
+        request_build(db, DIRECTORY_JOB)
+        db.commit()
+        return _building()
+    return FileResponse(
+        path,
+        media_type="application/vnd.sqlite3",
+        filename="phonebook.sqlite",
+        headers={"ETag": etag},
+    )
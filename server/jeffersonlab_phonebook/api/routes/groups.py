@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from jeffersonlab_phonebook.repositories.group_repository import GroupRepository, GroupMemberRepository
@@ -12,12 +12,20 @@ from jeffersonlab_phonebook.schemas.group_schemas import (
 )
 from jeffersonlab_phonebook.schemas.response_schemas import GroupResponse, GroupMemberResponse, GroupLiteResponse
 from jeffersonlab_phonebook.db.constants import GroupRole
+from jeffersonlab_phonebook.db.models import Group, GroupMember, Institution, Member, Role
 from jeffersonlab_phonebook.db.session import get_db
-from ..deps import get_current_user
+from jeffersonlab_phonebook.services.notifications import GROUP_ADDED, notify
+from jeffersonlab_phonebook.services.response_cache import cached_json_response
+from ..deps import FieldSelection, TableETag, get_current_user
+from ..serialization import OrmJSON, sparse_list
 
 
 router = APIRouter(prefix="/groups", tags=["Working Groups"])
 
+_group = OrmJSON(GroupResponse)
+_group_member = OrmJSON(GroupMemberResponse)
+_group_member_list = OrmJSON(List[GroupMemberResponse])
+
 
 # --- Group Routes ---
 
@@ -28,17 +36,24 @@ router = APIRouter(prefix="/groups", tags=["Working Groups"])
     description="Retrieves a list of all working groups in the collaboration without nested relationships.",
 )
 def list_groups(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Group)),
+    fields: Optional[frozenset[str]] = Depends(FieldSelection(GroupLiteResponse)),
 ):
     """
     Retrieves a list of all working groups from the database.
+    The serialized list is cached until the groups table is written to.
     """
-    group_repo = GroupRepository(db)
-    groups = group_repo.get_all(skip=skip, limit=limit)
-    return [GroupLiteResponse.model_validate(group) for group in groups]
+    def render() -> bytes:
+        group_repo = GroupRepository(db)
+        groups = group_repo.get_all_lite(skip=skip, limit=limit, fields=fields)
+        return sparse_list(GroupLiteResponse, fields).dump(groups)
+
+    return cached_json_response(request, db, {Group.__tablename__}, render, etag=etag)
 
 
 @router.post(
@@ -65,8 +80,8 @@ def create_group(
         )
     # The repository now returns an ORM object
     db_group = group_repo.create(group_in)
-    # The router is responsible for converting it to a Pydantic schema
-    return GroupResponse.model_validate(db_group)
+    # The router is responsible for serializing it
+    return _group.response(db_group, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -79,6 +94,7 @@ def get_group(
     group_id: int,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Group, GroupMember, Member, Institution, Role)),
 ):
     """
     Retrieves a single working group from the database by its ID.
@@ -87,7 +103,7 @@ def get_group(
     group = group_repo.get(group_id)
     if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Working group not found")
-    return GroupResponse.model_validate(group)
+    return _group.response(group, etag=etag)
 
 
 @router.put(
@@ -113,8 +129,8 @@ def update_group(
         )
     # The repository now returns the updated ORM object
     updated_group = group_repo.update(db_group, group_in)
-    # The router is responsible for converting it
-    return GroupResponse.model_validate(updated_group)
+    # The router is responsible for serializing it
+    return _group.response(updated_group)
 
 
 @router.delete(
@@ -155,6 +171,7 @@ def list_group_members_of_group(
     limit: int = 100,
     role_name: Optional[GroupRole] = None,
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Group, GroupMember, Member, Institution, Role)),
 ):
     """
     Retrieves members of a specific working group.
@@ -162,8 +179,8 @@ def list_group_members_of_group(
     gm_repo = GroupMemberRepository(db)
     role_str = role_name.value if role_name else None
     group_members = gm_repo.get_all(group_id=group_id, skip=skip, limit=limit, role_name=role_str)
-    # The router is responsible for the conversion
-    return [GroupMemberResponse.model_validate(gm) for gm in group_members]
+    # The router is responsible for the serialization
+    return _group_member_list.response(group_members, etag=etag)
 
 
 @router.post(
@@ -201,10 +218,16 @@ def add_member_to_group(
             detail="Member is already part of this group",
         )
 
+    notify(
+        db,
+        gm_in.member_id,
+        GROUP_ADDED,
+        {"group_id": group_id, "role_id": gm_in.role_id},
+    )
     # The repository now returns an ORM object
     db_gm = gm_repo.create(gm_in)
-    # The router is responsible for converting it
-    return GroupMemberResponse.model_validate(db_gm)
+    # The router is responsible for serializing it
+    return _group_member.response(db_gm, status_code=status.HTTP_201_CREATED)
 
 
 @router.delete(
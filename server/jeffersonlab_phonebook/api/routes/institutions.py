@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
 from jeffersonlab_phonebook.repositories.institution_repository import (
@@ -9,23 +9,49 @@ from jeffersonlab_phonebook.repositories.institution_repository import (
 from jeffersonlab_phonebook.repositories.member_repository import (
     MemberRepository,
 )
+from jeffersonlab_phonebook.repositories.ror_repository import RorOrganizationRepository
 from jeffersonlab_phonebook.schemas.institutions_schemas import (
     InstitutionCreate,
     InstitutionUpdate,
 )
-from jeffersonlab_phonebook.schemas.response_schemas import InstitutionLiteResponse, MemberLiteResponse
-from jeffersonlab_phonebook.services.ror_api_client import (
-    call_ror_api,
-    RorApiClientError,
-    RorApiNetworkError,
-    RorApiDataError
+from jeffersonlab_phonebook.schemas.response_schemas import InstitutionLiteResponse, InstitutionResponse, MemberLiteResponse
+from jeffersonlab_phonebook.schemas.job_schemas import JobResponse
+from jeffersonlab_phonebook.schemas.ror_schemas import RorSuggestion
+from jeffersonlab_phonebook.schemas.geo_schemas import (
+    GeoPoint,
+    InstitutionFeature,
+    InstitutionFeatureCollection,
+    InstitutionFeatureProperties,
+)
+from jeffersonlab_phonebook.services.geo_clusters import (
+    GeoCluster,
+    institution_clusters,
+)
+from jeffersonlab_phonebook.services.ror_dump import normalize_name
+from jeffersonlab_phonebook.services.jobs import enqueue
+from jeffersonlab_phonebook.services.ror_api_client import lookup_local_ror
+from jeffersonlab_phonebook.services.ror_refresh import (
+    ROR_ENRICH_JOB,
+    ROR_REFRESH_JOB,
+)
+from jeffersonlab_phonebook.db.models import (
+    Institution,
+    InstitutionalBoardMember,
+    Member,
+    MemberInstitutionHistory,
+    Role,
 )
 from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.services.response_cache import cached_json_response
 
-from ..deps import get_current_user
+from ..deps import FieldSelection, TableETag, get_current_user
+from ..serialization import OrmJSON, sparse_list
 
 router = APIRouter(prefix="/institutions", tags=["institutions"])
 
+_institution = OrmJSON(InstitutionLiteResponse)
+_institution_full = OrmJSON(InstitutionResponse)
+
 
 @router.get(
     "/",
@@ -34,19 +60,147 @@ router = APIRouter(prefix="/institutions", tags=["institutions"])
     description="Retrieves a list of all institutions in the collaboration.",
 )
 def list_institutions(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
     # Assign to '_' to signal that the value itself is not used, only its side-effect.
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Institution)),
+    fields: Optional[frozenset[str]] = Depends(FieldSelection(InstitutionLiteResponse)),
 ):
     """
     Retrieves a list of all institutions from the database.
     The user must be authenticated and their account must be active.
+    The serialized list is cached until the institutions table is written to.
     """
-    institution_repo = InstitutionRepository(db)
-    institutions = institution_repo.get_all(skip=skip, limit=limit)
-    return institutions
+    def render() -> bytes:
+        institution_repo = InstitutionRepository(db)
+        institutions = institution_repo.get_all_lite(skip=skip, limit=limit, fields=fields)
+        return sparse_list(InstitutionLiteResponse, fields).dump(institutions)
+
+    return cached_json_response(request, db, {Institution.__tablename__}, render, etag=etag)
+
+
+def parse_bbox(
+    bbox: Optional[str] = Query(
+        None,
+        description="Bounding box as 'min_lon,min_lat,max_lon,max_lat'. min_lon > max_lon crosses the antimeridian.",
+    ),
+) -> Optional[tuple[float, float, float, float]]:
+    """
+    Parses and validates the `bbox` query parameter.
+    """
+    if bbox is None:
+        return None
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(","))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox must be four comma-separated numbers: min_lon,min_lat,max_lon,max_lat",
+        ) from e
+    if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180) or not (
+        -90 <= min_lat <= max_lat <= 90
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox coordinates are out of range",
+        )
+    return (min_lon, min_lat, max_lon, max_lat)
+
+
+def _to_feature(cluster: GeoCluster) -> InstitutionFeature:
+    return InstitutionFeature(
+        geometry=GeoPoint(coordinates=(cluster.longitude, cluster.latitude)),
+        properties=InstitutionFeatureProperties(
+            id=cluster.id, name=cluster.name, count=cluster.count
+        ),
+    )
+
+
+@router.get(
+    "/geo",
+    response_model=InstitutionFeatureCollection,
+    response_model_exclude_none=True,
+    summary="Institution locations as GeoJSON",
+    description="Returns active institutions with coordinates as a GeoJSON FeatureCollection, optionally limited to a bounding box and clustered for a map zoom level.",
+)
+def get_institutions_geo(
+    zoom: Optional[int] = Query(None, ge=0, le=24),
+    bbox: Optional[tuple[float, float, float, float]] = Depends(parse_bbox),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+    _etag=Depends(TableETag(Institution)),
+):
+    """
+    Without `zoom`, every institution in the box is returned as its own point.
+    With `zoom`, nearby institutions are merged into clusters that carry a
+    `count`; clusters are precomputed for all zoom levels after institutions
+    change.
+    """
+    if zoom is None:
+        institution_repo = InstitutionRepository(db)
+        clusters = [
+            GeoCluster(
+                longitude=row.longitude,
+                latitude=row.latitude,
+                count=1,
+                id=row.id,
+                name=row.short_name,
+            )
+            for row in institution_repo.get_geo_points(bbox)
+        ]
+    else:
+        clusters = institution_clusters.get(db, zoom, bbox)
+    return InstitutionFeatureCollection(features=[_to_feature(c) for c in clusters])
+
+
+@router.get(
+    "/ror-suggestions",
+    response_model=List[RorSuggestion],
+    summary="Suggest ROR IDs for a name (Admin)",
+    description="Searches the imported ROR dump for active organizations whose name, acronym or alias has a word starting with `q`.",
+)
+def suggest_ror_ids(
+    q: str = Query(..., min_length=2),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    """
+    Helps admins pick the ROR ID when creating an institution. Only the
+    local ROR tables are searched; they are filled by the
+    `import_ror_dump` command.
+    """
+    search_key = normalize_name(q)
+    if not search_key:
+        return []
+    rows = RorOrganizationRepository(db).suggest(search_key, limit)
+    return [RorSuggestion.model_validate(row, from_attributes=True) for row in rows]
+
+
+@router.post(
+    "/ror-refresh",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Refresh institutions from ROR (Admin only)",
+    description="Queues a background job that re-reads the ROR record of every institution with a ROR ID and updates names and locations that changed, in one bulk update. Poll /utils/jobs/{job_id} for its report.",
+)
+def refresh_from_ror(
+    dry_run: bool = Query(False, description="Report the changes without applying them."),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    """
+    Records come from the imported ROR dump when possible, otherwise from the
+    ROR API under a rate limit, which can take minutes, so the refresh runs
+    as a job. Its result is a RorRefreshReport: institutions whose record
+    could not be fetched are listed in `failed` and left unchanged.
+    """
+    job = enqueue(db, ROR_REFRESH_JOB, {"dry_run": dry_run})
+    db.commit()
+    return JobResponse.model_validate(job)
 
 
 @router.post(
@@ -82,6 +236,7 @@ def get_institution(
     institution_id: int,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Institution)),
 ):
     """
     Retrieves a single institution from the database by its ID.
@@ -94,7 +249,40 @@ def get_institution(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Institution not found"
         )
-    return institution
+    return _institution.response(institution, etag=etag)
+
+
+@router.get(
+    "/{institution_id}/full",
+    response_model=InstitutionResponse,
+    summary="Get institution with members, board and history",
+    description="Retrieves an institution with its members, board memberships and membership history. Each collection is capped by its own limit; the *_total fields give the full sizes.",
+)
+def get_institution_full(
+    institution_id: int,
+    members_limit: int = Query(100, ge=0, le=1000),
+    board_limit: int = Query(100, ge=0, le=1000),
+    history_limit: int = Query(100, ge=0, le=1000),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Institution, Member, InstitutionalBoardMember, MemberInstitutionHistory, Role)),
+):
+    """
+    Retrieves the complete view of an institution in five queries.
+    Raises a 404 error if the institution is not found.
+    """
+    institution_repo = InstitutionRepository(db)
+    institution = institution_repo.get_full(
+        institution_id,
+        members_limit=members_limit,
+        board_limit=board_limit,
+        history_limit=history_limit,
+    )
+    if not institution:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Institution not found"
+        )
+    return _institution_full.response(institution, etag=etag)
 
 
 @router.put(
@@ -113,6 +301,9 @@ def update_institution(
     Updates an existing institution in the database.
     The user must be authenticated and their account must be active.
     Raises a 404 error if the institution is not found.
+    A ROR ID found in the imported ROR dump fills in the institution's
+    fields right away; otherwise a background job fetches the record from
+    the ROR API after the update is saved.
     """
     institution_repo = InstitutionRepository(db)
     db_institution = institution_repo.get(institution_id)
@@ -125,26 +316,16 @@ def update_institution(
     update_data = institution_in.model_dump(exclude_unset=True)
     if "rorid" in update_data and update_data["rorid"] is not None:
         new_rorid = update_data["rorid"]
-        try:
-            ror_data_from_api = call_ror_api(new_rorid)
-            filtered_ror_data = {k: v for k, v in ror_data_from_api.items() if v is not None}
-
-            update_data.update(filtered_ror_data)
-        except RorApiNetworkError as e:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Failed to connect to ROR API: {e}"
-            ) from e
-        except RorApiDataError as e:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"ROR API returned invalid data: {e}"
-            ) from e
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"An unexpected error occurred during ROR API processing: {e}"
-            ) from e
+        ror_data = lookup_local_ror(db, new_rorid)
+        if ror_data is not None:
+            update_data.update({k: v for k, v in ror_data.items() if v is not None})
+        else:
+            # Committed together with the update below.
+            enqueue(
+                db,
+                ROR_ENRICH_JOB,
+                {"institution_id": institution_id, "rorid": new_rorid},
+            )
     if "full_name" not in update_data:
         # If so, get the full_name from the existing database record and add it to update_data.
         # We check `db_institution.full_name` to ensure it's not None.
@@ -200,16 +381,20 @@ def get_institution_members(
     limit: int = 100,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Institution, Member)),
+    fields: Optional[frozenset[str]] = Depends(FieldSelection(MemberLiteResponse)),
 ):
     """
     Retrieves all members belonging to a given institution, with optional pagination.
     Raises a 404 error if the institution does not exist.
     """
-    institution_repo = InstitutionRepository(db)
-    if not institution_repo.get(institution_id):
+    member_repo = MemberRepository(db)
+    members = member_repo.get_all_lite(
+        skip=skip, limit=limit, fields=fields, institution_id=institution_id
+    )
+    # Only an empty page needs telling apart from a missing institution.
+    if not members and not InstitutionRepository(db).exists(institution_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Institution not found"
         )
-
-    member_repo = MemberRepository(db)
-    return member_repo.get_member_by_institution(institution_id, skip, limit)
+    return sparse_list(MemberLiteResponse, fields).response(members, etag=etag)
@@ -1,21 +1,61 @@
-from typing import List
+import json
+from functools import lru_cache
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import create_model
 from sqlalchemy.orm import Session  # For type hinting db session
 
+from jeffersonlab_phonebook.config.settings import settings
 from jeffersonlab_phonebook.repositories.member_repository import MemberRepository
 from jeffersonlab_phonebook.schemas.members_schemas import (
     MemberCreate,
     MemberUpdate,
 )
-from jeffersonlab_phonebook.schemas.response_schemas import PaginatedMemberResponse, MemberLiteResponse
+from jeffersonlab_phonebook.schemas.member_import_schemas import (
+    MemberImportConflict,
+    MemberImportResult,
+    MemberImportRow,
+)
+from jeffersonlab_phonebook.schemas.response_schemas import PaginatedMemberResponse, MemberLiteResponse, MemberResponse
+from jeffersonlab_phonebook.db.models import (
+    Group,
+    GroupMember,
+    Institution,
+    InstitutionalBoardMember,
+    Member,
+    MemberInstitutionHistory,
+    Role,
+    TalkAssignment,
+)
 from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.services.member_import import import_members, parse_members_csv
 
 # Your security dependency that provides an active Member ORM object
-from ..deps import get_current_user
+from ..deps import FieldSelection, TableETag, get_current_user
+from ..serialization import OrmJSON, partial_model
 
 router = APIRouter(prefix="/members", tags=["members"])
 
+_member = OrmJSON(MemberLiteResponse)
+_member_profile = OrmJSON(MemberResponse)
+
+
+@lru_cache(maxsize=256)
+def _member_page(fields: Optional[frozenset[str]]) -> OrmJSON:
+    """Serializer for a page of members narrowed to the selected fields."""
+    if fields is None:
+        return OrmJSON(PaginatedMemberResponse)
+    items = partial_model(MemberLiteResponse, fields)
+    return OrmJSON(
+        create_model(
+            "PaginatedMemberFieldsResponse",
+            __base__=PaginatedMemberResponse,
+            items=(List[items], ...),  # type: ignore[valid-type]
+        )
+    )
+
 
 @router.get(
     "/",
@@ -28,23 +68,30 @@ def list_members(
     skip: int = 0,
     limit: int = 100,
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Member, Institution)),
+    fields: Optional[frozenset[str]] = Depends(FieldSelection(MemberLiteResponse)),
 ):
     """
     Retrieves a paginated list of all members from the database.
+    With `fields`, only those fields of each member are queried and returned;
+    the institution is joined only when `institution` is among them.
     """
     member_repo = MemberRepository(db)
     
     total_members = member_repo.count_all()
     
-    members = member_repo.get_all(skip=skip, limit=limit)
+    members = member_repo.get_all_lite(skip=skip, limit=limit, fields=fields)
     
     # 3. Return the comprehensive paginated response
-    return {
-        "items": members,
-        "total": total_members,
-        "skip": skip,
-        "limit": limit
-    }
+    return _member_page(fields).response(
+        {
+            "items": members,
+            "total": total_members,
+            "skip": skip,
+            "limit": limit
+        },
+        etag=etag,
+    )
 """
 @router.get(
     "/search",
@@ -98,6 +145,69 @@ def create_member(
     return db_member
 
 
+def _import_and_commit(
+    db: Session, records: List[Any], on_conflict: MemberImportConflict
+) -> MemberImportResult:
+    result = import_members(db, records, on_conflict)
+    db.commit()
+    return result
+
+
+@router.post(
+    "/bulk",
+    response_model=MemberImportResult,
+    summary="Import members in bulk (Admin only)",
+    description="Creates many members at once from a JSON array or a CSV file with a header line. The institution of each row is given by `institution_id`, by name (`institution`) or by ROR ID (`institution_ror`). Rows are validated independently and the outcome of every row is reported; members whose email already exists are skipped, or updated with `on_conflict=update`.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": MemberImportRow.model_json_schema()}
+                },
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_members_bulk(
+    request: Request,
+    on_conflict: MemberImportConflict = MemberImportConflict.SKIP,
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    """
+    Validates all rows, resolves their institutions in bulk and writes the
+    valid ones with multi-row upserts, in one transaction.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    body = await request.body()
+    try:
+        if content_type == "text/csv":
+            records: Any = parse_members_csv(body.decode("utf-8-sig"))
+        elif content_type in ("application/json", ""):
+            records = json.loads(body)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Send members as application/json or text/csv",
+            )
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not parse the body: {e}"
+        ) from e
+    if not isinstance(records, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Expected a JSON array of members"
+        )
+    if len(records) > settings.MEMBER_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.MEMBER_IMPORT_MAX_ROWS} members can be imported at once",
+        )
+    return await run_in_threadpool(_import_and_commit, db, records, on_conflict)
+
+
 @router.get(
     "/{member_id}",
     response_model=MemberLiteResponse,
@@ -108,6 +218,7 @@ def get_member(
     member_id: int,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Member, Institution)),
 ):
     """
     Retrieves a single member from the database by their ID.
@@ -118,7 +229,33 @@ def get_member(
     member = member_repo.get(member_id)
     if not member:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
-    return member
+    return _member.response(member, etag=etag)
+
+
+@router.get(
+    "/{member_id}/profile",
+    response_model=MemberResponse,
+    summary="Get a member's full profile",
+    description="Retrieves a member with their institution, group memberships, board memberships and talk assignments.",
+)
+def get_member_profile(
+    member_id: int,
+    institution_limit: int = Query(20, ge=0, le=1000),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Member, Institution, MemberInstitutionHistory, GroupMember, Group, InstitutionalBoardMember, TalkAssignment, Role)),
+):
+    """
+    Retrieves the full profile of a member in a fixed number of queries.
+    The institution's members, board and membership history are capped at
+    `institution_limit` rows each; /institutions/{id}/full pages through them.
+    Raises a 404 Not Found error if the member does not exist.
+    """
+    member_repo = MemberRepository(db)
+    member = member_repo.get_profile(member_id, institution_limit=institution_limit)
+    if not member:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
+    return _member_profile.response(member, etag=etag)
 
 
 @router.patch(
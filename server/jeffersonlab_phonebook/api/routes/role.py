@@ -1,15 +1,22 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from jeffersonlab_phonebook.db.models import Role
 from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
 from jeffersonlab_phonebook.repositories.role_repository import RoleRepository
 from jeffersonlab_phonebook.schemas.role_schemas import RoleCreate, RoleUpdate, RoleResponse
-from ..deps import get_current_user
+from jeffersonlab_phonebook.services.response_cache import cached_json_response
+from ..deps import TableETag, get_current_user
+from ..serialization import OrmJSON
 
 router = APIRouter(prefix="/roles", tags=["Roles"])
 
+_role = OrmJSON(RoleResponse)
+_role_list = OrmJSON(List[RoleResponse])
+
 
 @router.get(
     "/",
@@ -18,18 +25,23 @@ router = APIRouter(prefix="/roles", tags=["Roles"])
     description="Retrieves a list of all dynamic roles.",
 )
 def list_roles(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Role)),
 ):
     """
     Retrieves a list of all roles from the database.
+    The serialized list is cached until the roles table is written to.
     """
-    role_repo = RoleRepository(db)
-    roles = role_repo.get_all(skip=skip, limit=limit)
-    # Convert ORM objects to Pydantic models for the response
-    return [RoleResponse.model_validate(role) for role in roles]
+    def render() -> bytes:
+        # Picks up roles written by other workers since the registry loaded.
+        role_registry.sync(db, request.state.table_versions[Role.__tablename__])
+        return _role_list.dump(role_registry.all()[skip : skip + limit])
+
+    return cached_json_response(request, db, {Role.__tablename__}, render, etag=etag)
 
 
 @router.post(
@@ -48,15 +60,14 @@ def create_role(
     Creates a new role in the database.
     """
     role_repo = RoleRepository(db)
-    existing_role = role_repo.get_by_name(role_in.name)
+    existing_role = role_registry.get_by_name(role_in.name)
     if existing_role:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Role with name '{role_in.name}' already exists",
         )
     db_role = role_repo.create(role_in)
-    # Convert ORM object to Pydantic model for the response
-    return RoleResponse.model_validate(db_role)
+    return _role.response(db_role, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -67,18 +78,16 @@ def create_role(
 )
 def get_role(
     role_id: int,
-    db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Role)),
 ):
     """
     Retrieves a single role from the database by its ID.
     """
-    role_repo = RoleRepository(db)
-    role = role_repo.get(role_id)
+    role = role_registry.get(role_id)
     if not role:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Role not found")
-    # Convert ORM object to Pydantic model for the response
-    return RoleResponse.model_validate(role)
+    return _role.response(role, etag=etag)
 
 
 @router.put(
@@ -103,8 +112,7 @@ def update_role(
             status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
         )
     updated_role = role_repo.update(db_role, role_in)
-    # Convert ORM object to Pydantic model for the response
-    return RoleResponse.model_validate(updated_role)
+    return _role.response(updated_role)
 
 
 @router.delete(
@@ -0,0 +1,87 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.repositories.stats_repository import (
+    SUMMARY_TABLES,
+    StatsRepository,
+)
+from jeffersonlab_phonebook.schemas.stats_schemas import (
+    InstitutionTalkCount,
+    MemberTalkCount,
+    StatsSummaryResponse,
+    TalkAllocationResponse,
+    TalkPeriod,
+)
+from jeffersonlab_phonebook.services.cache import stats_cache
+
+from ..deps import get_current_user
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get(
+    "/summary",
+    response_model=StatsSummaryResponse,
+    summary="Dashboard summary counters",
+    description="Counts of active members, institutions and groups, upcoming conferences and unassigned talks, computed in one query.",
+)
+def get_summary(
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    """
+    Returns the dashboard counters. The result is cached until one of the
+    underlying tables is written to, by any worker; the key includes today's
+    date so that "upcoming" rolls over at midnight.
+    """
+    today = date.today()
+    stats_repo = StatsRepository(db)
+    return stats_cache.get_or_load(
+        db,
+        f"summary:{today.isoformat()}",
+        SUMMARY_TABLES,
+        lambda: stats_repo.get_summary(today),
+    )
+
+
+@router.get(
+    "/talks",
+    response_model=TalkAllocationResponse,
+    summary="Talk allocation statistics",
+    description="Talk assignment counts per member and per institution, by role and period, optionally restricted to a date window.",
+)
+def get_talk_allocation(
+    period: TalkPeriod = TalkPeriod.YEAR,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+):
+    """
+    Returns per-member counts from a single grouped query; the per-institution
+    counts are rolled up from those rows.
+    """
+    stats_repo = StatsRepository(db)
+    rows = stats_repo.get_talk_allocation(
+        period=period, date_from=date_from, date_to=date_to
+    )
+
+    members = [MemberTalkCount.model_validate(row._mapping) for row in rows]
+    institutions: dict[tuple[int, str, date], InstitutionTalkCount] = {}
+    for row in members:
+        key = (row.institution_id, row.role, row.period)
+        if key in institutions:
+            institutions[key].talks += row.talks
+        else:
+            institutions[key] = InstitutionTalkCount(
+                institution_id=row.institution_id,
+                institution_name=row.institution_name,
+                role=row.role,
+                period=row.period,
+                talks=row.talks,
+            )
+    return TalkAllocationResponse(members=members, institutions=list(institutions.values()))
@@ -9,9 +9,14 @@ from jeffersonlab_phonebook.schemas.conference_schemas import (
 from jeffersonlab_phonebook.schemas.response_schemas import TalkAssignmentResponse
 from jeffersonlab_phonebook.db.session import get_db
 from jeffersonlab_phonebook.repositories.talk_assignment_repository import TalkAssignmentRepository
+from jeffersonlab_phonebook.services.notifications import TALK_ASSIGNED, notify
+from ..serialization import OrmJSON
 
 router = APIRouter(prefix="/talk-assignments", tags=["Talk Assignments"])
 
+_assignment = OrmJSON(TalkAssignmentResponse)
+_assignment_list = OrmJSON(List[TalkAssignmentResponse])
+
 
 @router.post("/", response_model=TalkAssignmentResponse, status_code=status.HTTP_201_CREATED)
 def create_talk_assignment(
@@ -19,6 +24,12 @@ def create_talk_assignment(
     db: Session = Depends(get_db)
 ):
     repository = TalkAssignmentRepository(db)
+    notify(
+        db,
+        talk_assignment.member_id,
+        TALK_ASSIGNED,
+        {"talk_id": talk_assignment.talk_id, "role_id": talk_assignment.role_id},
+    )
     try:
         return repository.create(talk_assignment)
     except ValueError as e:
@@ -35,7 +46,7 @@ def list_talk_assignments(
     db: Session = Depends(get_db)
 ):
     repository = TalkAssignmentRepository(db)
-    return repository.get_all(skip=skip, limit=limit)
+    return _assignment_list.response(repository.get_all(skip=skip, limit=limit))
 
 
 @router.get("/{assignment_id}", response_model=TalkAssignmentResponse)
@@ -47,7 +58,7 @@ def get_talk_assignment(
     talk_assignment = repository.get(assignment_id)
     if not talk_assignment:
         raise HTTPException(status_code=404, detail="Talk assignment not found")
-    return talk_assignment
+    return _assignment.response(talk_assignment)
 
 
 @router.put("/{assignment_id}", response_model=TalkAssignmentResponse)
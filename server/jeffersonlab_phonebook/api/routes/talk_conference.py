@@ -1,16 +1,21 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
 
 from jeffersonlab_phonebook.repositories.conference_repository import TalkRepository, ConferenceRepository
 from jeffersonlab_phonebook.schemas.conference_schemas import ConferenceCreate, ConferenceUpdate, TalkCreate, TalkUpdate
 from jeffersonlab_phonebook.schemas.response_schemas import TalkResponse, TalkLiteResponse, ConferenceResponse, ConferenceLiteResponse
+from jeffersonlab_phonebook.db.models import Conference, Institution, Member, Role, Talk, TalkAssignment
 from jeffersonlab_phonebook.db.session import get_db
-from ..deps import get_current_user
+from jeffersonlab_phonebook.services.response_cache import cached_json_response
+from ..deps import FieldSelection, TableETag, get_current_user
+from ..serialization import OrmJSON, sparse_list
 
 router = APIRouter(prefix="/talks", tags=["Talks"])
 
+_talk = OrmJSON(TalkResponse)
+
 # --- Talk Routes ---
 
 @router.get(
@@ -24,10 +29,12 @@ def list_talks(
     skip: int = 0,
     limit: int = 100,
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Talk)),
+    fields: Optional[frozenset[str]] = Depends(FieldSelection(TalkLiteResponse)),
 ):
     talk_repo = TalkRepository(db)
-    talks = talk_repo.get_all(skip=skip, limit=limit)
-    return [TalkLiteResponse.model_validate(talk) for talk in talks]
+    talks = talk_repo.get_all_lite(skip=skip, limit=limit, fields=fields)
+    return sparse_list(TalkLiteResponse, fields).response(talks, etag=etag)
 
 
 @router.post(
@@ -44,7 +51,7 @@ def create_talk(
 ):
     talk_repo = TalkRepository(db)
     db_talk = talk_repo.create(talk_in)
-    return TalkResponse.model_validate(db_talk)
+    return _talk.response(db_talk, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -57,12 +64,13 @@ def get_talk(
     talk_id: int,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Talk, TalkAssignment, Member, Institution, Role)),
 ):
     talk_repo = TalkRepository(db)
     talk = talk_repo.get(talk_id)
     if not talk:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Talk not found")
-    return TalkResponse.model_validate(talk)
+    return _talk.response(talk, etag=etag)
 
 
 @router.put(
@@ -82,7 +90,7 @@ def update_talk(
     if not db_talk:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Talk not found")
     updated_talk = talk_repo.update(db_talk, talk_in)
-    return TalkResponse.model_validate(updated_talk)
+    return _talk.response(updated_talk)
 
 
 @router.delete(
@@ -107,6 +115,8 @@ def delete_talk(
 
 conference_router = APIRouter(prefix="/conferences", tags=["Conferences"])
 
+_conference = OrmJSON(ConferenceResponse)
+
 @conference_router.get(
     "/",
     response_model=List[ConferenceLiteResponse],
@@ -114,14 +124,20 @@ conference_router = APIRouter(prefix="/conferences", tags=["Conferences"])
     description="Retrieve a list of all conferences without nested talks.",
 )
 def list_conferences(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Conference)),
+    fields: Optional[frozenset[str]] = Depends(FieldSelection(ConferenceLiteResponse)),
 ):
-    conference_repo = ConferenceRepository(db)
-    conferences = conference_repo.get_all(skip=skip, limit=limit)
-    return [ConferenceLiteResponse.model_validate(c) for c in conferences]
+    def render() -> bytes:
+        conference_repo = ConferenceRepository(db)
+        conferences = conference_repo.get_all_lite(skip=skip, limit=limit, fields=fields)
+        return sparse_list(ConferenceLiteResponse, fields).dump(conferences)
+
+    return cached_json_response(request, db, {Conference.__tablename__}, render, etag=etag)
 
 
 @conference_router.post(
@@ -138,7 +154,7 @@ def create_conference(
 ):
     conference_repo = ConferenceRepository(db)
     db_conference = conference_repo.create(conference_in)
-    return ConferenceResponse.model_validate(db_conference)
+    return _conference.response(db_conference, status_code=status.HTTP_201_CREATED)
 
 
 @conference_router.get(
@@ -152,12 +168,13 @@ def get_conference(
     include_talks: bool = Query(False),
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
+    etag: str = Depends(TableETag(Conference, Talk, TalkAssignment, Member, Institution, Role)),
 ):
     conference_repo = ConferenceRepository(db)
     conference = conference_repo.get(conference_id, include_talks=include_talks)
     if not conference:
         raise HTTPException(status_code=404, detail="Conference not found")
-    return ConferenceResponse.model_validate(conference)
+    return _conference.response(conference, etag=etag)
 
 
 @conference_router.put(
@@ -177,7 +194,7 @@ def update_conference(
     if not db_conference:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conference not found")
     updated_conference = conference_repo.update(db_conference, conference_in)
-    return ConferenceResponse.model_validate(updated_conference)
+    return _conference.response(updated_conference)
 
 
 @conference_router.delete(
@@ -1,3 +1,58 @@
-from fastapi import APIRouter
+from typing import Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.session import get_db
+from jeffersonlab_phonebook.repositories.job_repository import JobRepository
+from jeffersonlab_phonebook.schemas.cache_schemas import CacheStatsResponse
+from jeffersonlab_phonebook.schemas.job_schemas import JobCountResponse, JobResponse
+from jeffersonlab_phonebook.services.response_cache import response_cache
+
+from ..deps import get_current_user
 
 router = APIRouter(prefix="/utils", tags=["utils"])
+
+
+@router.get(
+    "/cache-stats",
+    response_model=Dict[str, CacheStatsResponse],
+    summary="Response cache hit ratios",
+    description="Hits, misses and hit ratio of the response cache, per cached route.",
+)
+def get_cache_stats(_=Depends(get_current_user)):
+    return {
+        route: CacheStatsResponse(
+            hits=stats.hits, misses=stats.misses, hit_ratio=stats.hit_ratio
+        )
+        for route, stats in response_cache.stats().items()
+    }
+
+
+@router.get(
+    "/jobs",
+    response_model=List[JobCountResponse],
+    summary="Background job counts",
+    description="Number of background jobs per kind and status.",
+)
+def get_job_counts(db: Session = Depends(get_db), _=Depends(get_current_user)):
+    return [
+        JobCountResponse(kind=kind, status=status, count=count)
+        for (kind, status), count in sorted(
+            JobRepository(db).count_by_status().items(),
+            key=lambda item: (item[0][0], item[0][1].value),
+        )
+    ]
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    summary="Get a background job",
+    description="Status of one background job, and its result once it is done.",
+)
+def get_job(job_id: int, db: Session = Depends(get_db), _=Depends(get_current_user)):
+    job = JobRepository(db).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return JobResponse.model_validate(job)
@@ -0,0 +1,72 @@
+"""
+Serializes ORM objects to JSON in a single pass.
+
+Returning ORM objects (or models validated from them) from a route makes
+FastAPI validate the value again against the route's `response_model`, turn
+it into plain Python with `jsonable_encoder` and only then encode it. Routes
+that return `OrmJSON(...).response(...)` instead validate once with a
+prebuilt TypeAdapter and let pydantic-core write the bytes directly. FastAPI
+passes a returned Response through untouched, so the `response_model` in
+the decorator keeps documenting the route in the OpenAPI schema.
+"""
+
+from functools import lru_cache
+from typing import Any, Generic, List, Optional, TypeVar
+
+from fastapi import Response, status
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+T = TypeVar("T")
+
+
+class OrmJSON(Generic[T]):
+    """JSON serializer for one response type, built once at import time."""
+
+    def __init__(self, type_: Any) -> None:
+        self.adapter: TypeAdapter[T] = TypeAdapter(type_)
+
+    def dump(self, value: Any) -> bytes:
+        return self.adapter.dump_json(
+            self.adapter.validate_python(value, from_attributes=True)
+        )
+
+    def response(
+        self,
+        value: Any,
+        status_code: int = status.HTTP_200_OK,
+        etag: Optional[str] = None,
+    ) -> Response:
+        """
+        The serialized value as a JSON response. Headers set on the injected
+        Response (e.g. by TableETag) are not copied to a returned one, so the
+        ETag is passed explicitly.
+        """
+        headers = {"ETag": etag} if etag else None
+        return Response(
+            content=self.dump(value),
+            status_code=status_code,
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+@lru_cache(maxsize=256)
+def partial_model(schema: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """`schema` with only the given fields, in the schema's field order."""
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (info.annotation, info)
+            for name, info in schema.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+@lru_cache(maxsize=256)
+def sparse_list(schema: type[BaseModel], fields: Optional[frozenset[str]]) -> OrmJSON:
+    """OrmJSON for a list of `schema` narrowed to `fields`, or whole if None."""
+    if fields is None:
+        return OrmJSON(List[schema])  # type: ignore[valid-type]
+    return OrmJSON(List[partial_model(schema, fields)])  # type: ignore[misc]
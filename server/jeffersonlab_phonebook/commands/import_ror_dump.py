@@ -0,0 +1,36 @@
+"""
+Loads a ROR data dump into the local ROR tables.
+
+    python -m jeffersonlab_phonebook.commands.import_ror_dump v1.55-2024-10-31-ror-data.zip
+"""
+
+import argparse
+import sys
+import time
+
+from jeffersonlab_phonebook.db.session import SessionLocal
+from jeffersonlab_phonebook.services.ror_dump import import_ror_dump
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="ROR dump, zipped or extracted JSON")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    started = time.monotonic()
+
+    def progress(count: int) -> None:
+        print(f"\r{count} organizations", end="", file=sys.stderr, flush=True)
+
+    with SessionLocal() as db:
+        count = import_ror_dump(db, args.path, args.batch_size, progress)
+    print(
+        f"\rImported {count} organizations in {time.monotonic() - started:.1f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Refreshes the names and locations of every institution with a ROR ID.
+
+    python -m jeffersonlab_phonebook.commands.refresh_ror [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.db.session import SessionLocal
+from jeffersonlab_phonebook.services.ror_async_client import async_ror_api_client
+from jeffersonlab_phonebook.services.ror_refresh import refresh_institutions_from_ror
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report changes without writing them"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=settings.ROR_REFRESH_RATE_PER_SECOND,
+        help="ROR API requests started per second",
+    )
+    args = parser.parse_args(argv)
+
+    def progress(done: int, total: int) -> None:
+        print(f"\r{done}/{total} institutions resolved", end="", file=sys.stderr, flush=True)
+
+    async def run():
+        try:
+            with SessionLocal() as db:
+                return await refresh_institutions_from_ror(
+                    db, rate_per_second=args.rate, dry_run=args.dry_run, progress=progress
+                )
+        finally:
+            await async_ror_api_client.aclose()
+
+    report = asyncio.run(run())
+    print(file=sys.stderr)
+    for change in report.updated:
+        print(f"institution {change.institution_id} ({change.rorid}): {change.changes}")
+    for failure in report.failed:
+        print(
+            f"institution {failure.institution_id} ({failure.rorid}) failed: {failure.error}",
+            file=sys.stderr,
+        )
+    verb = "would update" if report.dry_run else "updated"
+    print(
+        f"{report.total} institutions: {verb} {len(report.updated)}, "
+        f"{report.unchanged} unchanged, {len(report.failed)} failed "
+        f"({report.resolved_locally} from the ROR dump, {report.fetched} from the ROR API)",
+        file=sys.stderr,
+    )
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
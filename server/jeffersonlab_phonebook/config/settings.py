@@ -1,4 +1,6 @@
+import os
 import secrets
+import tempfile
 import warnings
 from typing import Annotated, Literal, Union
 
@@ -115,6 +117,12 @@ class Settings(BaseSettings):
     def emails_enabled(self) -> bool:
         return bool(self.SMTP_HOST and self.EMAILS_FROM_EMAIL)
 
+    # Notification emails are held this long so that several events for the
+    # same member go out as one digest; each dispatch sends at most
+    # NOTIFICATION_BATCH_SIZE notifications over one SMTP connection.
+    NOTIFICATION_DIGEST_DELAY_SECONDS: int = 300
+    NOTIFICATION_BATCH_SIZE: int = 500
+
     EMAIL_TEST_USER: EmailStr = "test@example.com"
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
@@ -150,6 +158,65 @@ class Settings(BaseSettings):
 
     ROR_API_BASE_URL: str = "https://api.ror.org/v2/organizations"
     ROR_CLIENT_ID: str
+    ROR_CONNECT_TIMEOUT_SECONDS: float = 3.05
+    ROR_READ_TIMEOUT_SECONDS: float = 10.0
+    # Async client used by request handlers: retries of transient failures,
+    # requests in flight, and the circuit breaker that stops calling a ROR
+    # API that keeps failing.
+    ROR_MAX_RETRIES: int = 2
+    ROR_MAX_CONCURRENCY: int = 8
+    ROR_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    ROR_CIRCUIT_RESET_SECONDS: float = 30.0
+    # Requests per second started by the bulk ROR refresh; the public ROR
+    # API allows 2000 per 5 minutes.
+    ROR_REFRESH_RATE_PER_SECOND: float = 5.0
+    # ROR lookups are cached in memory (the most recent ROR_CACHE_MAX_ENTRIES)
+    # and in ROR_CACHE_DIR, which survives restarts. IDs the API reports as
+    # unknown are cached for a shorter time.
+    ROR_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    ROR_CACHE_NEGATIVE_TTL_SECONDS: int = 60 * 60
+    ROR_CACHE_MAX_ENTRIES: int = 4096
+    ROR_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "jeffersonlab_phonebook", "ror")
+
+    # Background jobs (services/jobs.py). JOB_WORKERS threads per process;
+    # 0 leaves queued jobs to other processes. Failed attempts are retried
+    # with exponential backoff between the base and max delays. A running
+    # job's lock is renewed every third of the lock timeout; a job whose lock
+    # expires (its worker died) is claimed again.
+    JOB_WORKERS: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 5.0
+    JOB_LOCK_TIMEOUT_SECONDS: int = 600
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 10.0
+    JOB_RETRY_MAX_SECONDS: float = 3600.0
+
+    # Parquet snapshots served by /export/snapshots (requires the `pyarrow`
+    # package, the `snapshots` extra), rebuilt in batches of
+    # SNAPSHOT_BATCH_SIZE rows.
+    SNAPSHOT_DIR: str = os.path.join(
+        tempfile.gettempdir(), "jeffersonlab_phonebook", "snapshots"
+    )
+    SNAPSHOT_BATCH_SIZE: int = 10000
+
+    # Base DN of the entries in the /export/members.ldif export.
+    LDIF_BASE_DN: str = "ou=people,dc=example,dc=org"
+
+    # Largest number of rows accepted by POST /members/bulk.
+    MEMBER_IMPORT_MAX_ROWS: int = 20000
+
+    # Responses of at least COMPRESSION_MINIMUM_SIZE bytes are compressed
+    # with gzip, or brotli if the `brotli` package (the `brotli` extra) is
+    # installed. Compressed bodies of responses with an ETag are cached up
+    # to the given size.
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # Response cache for read-mostly list routes. Set the Redis URL to share
+    # it between workers (requires the `redis` package, the `redis` extra).
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_REDIS_URL: str | None = None
 
 
 
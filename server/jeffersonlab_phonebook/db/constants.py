@@ -9,4 +9,10 @@ class BoardType(enum.Enum):
 class GroupRole(enum.Enum):
     MEMBER = "members"
     CONVENOR = "convenor"
-    CO_CONVENOR = "co-convenor"
\ No newline at end of file
+    CO_CONVENOR = "co-convenor"
+
+class JobStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
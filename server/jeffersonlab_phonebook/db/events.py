@@ -0,0 +1,105 @@
+"""
+Session hooks that track which tables a transaction wrote to.
+
+Before a transaction commits, the `table_versions` counter of every table it
+wrote to is incremented in that same transaction. Listeners registered with
+`on_tables_committed` are then called with the set of table names, so caches
+can be invalidated by the writes themselves instead of by expiry timers.
+"""
+
+from typing import Callable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from jeffersonlab_phonebook.db.models import TableVersion
+
+WRITTEN_TABLES_KEY = "written_tables"
+
+TablesCommittedListener = Callable[[frozenset[str]], None]
+
+_listeners: list[TablesCommittedListener] = []
+# Tables whose writes are reported to listeners but not counted in
+# table_versions, e.g. queues that are written all the time.
+_unversioned_tables: set[str] = set()
+
+
+def on_tables_committed(listener: TablesCommittedListener) -> TablesCommittedListener:
+    """
+    Registers a callback fired with the names of the tables written by each
+    committed transaction. Can be used as a decorator.
+    """
+    _listeners.append(listener)
+    return listener
+
+
+def skip_table_versions(*table_names: str) -> None:
+    """
+    Stops counting writes to these tables in `table_versions`. Listeners are
+    still notified of them.
+    """
+    _unversioned_tables.update(table_names)
+
+
+def mark_tables_written(session: Session, *table_names: str) -> None:
+    """
+    Records tables written outside the unit of work (e.g. raw SQL) so that
+    listeners are notified when the session commits.
+    """
+    session.info.setdefault(WRITTEN_TABLES_KEY, set()).update(table_names)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, flush_context: UOWTransaction) -> None:
+    # new/dirty/deleted still hold the pre-flush state at this point.
+    tables = {
+        inspect(obj).mapper.local_table.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    }
+    if tables:
+        mark_tables_written(session, *tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk INSERT/UPDATE/DELETE statements bypass the unit of work.
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        table = orm_execute_state.statement.table  # type: ignore[attr-defined]
+        mark_tables_written(orm_execute_state.session, table.name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_table_versions(session: Session) -> None:
+    # Flush now so that every pending write has been collected.
+    session.flush()
+    tables = session.info.get(WRITTEN_TABLES_KEY, set()) - _unversioned_tables
+    if not tables:
+        return
+    # Sorted so concurrent transactions lock the counter rows in the same order.
+    stmt = insert(TableVersion).values(
+        [{"table_name": table, "version": 1} for table in sorted(tables)]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TableVersion.table_name],
+        set_={"version": TableVersion.version + 1},
+    )
+    session.connection().execute(stmt)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_committed_tables(session: Session) -> None:
+    tables = frozenset(session.info.pop(WRITTEN_TABLES_KEY, ()))
+    if not tables:
+        return
+    for listener in _listeners:
+        listener(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_tables(session: Session) -> None:
+    session.info.pop(WRITTEN_TABLES_KEY, None)
@@ -1,17 +1,95 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import Date, Float, ForeignKey, String, Enum, Text, UniqueConstraint
+from sqlalchemy import BigInteger, Date, DateTime, Float, ForeignKey, Index, String, Enum, Text, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-from .constants import BoardType
+from .constants import BoardType, JobStatus
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class TableVersion(Base):
+    """
+    Write counter per table, incremented in the same transaction as every
+    write to that table. Used to derive ETags and cache keys.
+    """
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class Job(Base):
+    """
+    A unit of background work, e.g. enriching an institution from ROR.
+    Workers claim queued jobs with SELECT ... FOR UPDATE SKIP LOCKED, so
+    several workers and processes can share the table.
+    """
+
+    __tablename__ = "jobs"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus), nullable=False, default=JobStatus.QUEUED
+    )
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(nullable=False)
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_error: Mapped[str | None] = mapped_column(Text)
+    # What the handler returned, e.g. a report, once the job is done.
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    __table_args__ = (
+        # Serves the dequeue query.
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+
+class Notification(Base):
+    """
+    An event a member is emailed about, e.g. a new talk assignment. Pending
+    notifications are sent in batches, one digest per member.
+    """
+
+    __tablename__ = "notifications"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    member_id: Mapped[int] = mapped_column(ForeignKey("members.id", ondelete="CASCADE"))
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    # The ids describing the event; rendered into text when sent.
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Set instead of sent_at when the SMTP server rejected the digest.
+    failed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    error: Mapped[str | None] = mapped_column(Text)
+
+    member: Mapped["Member"] = relationship()
+    __table_args__ = (
+        # Only pending notifications are ever looked up.
+        Index(
+            "ix_notifications_pending",
+            "member_id",
+            postgresql_where=text("sent_at IS NULL"),
+        ),
+    )
+
+
 class Role(Base):
     """
     Represents a dynamic role that can be assigned to members in various contexts.
@@ -69,6 +147,57 @@ class Institution(Base):
     board_memberships: Mapped[list["InstitutionalBoardMember"]] = relationship(
         back_populates="institution"
     )
+    __table_args__ = (
+        # Serves bounding-box queries for the institution map.
+        Index("ix_institutions_lat_lng", "latitude", "longitude"),
+    )
+
+
+class RorOrganization(Base):
+    """
+    An organization from the ROR data dump, stored locally so that ROR IDs
+    can be resolved without calling the ROR API.
+    """
+
+    __tablename__ = "ror_organizations"
+
+    # Bare ROR ID, without the https://ror.org/ prefix.
+    ror_id: Mapped[str] = mapped_column(String(16), primary_key=True)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    full_name: Mapped[str | None] = mapped_column(Text, nullable=True)
+    short_name: Mapped[str | None] = mapped_column(Text, nullable=True)
+    country: Mapped[str | None] = mapped_column(String, nullable=True)
+    region: Mapped[str | None] = mapped_column(String, nullable=True)
+    city: Mapped[str | None] = mapped_column(String, nullable=True)
+    address: Mapped[str | None] = mapped_column(String, nullable=True)
+    latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
+class RorOrganizationName(Base):
+    """
+    Search key for name suggestions: every name, acronym and alias of an
+    organization, normalized, once from each word onwards so that a prefix
+    search also matches words inside the name.
+    """
+
+    __tablename__ = "ror_organization_names"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    ror_id: Mapped[str] = mapped_column(
+        ForeignKey("ror_organizations.ror_id", ondelete="CASCADE"), index=True
+    )
+    search_key: Mapped[str] = mapped_column(Text, nullable=False)
+    # 0 when the key is the start of the name; ranks suggestions.
+    word_position: Mapped[int] = mapped_column(nullable=False)
+    __table_args__ = (
+        # text_pattern_ops lets LIKE 'prefix%' use the index in any collation.
+        Index(
+            "ix_ror_organization_names_search_key",
+            "search_key",
+            postgresql_ops={"search_key": "text_pattern_ops"},
+        ),
+    )
 
 
 class Member(Base):
@@ -83,7 +212,9 @@ class Member(Base):
     orcid: Mapped[str | None] = mapped_column(String, nullable=True)
     preferred_author_name: Mapped[str | None] = mapped_column(String, nullable=True)
 
-    institution_id: Mapped[int] = mapped_column(ForeignKey("institutions.id"))
+    institution_id: Mapped[int] = mapped_column(
+        ForeignKey("institutions.id"), index=True
+    )
     date_joined: Mapped[date] = mapped_column(Date, nullable=False)
     date_left: Mapped[date | None] = mapped_column(Date, nullable=True)
 
@@ -229,7 +360,7 @@ class Talk(Base):
     docdb_id: Mapped[str | None] = mapped_column(String, nullable=True)
     talk_link: Mapped[str | None] = mapped_column(String, nullable=True)
 
-    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     end_date: Mapped[date | None] = mapped_column(Date, nullable=True)
 
     conference_id: Mapped[int | None] = mapped_column(ForeignKey("conferences.id"))
@@ -250,7 +381,7 @@ class TalkAssignment(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     talk_id: Mapped[int] = mapped_column(ForeignKey("talks.id"))
-    member_id: Mapped[int] = mapped_column(ForeignKey("members.id"))
+    member_id: Mapped[int] = mapped_column(ForeignKey("members.id"), index=True)
     role_id: Mapped[int] = mapped_column(ForeignKey("roles.id"))
 
     assigned_by_id: Mapped[int | None] = mapped_column(ForeignKey("members.id"))
@@ -1,20 +1,60 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import FastAPI
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
+from jeffersonlab_phonebook.api.compression import CompressionMiddleware
 from jeffersonlab_phonebook.api.main import api_router
+from jeffersonlab_phonebook.api.routes import login
 from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
+from jeffersonlab_phonebook.services.jobs import job_workers
+from jeffersonlab_phonebook.services.ror_api_client import ror_api_client
+from jeffersonlab_phonebook.services.ror_async_client import async_ror_api_client
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ForceHTTPSRedirectMiddleware:
+    """
+    Treats requests the proxy received over HTTPS as https, so that URLs
+    built from the request (e.g. the OAuth callback) use https. Plain ASGI:
+    the scope is updated and the app called directly, with no extra task or
+    response stream per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and (b"x-forwarded-proto", b"https") in scope["headers"]:
+            scope = {**scope, "scheme": "https"}
+        await self.app(scope, receive, send)
+
+
+class PathPrefixMiddleware:
+    """
+    Runs `middleware` only for requests under `prefix`; all others go
+    straight to the app and pay nothing for it.
+    """
+
+    def __init__(self, app: ASGIApp, middleware: Any, prefix: str, **options: Any) -> None:
+        self.app = app
+        self.prefix = prefix.rstrip("/")
+        self.scoped_app = middleware(app, **options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            if path == self.prefix or path.startswith(self.prefix + "/"):
+                await self.scoped_app(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
 
-class ForceHTTPSRedirectMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if request.headers.get("x-forwarded-proto") == "https":
-            request.scope["scheme"] = "https"
-        response = await call_next(request)
-        return response
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     """_summary_
@@ -25,10 +65,22 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The roles table is small and rarely written; keep it in memory.
+    role_registry.load()
+    job_workers.start()
+    yield
+    job_workers.stop()
+    ror_api_client.close()
+    await async_ror_api_client.aclose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 # Set all CORS enabled origins
@@ -41,7 +93,20 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
-app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    cache_max_bytes=settings.COMPRESSION_CACHE_MAX_BYTES,
+)
+# Only the OAuth login flow under /user keeps state in the session cookie.
+app.add_middleware(
+    PathPrefixMiddleware,
+    middleware=SessionMiddleware,
+    prefix=f"{settings.API_V1_STR}{login.router.prefix}",
+    secret_key=settings.SECRET_KEY,
+)
 app.add_middleware(ForceHTTPSRedirectMiddleware)
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=["vulcan.jlab.org"])
 
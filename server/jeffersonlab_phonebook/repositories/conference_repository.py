@@ -1,12 +1,15 @@
 # File: jeffersonlab_phonebook/repositories/talk_conference_repository.py
 
-from typing import List, Optional, Sequence
+from typing import Any, Collection, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session, joinedload, selectinload, defer
 
 from jeffersonlab_phonebook.db.models import Talk, Conference, TalkAssignment
+from jeffersonlab_phonebook.repositories.projection import lite_columns
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
 from jeffersonlab_phonebook.schemas.conference_schemas import ConferenceCreate, ConferenceUpdate, TalkCreate, TalkUpdate
+from jeffersonlab_phonebook.schemas.response_schemas import ConferenceLiteResponse, TalkLiteResponse
 
 
 class TalkRepository:
@@ -14,9 +17,9 @@ class TalkRepository:
         self.db = db
 
     def get(self, talk_id: int) -> Optional[Talk]:
+        role_registry.prime(self.db)
         query = select(Talk).where(Talk.id == talk_id).options(
             joinedload(Talk.assignments).joinedload(TalkAssignment.member),
-            joinedload(Talk.assignments).joinedload(TalkAssignment.role),
             joinedload(Talk.assignments).joinedload(TalkAssignment.assigned_by_member),
         )
         return self.db.scalar(query)
@@ -26,6 +29,19 @@ class TalkRepository:
         talks = self.db.scalars(query).all()
         return talks
 
+    def get_all_lite(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retrieves a page of talks as rows of the TalkLiteResponse columns,
+        or only of `fields` when given, without loading ORM objects.
+        """
+        query = select(*lite_columns(Talk, TalkLiteResponse, fields)).offset(skip).limit(limit)
+        return self.db.execute(query).all()
+
     def create(self, talk_in: TalkCreate) -> Talk:
         talk = Talk(**talk_in.model_dump(exclude_unset=True))
         self.db.add(talk)
@@ -58,11 +74,11 @@ class ConferenceRepository:
     def get(self, conference_id: int, include_talks: bool = False):
         query = select(Conference).where(Conference.id == conference_id)
         if include_talks:
+            role_registry.prime(self.db)
             query = query.options(
                 joinedload(Conference.talks).options(
                     selectinload(Talk.assignments).options(
                         selectinload(TalkAssignment.member),
-                        selectinload(TalkAssignment.role),
                         selectinload(TalkAssignment.assigned_by_member),
                         defer(TalkAssignment.talk_id),
                     ),
@@ -76,6 +92,19 @@ class ConferenceRepository:
         conferences = self.db.scalars(query).all()
         return conferences
 
+    def get_all_lite(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retrieves a page of conferences as rows of the ConferenceLiteResponse
+        columns, or only of `fields` when given, without loading ORM objects.
+        """
+        query = select(*lite_columns(Conference, ConferenceLiteResponse, fields)).offset(skip).limit(limit)
+        return self.db.execute(query).all()
+
     def create(self, conference_in: ConferenceCreate) -> Conference:
         conference = Conference(**conference_in.model_dump())
         self.db.add(conference)
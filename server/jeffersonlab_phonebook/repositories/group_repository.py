@@ -1,18 +1,22 @@
 # File: jeffersonlab_phonebook/repositories/group_repository.py
 
-from typing import List, Optional, Sequence
+from typing import Any, Collection, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session, joinedload
 
-from jeffersonlab_phonebook.db.models import Group, GroupMember, Role
+from jeffersonlab_phonebook.db.models import Group, GroupMember
+from jeffersonlab_phonebook.repositories.projection import lite_columns
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
 from jeffersonlab_phonebook.schemas.group_schemas import GroupCreate, GroupUpdate, GroupMemberCreate, GroupMemberUpdate
+from jeffersonlab_phonebook.schemas.response_schemas import GroupLiteResponse
 
 class GroupRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def get(self, group_id: int) -> Optional[Group]:
+        role_registry.prime(self.db)
         query = select(Group).where(Group.id == group_id).options(
             joinedload(Group.subgroups),
             joinedload(Group.group_memberships)
@@ -32,6 +36,19 @@ class GroupRepository:
         db_groups = self.db.scalars(query.offset(skip).limit(limit)).all()
         return db_groups
 
+    def get_all_lite(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retrieves a page of groups as rows of the GroupLiteResponse columns,
+        or only of `fields` when given, without loading ORM objects.
+        """
+        query = select(*lite_columns(Group, GroupLiteResponse, fields))
+        return self.db.execute(query.offset(skip).limit(limit)).all()
+
     def create(self, group_in: GroupCreate) -> Group:
         """
         Creates a new group and returns the ORM object.
@@ -92,9 +109,13 @@ class GroupMemberRepository:
         limit: int = 100,
         role_name: Optional[str] = None
     ) -> Sequence[GroupMember]:
+        role_registry.prime(self.db)
         query = select(GroupMember).where(GroupMember.group_id == group_id)
         if role_name:
-            query = query.join(GroupMember.role).where(Role.name == role_name)
+            role_id = role_registry.id_for(role_name)
+            if role_id is None:
+                return []
+            query = query.where(GroupMember.role_id == role_id)
         query = query.offset(skip).limit(limit)
         return self.db.execute(query).scalars().all()
 
@@ -106,6 +127,7 @@ class GroupMemberRepository:
         self.db.add(db_gm)
         self.db.commit()
         self.db.refresh(db_gm)
+        role_registry.prime(self.db)
         return db_gm
 
     def update(self, db_gm: GroupMember, gm_in: GroupMemberUpdate) -> GroupMember:
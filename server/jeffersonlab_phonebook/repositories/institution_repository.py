@@ -1,13 +1,22 @@
-from typing import List, Optional
+from typing import Any, Collection, List, Optional, Sequence
 
-from sqlalchemy import select, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, column, exists, func, select, or_, update, values
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from jeffersonlab_phonebook.db.models import Institution
+from jeffersonlab_phonebook.db.models import (
+    Institution,
+    InstitutionalBoardMember,
+    Member,
+    MemberInstitutionHistory,
+)
+from jeffersonlab_phonebook.repositories.projection import lite_columns
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
 from jeffersonlab_phonebook.schemas.institutions_schemas import (
     InstitutionCreate,
     InstitutionUpdate,
 )
+from jeffersonlab_phonebook.schemas.response_schemas import InstitutionLiteResponse
 
 
 class InstitutionRepository:
@@ -20,6 +29,94 @@ class InstitutionRepository:
         """
         return self.db.get(Institution, institution_id)
 
+    def exists(self, institution_id: int) -> bool:
+        """
+        Checks whether an institution with the given ID exists.
+        """
+        return bool(
+            self.db.scalar(select(exists().where(Institution.id == institution_id)))
+        )
+
+    def get_full(
+        self,
+        institution_id: int,
+        members_limit: int = 100,
+        board_limit: int = 100,
+        history_limit: int = 100,
+    ) -> Optional[Institution]:
+        """
+        Retrieves an institution with its members, board memberships and
+        membership history, each collection capped at its own limit.
+        Runs one query for the institution, one per collection and one for
+        the collections' full sizes, which are set as `members_total`,
+        `board_memberships_total` and `institution_memberships_total` so
+        that callers can tell a capped collection from a complete one. The
+        collections are attached without marking the institution as modified.
+        """
+        institution = self.db.get(Institution, institution_id)
+        if institution is None:
+            return None
+        role_registry.prime(self.db)
+
+        # Members' `institution` resolves from the identity map, no extra query.
+        members = self.db.scalars(
+            select(Member)
+            .where(Member.institution_id == institution_id)
+            .order_by(Member.last_name, Member.first_name, Member.id)
+            .limit(members_limit)
+        ).all()
+        board_memberships = self.db.scalars(
+            select(InstitutionalBoardMember)
+            .where(InstitutionalBoardMember.institution_id == institution_id)
+            .options(
+                joinedload(InstitutionalBoardMember.member).joinedload(
+                    Member.institution
+                )
+            )
+            .order_by(
+                InstitutionalBoardMember.start_date.desc(),
+                InstitutionalBoardMember.id,
+            )
+            .limit(board_limit)
+        ).all()
+        history = self.db.scalars(
+            select(MemberInstitutionHistory)
+            .where(MemberInstitutionHistory.institution_id == institution_id)
+            .options(
+                joinedload(MemberInstitutionHistory.member).joinedload(
+                    Member.institution
+                )
+            )
+            .order_by(
+                MemberInstitutionHistory.start_date.desc(),
+                MemberInstitutionHistory.id,
+            )
+            .limit(history_limit)
+        ).all()
+        totals = self.db.execute(
+            select(
+                select(func.count())
+                .where(Member.institution_id == institution_id)
+                .scalar_subquery(),
+                select(func.count())
+                .where(InstitutionalBoardMember.institution_id == institution_id)
+                .scalar_subquery(),
+                select(func.count())
+                .where(MemberInstitutionHistory.institution_id == institution_id)
+                .scalar_subquery(),
+            )
+        ).one()
+
+        set_committed_value(institution, "members", list(members))
+        set_committed_value(institution, "board_memberships", list(board_memberships))
+        set_committed_value(institution, "institution_memberships", list(history))
+        (
+            institution.members_total,
+            institution.board_memberships_total,
+            institution.institution_memberships_total,
+        ) = totals
+        return institution
+
     def get_by_name(self, name: str) -> Optional[Institution]:
         """
         Retrieves a single institution by its full_name or short_name.
@@ -33,6 +130,25 @@ class InstitutionRepository:
             )
         )
 
+    def get_by_names(self, names: Collection[str]) -> Sequence[Row[Any]]:
+        """
+        Id, full_name and short_name of every institution whose full or short
+        name is one of `names`.
+        """
+        return self.db.execute(
+            select(Institution.id, Institution.full_name, Institution.short_name).where(
+                or_(Institution.full_name.in_(names), Institution.short_name.in_(names))
+            )
+        ).all()
+
+    def existing_ids(self, institution_ids: Collection[int]) -> set[int]:
+        """The subset of `institution_ids` that exist."""
+        return set(
+            self.db.scalars(
+                select(Institution.id).where(Institution.id.in_(institution_ids))
+            )
+        )
+
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Institution]:
         """
         Retrieves all institutions from the database with pagination.
@@ -41,6 +157,49 @@ class InstitutionRepository:
             self.db.scalars(select(Institution).offset(skip).limit(limit)).all()
         )
 
+    def get_all_lite(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retrieves a page of institutions as rows of the InstitutionLiteResponse
+        columns, or only of `fields` when given, without loading ORM objects.
+        """
+        query = select(*lite_columns(Institution, InstitutionLiteResponse, fields))
+        return self.db.execute(query.offset(skip).limit(limit)).all()
+
+    def get_geo_points(
+        self, bbox: Optional[tuple[float, float, float, float]] = None
+    ) -> List[Row[Any]]:
+        """
+        Retrieves the id, short name and coordinates of active institutions
+        that have a location, optionally within a bounding box given as
+        (min_lon, min_lat, max_lon, max_lat). A box with min_lon > max_lon
+        crosses the antimeridian.
+        """
+        query = select(
+            Institution.id,
+            Institution.short_name,
+            Institution.latitude,
+            Institution.longitude,
+        ).where(
+            Institution.is_active.is_(True),
+            Institution.latitude.is_not(None),
+            Institution.longitude.is_not(None),
+        )
+        if bbox:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            query = query.where(Institution.latitude.between(min_lat, max_lat))
+            if min_lon <= max_lon:
+                query = query.where(Institution.longitude.between(min_lon, max_lon))
+            else:
+                query = query.where(
+                    or_(Institution.longitude >= min_lon, Institution.longitude <= max_lon)
+                )
+        return list(self.db.execute(query).all())
+
     def create(self, institution_in: InstitutionCreate) -> Institution:
         """
         Creates a new institution in the database.
@@ -65,6 +224,41 @@ class InstitutionRepository:
         self.db.refresh(db_institution)
         return db_institution
 
+    def get_ror_linked(self, columns: Sequence[str]) -> Sequence[Row[Any]]:
+        """
+        Id, rorid and the given columns of every institution with a ROR ID.
+        """
+        return self.db.execute(
+            select(
+                Institution.id,
+                Institution.rorid,
+                *(getattr(Institution, name) for name in columns),
+            )
+            .where(Institution.rorid.is_not(None), Institution.rorid != "")
+            .order_by(Institution.id)
+        ).all()
+
+    def bulk_update(self, columns: Sequence[str], rows: list[dict[str, Any]]) -> int:
+        """
+        Sets `columns` on many institutions with a single
+        UPDATE ... FROM (VALUES ...) statement. Each row holds the id and a
+        value for every column. Does not commit; returns the rows updated.
+        """
+        if not rows:
+            return 0
+        table = Institution.__table__
+        new_values = values(
+            column("id", table.c.id.type),
+            *(column(name, table.c[name].type) for name in columns),
+            name="new_values",
+        ).data([(row["id"], *(row[name] for name in columns)) for row in rows])
+        result = self.db.execute(
+            update(table)
+            .where(table.c.id == new_values.c.id)
+            .values({name: new_values.c[name] for name in columns})
+        )
+        return result.rowcount
+
     def delete(self, institution_id: int):
         """
         Deletes an institution from the database by ID.
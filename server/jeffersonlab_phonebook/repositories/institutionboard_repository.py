@@ -12,6 +12,8 @@ from jeffersonlab_phonebook.db.models import InstitutionalBoardMember
 # Import the BoardType enum
 from jeffersonlab_phonebook.db.constants import BoardType
 
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
+
 # Import Pydantic schemas (for method arguments, not return types)
 from jeffersonlab_phonebook.schemas.board_schemas import (
     InstitutionalBoardMemberCreate,
@@ -23,12 +25,12 @@ class InstitutionalBoardMemberRepository:
         self.db = db
 
     def get(self, ibm_id: int) -> Optional[InstitutionalBoardMember]:
+        role_registry.prime(self.db)
         query = select(InstitutionalBoardMember).where(
             InstitutionalBoardMember.id == ibm_id
         ).options(
             joinedload(InstitutionalBoardMember.member),
             joinedload(InstitutionalBoardMember.institution),
-            joinedload(InstitutionalBoardMember.role)
         )
         db_ibm = self.db.scalar(query)
         return db_ibm
@@ -41,10 +43,10 @@ class InstitutionalBoardMemberRepository:
         member_id: Optional[int] = None,
         institution_id: Optional[int] = None,
     ) -> Sequence[InstitutionalBoardMember]:
+        role_registry.prime(self.db)
         query = select(InstitutionalBoardMember).options(
             joinedload(InstitutionalBoardMember.member),
             joinedload(InstitutionalBoardMember.institution),
-            joinedload(InstitutionalBoardMember.role),
         )
 
         if board_type:
@@ -64,6 +66,7 @@ class InstitutionalBoardMemberRepository:
         self.db.add(db_ibm)
         self.db.commit()
         self.db.refresh(db_ibm)
+        role_registry.prime(self.db)
         return db_ibm
 
     def update(
@@ -75,6 +78,7 @@ class InstitutionalBoardMemberRepository:
         self.db.add(db_ibm)
         self.db.commit()
         self.db.refresh(db_ibm)
+        role_registry.prime(self.db)
         return db_ibm
 
     def delete(self, ibm_id: int) -> bool:
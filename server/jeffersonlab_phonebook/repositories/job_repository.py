@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import and_, exists, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.constants import JobStatus
+from jeffersonlab_phonebook.db.models import Job
+
+
+class JobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        max_attempts: int,
+        run_after: Optional[datetime] = None,
+    ) -> Job:
+        """
+        Adds a job to the session without committing, so it is queued
+        atomically with the caller's own changes.
+        """
+        job = Job(kind=kind, payload=payload, max_attempts=max_attempts)
+        if run_after is not None:
+            job.run_after = run_after
+        self.db.add(job)
+        return job
+
+    def get(self, job_id: int) -> Optional[Job]:
+        return self.db.get(Job, job_id)
+
+    def has_queued(self, kind: str) -> bool:
+        return self.db.scalar(
+            select(
+                exists().where(Job.kind == kind, Job.status == JobStatus.QUEUED)
+            )
+        )
+
+    def claim(self, lock_timeout: timedelta) -> Optional[Job]:
+        """
+        Marks the next due job as running and commits. Jobs locked by other
+        transactions are skipped; running jobs whose lock was not renewed by
+        `heartbeat` within `lock_timeout` (e.g. because their worker died)
+        are claimed again. Each claim counts an attempt, and the attempt
+        number identifies the claim to `heartbeat`, `mark_done` and
+        `mark_failed`.
+        """
+        job = self.db.scalar(
+            select(Job)
+            .where(
+                or_(
+                    and_(Job.status == JobStatus.QUEUED, Job.run_after <= func.now()),
+                    and_(
+                        Job.status == JobStatus.RUNNING,
+                        Job.locked_at < func.now() - lock_timeout,
+                    ),
+                )
+            )
+            .order_by(Job.run_after, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if job is None:
+            self.db.rollback()
+            return None
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.locked_at = func.now()
+        self.db.commit()
+        return job
+
+    def heartbeat(self, job_id: int, attempt: int) -> bool:
+        """
+        Renews the lock of a running job and commits. Returns False when the
+        claim has ended, i.e. the job finished or was claimed again.
+        """
+        result = self.db.execute(
+            update(Job)
+            .where(
+                Job.id == job_id,
+                Job.status == JobStatus.RUNNING,
+                Job.attempts == attempt,
+            )
+            .values(locked_at=func.now())
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def _get_claimed(self, job_id: int, attempt: int) -> Optional[Job]:
+        """The job, locked, if it is still running under the given claim."""
+        return self.db.scalar(
+            select(Job)
+            .where(
+                Job.id == job_id,
+                Job.status == JobStatus.RUNNING,
+                Job.attempts == attempt,
+            )
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+
+    def mark_done(
+        self, job_id: int, attempt: int, result: Optional[dict[str, Any]] = None
+    ) -> bool:
+        """
+        Does not commit: the worker commits it together with the changes the
+        job made, so a job's effects and its completion are atomic. Returns
+        False, changing nothing, when the claim has ended; the worker must
+        then roll the job's changes back.
+        """
+        job = self._get_claimed(job_id, attempt)
+        if job is None:
+            return False
+        job.status = JobStatus.DONE
+        job.result = result
+        job.locked_at = None
+        job.finished_at = func.now()
+        return True
+
+    def mark_failed(
+        self, job_id: int, attempt: int, error: str, retry_in: Optional[float]
+    ) -> bool:
+        """
+        Records a failed attempt. The job is queued again after `retry_in`
+        seconds, or failed for good when `retry_in` is None. Returns False,
+        changing nothing, when the claim has ended.
+        """
+        job = self._get_claimed(job_id, attempt)
+        if job is None:
+            self.db.rollback()
+            return False
+        job.last_error = error
+        job.locked_at = None
+        if retry_in is None:
+            job.status = JobStatus.FAILED
+            job.finished_at = func.now()
+        else:
+            job.status = JobStatus.QUEUED
+            job.run_after = datetime.now(timezone.utc) + timedelta(seconds=retry_in)
+        self.db.commit()
+        return True
+
+    def count_by_status(self) -> dict[tuple[str, JobStatus], int]:
+        rows = self.db.execute(
+            select(Job.kind, Job.status, func.count()).group_by(Job.kind, Job.status)
+        )
+        return {(kind, status): count for kind, status, count in rows}
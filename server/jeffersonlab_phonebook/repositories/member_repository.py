@@ -1,11 +1,25 @@
 from datetime import date
-from typing import Any, Optional
+from typing import Any, Collection, Iterator, Optional, Sequence
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Boolean, Result, Row, case, literal, literal_column, select, func, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Bundle, Session, joinedload, selectinload
 
-from jeffersonlab_phonebook.db.models import Member
+from jeffersonlab_phonebook.db.models import (
+    GroupMember,
+    Institution,
+    InstitutionalBoardMember,
+    Member,
+    MemberInstitutionHistory,
+    TalkAssignment,
+)
+from jeffersonlab_phonebook.repositories.institution_repository import (
+    InstitutionRepository,
+)
+from jeffersonlab_phonebook.repositories.projection import lite_columns
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
 from jeffersonlab_phonebook.schemas.members_schemas import MemberCreate, MemberUpdate # Import the schemas
+from jeffersonlab_phonebook.schemas.response_schemas import InstitutionLiteResponse, MemberLiteResponse
 
 class MemberRepository:
     def __init__(self, db: Session):
@@ -30,6 +44,48 @@ class MemberRepository:
             .where(Member.id == member_id)
         )
 
+    def get_profile(
+        self, member_id: int, institution_limit: int = 20
+    ) -> Member | None:
+        """
+        Retrieves a member with everything needed for the full MemberResponse:
+        institution (with its members, board and membership history, each
+        capped at `institution_limit` rows), group memberships, board
+        memberships and talk assignments.
+        Collections are loaded with one SELECT ... IN query each and
+        many-to-one links are joined, so the number of queries is fixed
+        whatever the size of the member's history or institution. Roles come
+        from the role registry.
+        """
+        role_registry.prime(self.db)
+        member = self.db.scalar(
+            select(Member)
+            .where(Member.id == member_id)
+            .options(
+                joinedload(Member.institution),
+                selectinload(Member.group_memberships).joinedload(GroupMember.group),
+                selectinload(Member.board_memberships).joinedload(
+                    InstitutionalBoardMember.institution
+                ),
+                selectinload(Member.talk_assignments)
+                .joinedload(TalkAssignment.assigned_by_member)
+                .joinedload(Member.institution),
+                selectinload(Member.talk_assignments_given)
+                .joinedload(TalkAssignment.member)
+                .joinedload(Member.institution),
+            )
+        )
+        if member is not None:
+            # The institution is already in the identity map; this attaches
+            # its capped collections to it.
+            InstitutionRepository(self.db).get_full(
+                member.institution_id,
+                members_limit=institution_limit,
+                board_limit=institution_limit,
+                history_limit=institution_limit,
+            )
+        return member
+
     def create(self, member_in: MemberCreate) -> Member:
         """
         Creates a new member in the database from a MemberCreate Pydantic model.
@@ -97,6 +153,31 @@ class MemberRepository:
             ).all()
         )
     
+    def get_all_lite(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Collection[str]] = None,
+        institution_id: Optional[int] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Retrieves a page of members as rows of the MemberLiteResponse columns,
+        or only of `fields` when given, optionally for one institution.
+        The institution is joined in as a nested row only when it is selected.
+        """
+        if fields is None:
+            fields = MemberLiteResponse.model_fields.keys()
+        query = select(
+            *lite_columns(Member, MemberLiteResponse, set(fields) - {"institution"})
+        )
+        if "institution" in fields:
+            query = query.add_columns(
+                Bundle("institution", *lite_columns(Institution, InstitutionLiteResponse))
+            ).join(Member.institution)
+        if institution_id is not None:
+            query = query.where(Member.institution_id == institution_id)
+        return self.db.execute(query.offset(skip).limit(limit)).all()
+
     def count_all(self) -> int:
         """
         Returns the total number of members in the database.
@@ -158,3 +239,158 @@ class MemberRepository:
             ).all()
         )
 
+    def bulk_upsert(
+        self,
+        rows: list[dict[str, Any]],
+        update_existing: bool = False,
+        batch_size: int = 1000,
+    ) -> list[Row[Any]]:
+        """
+        Inserts members with multi-row INSERT ... ON CONFLICT (email)
+        statements of up to `batch_size` rows. Existing members are left
+        alone, or with `update_existing` get the new names and institution,
+        and the ORCID, preferred author name and leaving date where the row
+        has one; their joining date is kept. Their active flag is only
+        changed when the rows have an `is_active` key, and a member made
+        active loses a leaving date the row does not give. Every row must
+        have the same keys and the emails must be distinct. Does not commit;
+        returns the id, email and whether it was inserted of each row written.
+        """
+        table = Member.__table__
+        stmt = insert(table)
+        if update_existing:
+            set_: dict[str, Any] = {
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "institution_id": stmt.excluded.institution_id,
+                **{
+                    name: func.coalesce(stmt.excluded[name], table.c[name])
+                    for name in ("orcid", "preferred_author_name", "date_left")
+                },
+            }
+            if rows and "is_active" in rows[0]:
+                set_["is_active"] = stmt.excluded.is_active
+                set_["date_left"] = case(
+                    (stmt.excluded.is_active, stmt.excluded.date_left),
+                    else_=set_["date_left"],
+                )
+            stmt = stmt.on_conflict_do_update(index_elements=[table.c.email], set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.email])
+        # xmax is 0 for a row version created by an insert.
+        inserted = literal_column("xmax = 0", Boolean).label("inserted")
+        # Executed with a list of rows, the statement is compiled once and
+        # sent as multi-row VALUES of `batch_size` rows ("insertmanyvalues").
+        return list(
+            self.db.execute(
+                stmt.returning(table.c.id, table.c.email, inserted).execution_options(
+                    insertmanyvalues_page_size=batch_size
+                ),
+                rows,
+            )
+        )
+
+    def ids_by_email(self, emails: Collection[str]) -> dict[str, int]:
+        return dict(
+            self.db.execute(
+                select(Member.email, Member.id).where(Member.email.in_(emails))
+            ).tuples().all()
+        )
+
+    def stream_export(
+        self,
+        batch_size: int = 1000,
+        group_id: Optional[int] = None,
+        institution_id: Optional[int] = None,
+        active_only: bool = False,
+    ) -> Result[Any]:
+        """
+        Members ordered by ID, with their institution's fields joined in as
+        `institution_*` columns, optionally only the current members of a
+        group, those of an institution, or active members. The result is read
+        from a server-side cursor `batch_size` rows at a time.
+        """
+        query = (
+            select(
+                Member.id,
+                Member.first_name,
+                Member.last_name,
+                Member.email,
+                Member.orcid,
+                Member.preferred_author_name,
+                Member.date_joined,
+                Member.date_left,
+                Member.is_active,
+                Institution.id.label("institution_id"),
+                Institution.short_name.label("institution_short_name"),
+                Institution.full_name.label("institution_full_name"),
+                Institution.address.label("institution_address"),
+                Institution.city.label("institution_city"),
+                Institution.region.label("institution_region"),
+                Institution.country.label("institution_country"),
+                Institution.rorid.label("institution_rorid"),
+            )
+            .join(Member.institution)
+            .order_by(Member.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if group_id is not None:
+            query = query.where(
+                Member.id.in_(
+                    select(GroupMember.member_id).where(
+                        GroupMember.group_id == group_id,
+                        GroupMember.end_date.is_(None),
+                    )
+                )
+            )
+        if institution_id is not None:
+            query = query.where(Member.institution_id == institution_id)
+        if active_only:
+            query = query.where(Member.is_active.is_(True), Member.date_left.is_(None))
+        return self.db.execute(query)
+
+    def iter_author_affiliations(self, batch_size: int = 1000) -> Iterator[Row[Any]]:
+        """
+        Streams one row per (eligible member, affiliation) pair, ordered by
+        author name, using a server-side cursor.
+        Affiliations are the member's primary institution first, followed by
+        any other institution they are still attached to in their history.
+        """
+        affiliations = union(
+            select(
+                Member.id.label("member_id"),
+                Member.institution_id.label("institution_id"),
+                literal(0).label("rank"),
+            ),
+            select(
+                MemberInstitutionHistory.member_id,
+                MemberInstitutionHistory.institution_id,
+                literal(1),
+            ).where(MemberInstitutionHistory.end_date.is_(None)),
+        ).subquery()
+
+        query = (
+            select(
+                Member.id.label("member_id"),
+                Member.first_name,
+                Member.last_name,
+                Member.preferred_author_name,
+                Member.orcid,
+                Institution.id.label("institution_id"),
+                Institution.full_name,
+                Institution.city,
+                Institution.country,
+            )
+            .join(affiliations, affiliations.c.member_id == Member.id)
+            .join(Institution, Institution.id == affiliations.c.institution_id)
+            .where(Member.is_active.is_(True), Member.date_left.is_(None))
+            .order_by(
+                Member.last_name,
+                Member.first_name,
+                Member.id,
+                affiliations.c.rank,
+                Institution.id,
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.execute(query)
@@ -0,0 +1,50 @@
+from typing import Any, Sequence
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, joinedload
+
+from jeffersonlab_phonebook.db.models import Notification
+
+
+class NotificationRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add(self, member_id: int, kind: str, payload: dict[str, Any]) -> Notification:
+        """Adds a pending notification without committing."""
+        notification = Notification(member_id=member_id, kind=kind, payload=payload)
+        self.db.add(notification)
+        return notification
+
+    def lock_pending(self, limit: int) -> Sequence[Notification]:
+        """
+        Pending notifications with their member, ordered by member so that
+        each member's notifications are adjacent (and, within a member,
+        oldest first), locked until the transaction ends. Rows locked by
+        another dispatcher are skipped.
+        """
+        return self.db.scalars(
+            select(Notification)
+            .where(Notification.sent_at.is_(None), Notification.failed_at.is_(None))
+            .options(joinedload(Notification.member))
+            .order_by(Notification.member_id, Notification.id)
+            .limit(limit)
+            .with_for_update(of=Notification, skip_locked=True)
+        ).all()
+
+    def mark_sent(self, notification_ids: list[int]) -> None:
+        if notification_ids:
+            self.db.execute(
+                update(Notification)
+                .where(Notification.id.in_(notification_ids))
+                .values(sent_at=func.now())
+            )
+
+    def mark_failed(self, notification_ids: list[int], error: str) -> None:
+        """Takes notifications out of the pending ones without sending them."""
+        if notification_ids:
+            self.db.execute(
+                update(Notification)
+                .where(Notification.id.in_(notification_ids))
+                .values(failed_at=func.now(), error=error)
+            )
@@ -0,0 +1,34 @@
+"""
+Column projections for the flat "lite" response schemas.
+
+Selecting only the columns a schema needs returns plain Row tuples: no ORM
+objects are constructed, nothing is tracked in the identity map, and columns
+the response does not show (e.g. `experimental_data` JSONB) are never
+fetched. A Row exposes its columns as attributes, so it validates against the
+schema with `from_attributes` just like the ORM object would. A `fields`
+selection narrows the query further to the columns the client asked for.
+"""
+
+from typing import Any, Collection, Optional
+
+from pydantic import BaseModel
+from sqlalchemy.orm import InstrumentedAttribute
+
+from jeffersonlab_phonebook.db.models import Base
+
+
+def lite_columns(
+    model: type[Base],
+    schema: type[BaseModel],
+    fields: Optional[Collection[str]] = None,
+) -> tuple[InstrumentedAttribute[Any], ...]:
+    """
+    The mapped columns of `model` named by the fields of `schema`, or only by
+    those in `fields` when given. Every selected field must be a column
+    attribute of the model.
+    """
+    return tuple(
+        getattr(model, name)
+        for name in schema.model_fields
+        if fields is None or name in fields
+    )
@@ -0,0 +1,120 @@
+import threading
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.events import on_tables_committed
+from jeffersonlab_phonebook.db.models import Role
+from jeffersonlab_phonebook.db.session import SessionLocal
+from jeffersonlab_phonebook.repositories.table_version_repository import (
+    TableVersionRepository,
+)
+from jeffersonlab_phonebook.schemas.role_schemas import RoleResponse
+
+PRIMED_ROLES_KEY = "primed_roles"
+SYNCED_ROLES_KEY = "synced_roles"
+
+
+class RoleRegistry:
+    """
+    In-process copy of the (small, rarely changing) roles table, shared by
+    all repositories. It is loaded at startup and reloaded after a role write
+    commits. Writes by other workers are picked up by `sync`, which compares
+    the copy with the `roles` counter in table_versions; `prime` syncs once
+    per session. A lookup that misses also triggers a reload.
+    """
+
+    def __init__(self) -> None:
+        self._roles: dict[int, Role] = {}
+        self._responses: dict[int, RoleResponse] = {}
+        self._ids_by_name: dict[str, int] = {}
+        self._stale = True
+        # The roles table version the copy was read at.
+        self._version = -1
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """
+        Reads every role in a dedicated session. The rows are kept detached
+        and are never attached to a request session themselves.
+        """
+        with SessionLocal() as session:
+            # Read first, so the copy is never labelled newer than it is.
+            version = TableVersionRepository(session).get_versions(
+                [Role.__tablename__]
+            )[Role.__tablename__]
+            roles = list(session.scalars(select(Role).order_by(Role.id)).all())
+        with self._lock:
+            self._version = version
+            self._roles = {role.id: role for role in roles}
+            self._responses = {
+                role.id: RoleResponse.model_validate(role) for role in roles
+            }
+            self._ids_by_name = {role.name: role.id for role in roles}
+            self._stale = False
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        if Role.__tablename__ in tables:
+            self._stale = True
+
+    def sync(self, db: Session, version: Optional[int] = None) -> None:
+        """
+        Reloads the copy if the roles table changed since it was read, e.g.
+        by another worker. `version` is the current roles counter when the
+        caller already has it (e.g. from TableETag); otherwise it is read.
+        """
+        if version is None:
+            version = TableVersionRepository(db).get_versions(
+                [Role.__tablename__]
+            )[Role.__tablename__]
+        if self._stale or version != self._version:
+            self.load()
+
+    def _ensure_loaded(self) -> None:
+        if self._stale:
+            self.load()
+
+    def all(self) -> list[RoleResponse]:
+        self._ensure_loaded()
+        return list(self._responses.values())
+
+    def get(self, role_id: int) -> Optional[RoleResponse]:
+        self._ensure_loaded()
+        if role_id not in self._responses:
+            self.load()
+        return self._responses.get(role_id)
+
+    def get_by_name(self, name: str) -> Optional[RoleResponse]:
+        role_id = self.id_for(name)
+        return self._responses.get(role_id) if role_id is not None else None
+
+    def id_for(self, name: str) -> Optional[int]:
+        """
+        Resolves a role name to its id, so queries can filter on
+        `role_id` instead of joining the roles table.
+        """
+        self._ensure_loaded()
+        if name not in self._ids_by_name:
+            self.load()
+        return self._ids_by_name.get(name)
+
+    def prime(self, db: Session) -> None:
+        """
+        Copies the roles into the session's identity map without querying
+        them, so `obj.role` many-to-one lookups are resolved from memory. The
+        identity map only holds weak references, so the session keeps the
+        merged copies in `db.info`. The first call for a session syncs, which
+        reads the roles counter.
+        """
+        if not db.info.get(SYNCED_ROLES_KEY):
+            self.sync(db)
+            db.info[SYNCED_ROLES_KEY] = True
+        self._ensure_loaded()
+        db.info[PRIMED_ROLES_KEY] = [
+            db.merge(role, load=False) for role in list(self._roles.values())
+        ]
+
+
+role_registry = RoleRegistry()
+on_tables_committed(role_registry.invalidate)
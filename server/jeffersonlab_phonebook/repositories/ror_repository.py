@@ -0,0 +1,84 @@
+from typing import Any, Iterable, Optional, Sequence
+
+from sqlalchemy import Row, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import RorOrganization, RorOrganizationName
+
+
+class RorOrganizationRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, ror_id: str) -> Optional[RorOrganization]:
+        return self.db.get(RorOrganization, ror_id)
+
+    def get_many(self, ror_ids: Iterable[str]) -> dict[str, RorOrganization]:
+        ids = set(ror_ids)
+        if not ids:
+            return {}
+        organizations = self.db.scalars(
+            select(RorOrganization).where(RorOrganization.ror_id.in_(ids))
+        )
+        return {organization.ror_id: organization for organization in organizations}
+
+    def suggest(self, search_key: str, limit: int = 10) -> Sequence[Row[Any]]:
+        """
+        Active organizations with a name, acronym or alias word starting with
+        `search_key` (already normalized). Matches at the start of a name
+        rank first, then shorter names.
+        """
+        matches = (
+            select(
+                RorOrganizationName.ror_id,
+                func.min(RorOrganizationName.word_position).label("word_position"),
+            )
+            .where(RorOrganizationName.search_key.startswith(search_key, autoescape=True))
+            .group_by(RorOrganizationName.ror_id)
+            .subquery()
+        )
+        return self.db.execute(
+            select(
+                RorOrganization.ror_id,
+                RorOrganization.full_name,
+                RorOrganization.short_name,
+                RorOrganization.city,
+                RorOrganization.country,
+            )
+            .join(matches, matches.c.ror_id == RorOrganization.ror_id)
+            .where(RorOrganization.status == "active")
+            .order_by(
+                matches.c.word_position,
+                func.length(RorOrganization.full_name),
+                RorOrganization.ror_id,
+            )
+            .limit(limit)
+        ).all()
+
+    def upsert_batch(
+        self, organizations: list[dict[str, Any]], names: list[dict[str, Any]]
+    ) -> None:
+        """
+        Inserts or replaces a batch of organizations and their search keys.
+        Rows are sent as multi-row INSERTs. Does not commit.
+        """
+        if not organizations:
+            return
+        stmt = insert(RorOrganization)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RorOrganization.ror_id],
+            set_={
+                column.name: stmt.excluded[column.name]
+                for column in RorOrganization.__table__.columns
+                if not column.primary_key
+            },
+        )
+        self.db.execute(stmt, organizations)
+        self.db.execute(
+            delete(RorOrganizationName).where(
+                RorOrganizationName.ror_id.in_([o["ror_id"] for o in organizations])
+            )
+        )
+        if names:
+            self.db.execute(insert(RorOrganizationName), names)
@@ -0,0 +1,253 @@
+from typing import Any, Callable
+
+from sqlalchemy import Result, Select, select
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import (
+    Conference,
+    Group,
+    GroupMember,
+    Institution,
+    InstitutionalBoardMember,
+    Member,
+    Role,
+    Talk,
+    TalkAssignment,
+)
+
+
+def _members() -> Select[Any]:
+    return select(
+        Member.id,
+        Member.first_name,
+        Member.last_name,
+        Member.email,
+        Member.orcid,
+        Member.preferred_author_name,
+        Member.institution_id,
+        Member.date_joined,
+        Member.date_left,
+        Member.is_active,
+    ).order_by(Member.id)
+
+
+def _institutions() -> Select[Any]:
+    return select(
+        Institution.id,
+        Institution.entityid,
+        Institution.rorid,
+        Institution.full_name,
+        Institution.short_name,
+        Institution.country,
+        Institution.region,
+        Institution.city,
+        Institution.latitude,
+        Institution.longitude,
+        Institution.date_added,
+        Institution.date_removed,
+        Institution.is_active,
+    ).order_by(Institution.id)
+
+
+def _group_memberships() -> Select[Any]:
+    return (
+        select(
+            GroupMember.id,
+            GroupMember.group_id,
+            Group.name.label("group_name"),
+            GroupMember.member_id,
+            GroupMember.role_id,
+            Role.name.label("role_name"),
+            GroupMember.start_date,
+            GroupMember.end_date,
+        )
+        .join(GroupMember.group)
+        .join(Role, Role.id == GroupMember.role_id)
+        .order_by(GroupMember.id)
+    )
+
+
+def _board_memberships() -> Select[Any]:
+    return (
+        select(
+            InstitutionalBoardMember.id,
+            InstitutionalBoardMember.member_id,
+            InstitutionalBoardMember.institution_id,
+            InstitutionalBoardMember.board_type,
+            InstitutionalBoardMember.role_id,
+            Role.name.label("role_name"),
+            InstitutionalBoardMember.start_date,
+            InstitutionalBoardMember.end_date,
+        )
+        .join(Role, Role.id == InstitutionalBoardMember.role_id)
+        .order_by(InstitutionalBoardMember.id)
+    )
+
+
+def _talk_assignments() -> Select[Any]:
+    return (
+        select(
+            TalkAssignment.id,
+            TalkAssignment.talk_id,
+            Talk.title.label("talk_title"),
+            Talk.start_date.label("talk_date"),
+            Talk.conference_id,
+            Conference.name.label("conference_name"),
+            TalkAssignment.member_id,
+            TalkAssignment.role_id,
+            Role.name.label("role_name"),
+            TalkAssignment.assigned_by_id,
+            TalkAssignment.assignment_date,
+        )
+        .join(Talk, Talk.id == TalkAssignment.talk_id)
+        .outerjoin(Conference, Conference.id == Talk.conference_id)
+        .join(Role, Role.id == TalkAssignment.role_id)
+        .order_by(TalkAssignment.id)
+    )
+
+
+# Flat, denormalized tables for analytics, by snapshot name.
+SNAPSHOT_QUERIES: dict[str, Callable[[], Select[Any]]] = {
+    "members": _members,
+    "institutions": _institutions,
+    "group_memberships": _group_memberships,
+    "board_memberships": _board_memberships,
+    "talk_assignments": _talk_assignments,
+}
+
+# The tables each snapshot is read from.
+SNAPSHOT_TABLES: dict[str, frozenset[str]] = {
+    "members": frozenset({Member.__tablename__}),
+    "institutions": frozenset({Institution.__tablename__}),
+    "group_memberships": frozenset(
+        {GroupMember.__tablename__, Group.__tablename__, Role.__tablename__}
+    ),
+    "board_memberships": frozenset(
+        {InstitutionalBoardMember.__tablename__, Role.__tablename__}
+    ),
+    "talk_assignments": frozenset(
+        {
+            TalkAssignment.__tablename__,
+            Talk.__tablename__,
+            Conference.__tablename__,
+            Role.__tablename__,
+        }
+    ),
+}
+
+
+def _active_institutions() -> Select[Any]:
+    return select(
+        Institution.id,
+        Institution.short_name,
+        Institution.full_name,
+        Institution.country,
+        Institution.region,
+        Institution.city,
+        Institution.address,
+        Institution.latitude,
+        Institution.longitude,
+        Institution.rorid,
+    ).where(Institution.is_active.is_(True))
+
+
+def _active_members() -> Select[Any]:
+    return select(
+        Member.id,
+        Member.first_name,
+        Member.last_name,
+        Member.email,
+        Member.orcid,
+        Member.preferred_author_name,
+        Member.institution_id,
+        Member.date_joined,
+    ).where(Member.is_active.is_(True), Member.date_left.is_(None))
+
+
+def _active_groups() -> Select[Any]:
+    return select(
+        Group.id,
+        Group.name,
+        Group.description,
+        Group.parent_group_id,
+    ).where(Group.is_active.is_(True))
+
+
+def _roles() -> Select[Any]:
+    return select(Role.id, Role.name, Role.description)
+
+
+def _current_group_members() -> Select[Any]:
+    return (
+        select(
+            GroupMember.id,
+            GroupMember.group_id,
+            GroupMember.member_id,
+            GroupMember.role_id,
+            GroupMember.start_date,
+        )
+        .join(GroupMember.group)
+        .join(GroupMember.member)
+        .where(
+            GroupMember.end_date.is_(None),
+            Group.is_active.is_(True),
+            Member.is_active.is_(True),
+            Member.date_left.is_(None),
+        )
+    )
+
+
+def _current_board_members() -> Select[Any]:
+    return (
+        select(
+            InstitutionalBoardMember.id,
+            InstitutionalBoardMember.member_id,
+            InstitutionalBoardMember.institution_id,
+            InstitutionalBoardMember.board_type,
+            InstitutionalBoardMember.role_id,
+            InstitutionalBoardMember.start_date,
+        )
+        .join(InstitutionalBoardMember.member)
+        .where(
+            InstitutionalBoardMember.end_date.is_(None),
+            Member.is_active.is_(True),
+            Member.date_left.is_(None),
+        )
+    )
+
+
+# The active directory for offline use, by table name in the SQLite file.
+DIRECTORY_QUERIES: dict[str, Callable[[], Select[Any]]] = {
+    "institutions": _active_institutions,
+    "members": _active_members,
+    "groups": _active_groups,
+    "roles": _roles,
+    "group_members": _current_group_members,
+    "board_members": _current_board_members,
+}
+
+# The tables each directory table is read from.
+DIRECTORY_TABLES: dict[str, frozenset[str]] = {
+    "institutions": frozenset({Institution.__tablename__}),
+    "members": frozenset({Member.__tablename__}),
+    "groups": frozenset({Group.__tablename__}),
+    "roles": frozenset({Role.__tablename__}),
+    "group_members": frozenset(
+        {GroupMember.__tablename__, Group.__tablename__, Member.__tablename__}
+    ),
+    "board_members": frozenset(
+        {InstitutionalBoardMember.__tablename__, Member.__tablename__}
+    ),
+}
+
+
+class SnapshotRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def stream(self, query: Select[Any], batch_size: int) -> Result[Any]:
+        """
+        Executes one of the snapshot queries on a server-side cursor; iterate
+        `partitions()` of the result to get `batch_size` rows at a time.
+        """
+        return self.db.execute(query.execution_options(yield_per=batch_size))
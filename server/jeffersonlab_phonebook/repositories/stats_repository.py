@@ -0,0 +1,105 @@
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Date, Row, cast, exists, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import (
+    Conference,
+    Group,
+    Institution,
+    Member,
+    Role,
+    Talk,
+    TalkAssignment,
+)
+from jeffersonlab_phonebook.schemas.stats_schemas import TalkPeriod
+
+# Tables the summary is computed from, used for cache invalidation.
+SUMMARY_TABLES = frozenset(
+    {
+        Member.__tablename__,
+        Institution.__tablename__,
+        Group.__tablename__,
+        Conference.__tablename__,
+        Talk.__tablename__,
+        TalkAssignment.__tablename__,
+    }
+)
+
+
+class StatsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_summary(self, today: date | None = None) -> dict[str, Any]:
+        """
+        Computes the dashboard counters in a single statement, one scalar
+        subquery per counter.
+        """
+        today = today or date.today()
+        has_assignment = exists().where(TalkAssignment.talk_id == Talk.id)
+        query = select(
+            select(func.count(Member.id))
+            .where(Member.is_active.is_(True))
+            .scalar_subquery()
+            .label("active_members"),
+            select(func.count(Institution.id))
+            .where(Institution.is_active.is_(True))
+            .scalar_subquery()
+            .label("active_institutions"),
+            select(func.count(Group.id))
+            .where(Group.is_active.is_(True))
+            .scalar_subquery()
+            .label("active_groups"),
+            select(func.count(Conference.id))
+            .where(Conference.start_date >= today)
+            .scalar_subquery()
+            .label("upcoming_conferences"),
+            select(func.count(Talk.id))
+            .where(~has_assignment)
+            .scalar_subquery()
+            .label("unassigned_talks"),
+        )
+        return dict(self.db.execute(query).one()._mapping)
+
+    def get_talk_allocation(
+        self,
+        period: TalkPeriod = TalkPeriod.YEAR,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> list[Row[Any]]:
+        """
+        Counts talk assignments per member, role and period (the talk start
+        date truncated to `period`), optionally restricted to talks starting
+        within [date_from, date_to].
+        """
+        # The period is an enum value, so it is safe to inline; a bind
+        # parameter would differ between SELECT and GROUP BY.
+        talk_period = cast(
+            func.date_trunc(literal_column(f"'{period.value}'"), Talk.start_date),
+            Date,
+        ).label("period")
+        query = (
+            select(
+                Member.id.label("member_id"),
+                (Member.first_name + " " + Member.last_name).label("member_name"),
+                Institution.id.label("institution_id"),
+                Institution.full_name.label("institution_name"),
+                Role.name.label("role"),
+                talk_period,
+                func.count(TalkAssignment.id).label("talks"),
+            )
+            .select_from(TalkAssignment)
+            .join(Talk, Talk.id == TalkAssignment.talk_id)
+            .join(Member, Member.id == TalkAssignment.member_id)
+            .join(Institution, Institution.id == Member.institution_id)
+            .join(Role, Role.id == TalkAssignment.role_id)
+            .group_by(Member.id, Institution.id, Role.name, talk_period)
+            .order_by(talk_period, Institution.full_name, Member.last_name, Role.name)
+        )
+        if date_from:
+            query = query.where(Talk.start_date >= date_from)
+        if date_to:
+            query = query.where(Talk.start_date <= date_to)
+        return list(self.db.execute(query).all())
@@ -0,0 +1,26 @@
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import TableVersion
+
+
+class TableVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_versions(self, tables: Iterable[str]) -> dict[str, int]:
+        """
+        Returns the write counter of each given table; tables that were never
+        written to are at version 0.
+        """
+        names = sorted(set(tables))
+        versions = dict.fromkeys(names, 0)
+        rows = self.db.execute(
+            select(TableVersion.table_name, TableVersion.version).where(
+                TableVersion.table_name.in_(names)
+            )
+        )
+        versions.update({name: version for name, version in rows})
+        return versions
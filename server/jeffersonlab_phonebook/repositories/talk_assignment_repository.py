@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError
 
 
 from jeffersonlab_phonebook.db.models import TalkAssignment
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
 from jeffersonlab_phonebook.schemas.conference_schemas import (
     TalkAssignmentCreate,
     TalkAssignmentUpdate
@@ -18,9 +19,11 @@ class TalkAssignmentRepository:
         self.db = db
 
     def get(self, assignment_id: int) -> Optional[TalkAssignment]:
+        role_registry.prime(self.db)
         return self.db.get(TalkAssignment, assignment_id)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> Sequence[TalkAssignment]:
+        role_registry.prime(self.db)
         query = select(TalkAssignment).offset(skip).limit(limit)
         return self.db.scalars(query).all()
 
@@ -35,6 +38,7 @@ class TalkAssignmentRepository:
         except IntegrityError as e:
             self.db.rollback()
             raise ValueError("This talk-member-role combination already exists.") from e
+        role_registry.prime(self.db)
         return assignment
 
     def update(self, db_assignment: TalkAssignment, assignment_in: TalkAssignmentUpdate) -> TalkAssignment:
@@ -44,6 +48,7 @@ class TalkAssignmentRepository:
         self.db.add(db_assignment)
         self.db.commit()
         self.db.refresh(db_assignment)
+        role_registry.prime(self.db)
         return db_assignment
 
     def delete(self, assignment_id: int) -> bool:
@@ -0,0 +1,29 @@
+import enum
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class AuthorListFormat(str, enum.Enum):
+    JSON = "json"
+    REVTEX = "revtex"
+    TEXT = "text"
+
+
+class AuthorListAffiliation(BaseModel):
+    """An affiliation, numbered in order of first appearance in the author list."""
+    number: int
+    institution_id: int
+    name: str
+
+
+class AuthorListAuthor(BaseModel):
+    member_id: int
+    name: str
+    orcid: Optional[str] = None
+    affiliations: List[int]
+
+
+class AuthorListResponse(BaseModel):
+    authors: List[AuthorListAuthor]
+    affiliations: List[AuthorListAffiliation]
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    """Hit/miss counters of the response cache for one route."""
+    hits: int
+    misses: int
+    hit_ratio: float
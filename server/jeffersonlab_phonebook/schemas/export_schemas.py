@@ -0,0 +1,17 @@
+import enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ExportFormat(str, enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class SnapshotStatus(BaseModel):
+    """A Parquet snapshot and whether its current version is ready to download."""
+    name: str
+    version: str
+    ready: bool
+    size_bytes: Optional[int] = None
@@ -0,0 +1,30 @@
+from typing import List, Literal, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class GeoPoint(BaseModel):
+    type: Literal["Point"] = "Point"
+    # GeoJSON order: longitude, latitude
+    coordinates: Tuple[float, float]
+
+
+class InstitutionFeatureProperties(BaseModel):
+    """
+    Properties of a map feature. A single institution carries its id and
+    name; a cluster only carries the number of institutions it groups.
+    """
+    id: Optional[int] = None
+    name: Optional[str] = None
+    count: int = 1
+
+
+class InstitutionFeature(BaseModel):
+    type: Literal["Feature"] = "Feature"
+    geometry: GeoPoint
+    properties: InstitutionFeatureProperties
+
+
+class InstitutionFeatureCollection(BaseModel):
+    type: Literal["FeatureCollection"] = "FeatureCollection"
+    features: List[InstitutionFeature]
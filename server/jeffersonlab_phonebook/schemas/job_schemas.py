@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from jeffersonlab_phonebook.db.constants import JobStatus
+
+
+class JobCountResponse(BaseModel):
+    kind: str
+    status: JobStatus
+    count: int
+
+
+class JobResponse(BaseModel):
+    """A background job; `result` is set once a job that reports one is done."""
+    id: int
+    kind: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    result: Optional[dict[str, Any]] = None
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,66 @@
+import enum
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+
+class MemberImportConflict(str, enum.Enum):
+    """What to do with a row whose email belongs to an existing member."""
+    SKIP = "skip"
+    UPDATE = "update"
+
+
+class MemberImportStatus(str, enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+    INVALID = "invalid"
+
+
+class MemberImportRow(BaseModel):
+    """
+    One member of a bulk import. The institution is given by ID, by its full
+    or short name, or by ROR ID. `date_joined` defaults to the import date.
+    New members are active unless `is_active` says otherwise; existing ones
+    updated by the import keep their flag when it is not given.
+    """
+    first_name: str
+    last_name: str
+    email: str
+    orcid: Optional[str] = None
+    preferred_author_name: Optional[str] = None
+    institution_id: Optional[int] = None
+    institution: Optional[str] = None
+    institution_ror: Optional[str] = None
+    date_joined: Optional[date] = None
+    date_left: Optional[date] = None
+    is_active: Optional[bool] = None
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @model_validator(mode="after")
+    def _has_institution(self) -> "MemberImportRow":
+        if (
+            self.institution_id is None
+            and not self.institution
+            and not self.institution_ror
+        ):
+            raise ValueError("one of institution_id, institution or institution_ror is required")
+        return self
+
+
+class MemberImportRowResult(BaseModel):
+    """The outcome of one row; `row` counts data rows from 1."""
+    row: int
+    email: Optional[str] = None
+    status: MemberImportStatus
+    member_id: Optional[int] = None
+    errors: List[str] = []
+
+
+class MemberImportResult(BaseModel):
+    created: int
+    updated: int
+    skipped: int
+    invalid: int
+    rows: List[MemberImportRowResult]
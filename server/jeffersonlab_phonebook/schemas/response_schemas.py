@@ -133,6 +133,11 @@ class InstitutionResponse(InstitutionBase):
     members: List["MemberLiteResponse"] = []
     board_memberships: List["InstitutionalBoardMemberResponse"] = []
     institution_memberships: List["MemberInstitutionHistoryResponse"] = []
+    # Full collection sizes when the collections above are capped; a
+    # collection shorter than its total was truncated.
+    members_total: Optional[int] = None
+    board_memberships_total: Optional[int] = None
+    institution_memberships_total: Optional[int] = None
     model_config = ConfigDict(from_attributes=True)
 
 
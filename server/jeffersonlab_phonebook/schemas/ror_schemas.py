@@ -0,0 +1,35 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+
+class RorSuggestion(BaseModel):
+    """An organization from the ROR dump matching a name search."""
+    ror_id: str
+    full_name: Optional[str] = None
+    short_name: Optional[str] = None
+    city: Optional[str] = None
+    country: Optional[str] = None
+
+
+class RorRefreshFailure(BaseModel):
+    institution_id: int
+    rorid: str
+    error: str
+
+
+class RorRefreshChange(BaseModel):
+    """New values of the fields that differ from the institution's row."""
+    institution_id: int
+    rorid: str
+    changes: dict[str, Any]
+
+
+class RorRefreshReport(BaseModel):
+    dry_run: bool
+    total: int
+    resolved_locally: int
+    fetched: int
+    unchanged: int
+    updated: List[RorRefreshChange]
+    failed: List[RorRefreshFailure]
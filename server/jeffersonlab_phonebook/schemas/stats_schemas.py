@@ -0,0 +1,45 @@
+import enum
+from datetime import date
+from typing import List
+
+from pydantic import BaseModel
+
+
+class TalkPeriod(str, enum.Enum):
+    YEAR = "year"
+    QUARTER = "quarter"
+    MONTH = "month"
+
+
+class StatsSummaryResponse(BaseModel):
+    """Collaboration-wide counters shown on the dashboard."""
+    active_members: int
+    active_institutions: int
+    active_groups: int
+    upcoming_conferences: int
+    unassigned_talks: int
+
+
+class MemberTalkCount(BaseModel):
+    """Number of talk assignments of a member in a given role and period."""
+    member_id: int
+    member_name: str
+    institution_id: int
+    institution_name: str
+    role: str
+    period: date
+    talks: int
+
+
+class InstitutionTalkCount(BaseModel):
+    """Number of talk assignments of an institution's members in a given role and period."""
+    institution_id: int
+    institution_name: str
+    role: str
+    period: date
+    talks: int
+
+
+class TalkAllocationResponse(BaseModel):
+    members: List[MemberTalkCount]
+    institutions: List[InstitutionTalkCount]
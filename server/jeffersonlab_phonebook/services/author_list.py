@@ -0,0 +1,146 @@
+import threading
+from typing import Any, Iterable, Union
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import Institution, Member, MemberInstitutionHistory
+from jeffersonlab_phonebook.repositories.member_repository import MemberRepository
+from jeffersonlab_phonebook.repositories.table_version_repository import (
+    TableVersionRepository,
+)
+from jeffersonlab_phonebook.schemas.author_list_schemas import (
+    AuthorListAffiliation,
+    AuthorListAuthor,
+    AuthorListFormat,
+    AuthorListResponse,
+)
+
+# Any write to these tables can change the author list.
+MEMBERSHIP_TABLES = frozenset(
+    {
+        Member.__tablename__,
+        Institution.__tablename__,
+        MemberInstitutionHistory.__tablename__,
+    }
+)
+
+_LATEX_SPECIAL_CHARS = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+
+
+def _latex_escape(value: str) -> str:
+    return "".join(_LATEX_SPECIAL_CHARS.get(char, char) for char in value)
+
+
+def _author_name(row: Row[Any]) -> str:
+    return row.preferred_author_name or f"{row.first_name} {row.last_name}"
+
+
+def _affiliation_name(row: Row[Any]) -> str:
+    return ", ".join(part for part in (row.full_name, row.city, row.country) if part)
+
+
+def build_author_list(rows: Iterable[Row[Any]]) -> AuthorListResponse:
+    """
+    Builds the author list from rows ordered by author, one row per
+    (member, affiliation) pair. Affiliations are numbered once, in order of
+    first appearance, in a single pass over the rows.
+    """
+    authors: list[AuthorListAuthor] = []
+    affiliations: dict[int, AuthorListAffiliation] = {}
+    current: AuthorListAuthor | None = None
+
+    for row in rows:
+        if current is None or current.member_id != row.member_id:
+            current = AuthorListAuthor(
+                member_id=row.member_id,
+                name=_author_name(row),
+                orcid=row.orcid,
+                affiliations=[],
+            )
+            authors.append(current)
+
+        affiliation = affiliations.get(row.institution_id)
+        if affiliation is None:
+            affiliation = AuthorListAffiliation(
+                number=len(affiliations) + 1,
+                institution_id=row.institution_id,
+                name=_affiliation_name(row),
+            )
+            affiliations[row.institution_id] = affiliation
+        if affiliation.number not in current.affiliations:
+            current.affiliations.append(affiliation.number)
+
+    return AuthorListResponse(authors=authors, affiliations=list(affiliations.values()))
+
+
+def render_revtex(author_list: AuthorListResponse) -> str:
+    """
+    Renders the list as REVTeX front matter. REVTeX numbers repeated
+    \\affiliation entries itself, so each author simply lists theirs.
+    """
+    names = {a.number: _latex_escape(a.name) for a in author_list.affiliations}
+    lines: list[str] = []
+    for author in author_list.authors:
+        lines.append(f"\\author{{{_latex_escape(author.name)}}}")
+        lines.extend(f"\\affiliation{{{names[n]}}}" for n in author.affiliations)
+    return "\n".join(lines) + "\n"
+
+
+def render_text(author_list: AuthorListResponse) -> str:
+    """
+    Renders the list as plain text: authors with affiliation numbers, then the
+    numbered affiliations.
+    """
+    authors = ", ".join(
+        f"{author.name}{','.join(str(n) for n in author.affiliations)}"
+        for author in author_list.authors
+    )
+    affiliations = "\n".join(f"{a.number} {a.name}" for a in author_list.affiliations)
+    return f"{authors}\n\n{affiliations}\n"
+
+
+class AuthorListCache:
+    """
+    Keeps the most recently built author list in each format, tagged with the
+    membership version it was built from.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[AuthorListFormat, tuple[dict[str, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, fmt: AuthorListFormat) -> Union[AuthorListResponse, str]:
+        # Read the version before building so that a write committed while we
+        # build leaves the entry stale rather than wrongly fresh.
+        version = TableVersionRepository(db).get_versions(MEMBERSHIP_TABLES)
+        with self._lock:
+            entry = self._entries.get(fmt)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        author_list = build_author_list(MemberRepository(db).iter_author_affiliations())
+        result: Union[AuthorListResponse, str]
+        if fmt is AuthorListFormat.REVTEX:
+            result = render_revtex(author_list)
+        elif fmt is AuthorListFormat.TEXT:
+            result = render_text(author_list)
+        else:
+            result = author_list
+        with self._lock:
+            self._entries[fmt] = (version, result)
+        return result
+
+
+author_list_cache = AuthorListCache()
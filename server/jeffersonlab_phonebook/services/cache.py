@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable
+
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.repositories.table_version_repository import (
+    TableVersionRepository,
+)
+
+
+class TableVersionedCache:
+    """
+    In-process cache whose entries are stamped with the `table_versions`
+    counters of the tables they were computed from. The counters are read
+    from the database on every lookup, so a write committed by any worker
+    turns the entries built before it into misses. At most `max_entries`
+    keys are kept; the least recently used are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[tuple[tuple[str, int], ...], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self, db: Session, key: str, tables: Iterable[str], loader: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the cached value for `key`, calling `loader` on a miss.
+        `tables` lists the tables the value depends on.
+        """
+        # Read before loading, so a value is never stamped with versions
+        # newer than the data it was computed from.
+        stamp = tuple(sorted(TableVersionRepository(db).get_versions(tables).items()))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+stats_cache = TableVersionedCache()
@@ -0,0 +1,246 @@
+"""
+Streaming exports of the whole directory.
+
+Rows are read from a server-side cursor in batches and written out in chunks
+of about CHUNK_SIZE bytes, so memory use stays flat however many members
+there are. The generators open their own session: a StreamingResponse is
+iterated after the route has returned, when the request's session may
+already be closed.
+
+Besides NDJSON and CSV, members can be exported as vCard 4.0 (RFC 6350) for
+address books and as LDIF (RFC 2849) inetOrgPerson entries for LDAP
+directories.
+"""
+
+import base64
+import csv
+import io
+import uuid
+from typing import Any, Iterable, Iterator, Optional
+
+from pydantic_core import to_json
+from sqlalchemy import Row
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.db.session import SessionLocal
+from jeffersonlab_phonebook.repositories.member_repository import MemberRepository
+
+CHUNK_SIZE = 64 * 1024
+BATCH_SIZE = 1000
+
+
+def _chunked(parts: Iterable[bytes]) -> Iterator[bytes]:
+    """Joins small byte strings into chunks of at least CHUNK_SIZE bytes."""
+    buffer: list[bytes] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _rows(
+    batch_size: int,
+    group_id: Optional[int],
+    institution_id: Optional[int],
+    active_only: bool = False,
+) -> Iterator[Row[Any]]:
+    with SessionLocal() as db:
+        yield from MemberRepository(db).stream_export(
+            batch_size,
+            group_id=group_id,
+            institution_id=institution_id,
+            active_only=active_only,
+        )
+
+
+def iter_members_ndjson(
+    batch_size: int = BATCH_SIZE,
+    group_id: Optional[int] = None,
+    institution_id: Optional[int] = None,
+) -> Iterator[bytes]:
+    """One JSON object per member and line."""
+    return _chunked(
+        to_json(row._asdict()) + b"\n"
+        for row in _rows(batch_size, group_id, institution_id)
+    )
+
+
+def iter_members_csv(
+    batch_size: int = BATCH_SIZE,
+    group_id: Optional[int] = None,
+    institution_id: Optional[int] = None,
+) -> Iterator[bytes]:
+    """A header line, then one line per member."""
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    with SessionLocal() as db:
+        result = MemberRepository(db).stream_export(
+            batch_size, group_id=group_id, institution_id=institution_id
+        )
+        writer.writerow(result.keys())
+        for row in result:
+            writer.writerow(row)
+            if buffer.tell() >= CHUNK_SIZE:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _display_name(row: Row[Any]) -> str:
+    return row.preferred_author_name or f"{row.first_name} {row.last_name}"
+
+
+def _vcard_text(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(",", "\\,")
+        .replace(";", "\\;")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _vcard_line(line: str) -> bytes:
+    """
+    A content line folded after 75 octets, as RFC 6350 requires, without
+    splitting a UTF-8 sequence.
+    """
+    data = line.encode()
+    if len(data) <= 75:
+        return data + b"\r\n"
+    parts = []
+    start, limit = 0, 75
+    while len(data) - start > limit:
+        end = start + limit
+        while data[end] & 0xC0 == 0x80:  # continuation byte
+            end -= 1
+        parts.append(data[start:end])
+        start, limit = end, 74  # after the leading space
+    parts.append(data[start:])
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _vcard(row: Row[Any]) -> bytes:
+    uid = uuid.uuid5(uuid.NAMESPACE_URL, f"{settings.PROJECT_NAME}/members/{row.id}")
+    lines = [
+        "BEGIN:VCARD",
+        "VERSION:4.0",
+        f"UID:urn:uuid:{uid}",
+        f"FN:{_vcard_text(_display_name(row))}",
+        f"N:{_vcard_text(row.last_name)};{_vcard_text(row.first_name)};;;",
+        f"EMAIL;TYPE=work:{_vcard_text(row.email)}",
+        f"ORG:{_vcard_text(row.institution_full_name)}",
+        "ADR;TYPE=work:;;"
+        + ";".join(
+            _vcard_text(value)
+            for value in (
+                row.institution_address,
+                row.institution_city,
+                row.institution_region,
+                None,  # postal code
+                row.institution_country,
+            )
+        ),
+    ]
+    if row.orcid:
+        lines.append(f"URL:https://orcid.org/{row.orcid}")
+    lines.append("END:VCARD")
+    return b"".join(_vcard_line(line) for line in lines)
+
+
+def iter_members_vcard(
+    batch_size: int = BATCH_SIZE,
+    group_id: Optional[int] = None,
+    institution_id: Optional[int] = None,
+) -> Iterator[bytes]:
+    """One vCard 4.0 per active member."""
+    return _chunked(
+        _vcard(row) for row in _rows(batch_size, group_id, institution_id, active_only=True)
+    )
+
+
+def _ldif_safe(value: str) -> bool:
+    """Whether RFC 2849 allows the value as a plain SAFE-STRING."""
+    if not value:
+        return True
+    if value[0] in " :<" or value[-1] == " ":
+        return False
+    return all(0 < ord(char) < 128 and char not in "\r\n" for char in value)
+
+
+def _ldif_line(attribute: str, value: str) -> str:
+    """An attribute line, base64 encoded if needed and folded at 76 columns."""
+    if _ldif_safe(value):
+        line = f"{attribute}: {value}"
+    else:
+        line = f"{attribute}:: {base64.b64encode(value.encode()).decode()}"
+    if len(line) <= 76:
+        return line + "\n"
+    parts = [line[:76]]
+    parts.extend(line[i : i + 75] for i in range(76, len(line), 75))
+    return "\n ".join(parts) + "\n"
+
+
+def _postal_address(*lines: Optional[str]) -> str:
+    """RFC 4517 PostalAddress: lines joined with "$", which is escaped."""
+    return "$".join(
+        line.replace("\\", "\\5C").replace("$", "\\24") for line in lines if line
+    )
+
+
+def _ldif(row: Row[Any]) -> bytes:
+    uid = f"member-{row.id}"
+    attributes = [
+        ("dn", f"uid={uid},{settings.LDIF_BASE_DN}"),
+        ("objectClass", "top"),
+        ("objectClass", "person"),
+        ("objectClass", "organizationalPerson"),
+        ("objectClass", "inetOrgPerson"),
+        ("uid", uid),
+        ("cn", _display_name(row)),
+        ("sn", row.last_name),
+        ("givenName", row.first_name),
+        ("mail", row.email),
+        ("o", row.institution_full_name),
+        ("l", row.institution_city),
+        ("st", row.institution_region),
+        (
+            "postalAddress",
+            _postal_address(
+                row.institution_full_name,
+                row.institution_address,
+                row.institution_city,
+                row.institution_region,
+                row.institution_country,
+            ),
+        ),
+    ]
+    if row.orcid:
+        attributes.append(("labeledURI", f"https://orcid.org/{row.orcid} ORCID"))
+    entry = "".join(_ldif_line(name, value) for name, value in attributes if value)
+    return (entry + "\n").encode()
+
+
+def iter_members_ldif(
+    batch_size: int = BATCH_SIZE,
+    group_id: Optional[int] = None,
+    institution_id: Optional[int] = None,
+) -> Iterator[bytes]:
+    """A version line, then one inetOrgPerson entry per active member."""
+
+    def entries() -> Iterator[bytes]:
+        yield b"version: 1\n\n"
+        for row in _rows(batch_size, group_id, institution_id, active_only=True):
+            yield _ldif(row)
+
+    return _chunked(entries())
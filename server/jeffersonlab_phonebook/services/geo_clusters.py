@@ -0,0 +1,121 @@
+import math
+import threading
+from typing import Any, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import Institution
+from jeffersonlab_phonebook.repositories.institution_repository import (
+    InstitutionRepository,
+)
+from jeffersonlab_phonebook.repositories.table_version_repository import (
+    TableVersionRepository,
+)
+
+# Deeper zoom levels reuse this one; its cells are only ~150 m wide.
+MAX_CLUSTER_ZOOM = 16
+# Institutions closer than this many pixels on a 256px map tile are merged.
+CLUSTER_CELL_PIXELS = 64
+TILE_PIXELS = 256
+COORDINATE_DECIMALS = 5
+
+
+class GeoCluster(NamedTuple):
+    longitude: float
+    latitude: float
+    count: int
+    # Only set when the cluster holds a single institution.
+    id: Optional[int] = None
+    name: Optional[str] = None
+
+
+def _point(row: Row[Any]) -> GeoCluster:
+    return GeoCluster(
+        longitude=round(row.longitude, COORDINATE_DECIMALS),
+        latitude=round(row.latitude, COORDINATE_DECIMALS),
+        count=1,
+        id=row.id,
+        name=row.short_name,
+    )
+
+
+def cluster_points(rows: Sequence[Row[Any]], zoom: int) -> list[GeoCluster]:
+    """
+    Grid-based clustering: points falling in the same cell of a grid sized for
+    `zoom` are merged into one cluster placed at their centroid.
+    """
+    cell = 360.0 / (2**zoom) * CLUSTER_CELL_PIXELS / TILE_PIXELS
+    cells: dict[tuple[int, int], list[Row[Any]]] = {}
+    for row in rows:
+        key = (
+            math.floor((row.longitude + 180.0) / cell),
+            math.floor((row.latitude + 90.0) / cell),
+        )
+        cells.setdefault(key, []).append(row)
+
+    clusters = []
+    for members in cells.values():
+        if len(members) == 1:
+            clusters.append(_point(members[0]))
+            continue
+        clusters.append(
+            GeoCluster(
+                longitude=round(
+                    sum(r.longitude for r in members) / len(members), COORDINATE_DECIMALS
+                ),
+                latitude=round(
+                    sum(r.latitude for r in members) / len(members), COORDINATE_DECIMALS
+                ),
+                count=len(members),
+            )
+        )
+    return clusters
+
+
+def _in_bbox(cluster: GeoCluster, bbox: tuple[float, float, float, float]) -> bool:
+    min_lon, min_lat, max_lon, max_lat = bbox
+    if not min_lat <= cluster.latitude <= max_lat:
+        return False
+    if min_lon <= max_lon:
+        return min_lon <= cluster.longitude <= max_lon
+    return cluster.longitude >= min_lon or cluster.longitude <= max_lon
+
+
+class InstitutionClusterIndex:
+    """
+    Clusters of institutions for every zoom level up to MAX_CLUSTER_ZOOM,
+    recomputed once after the institutions table changes.
+    """
+
+    def __init__(self) -> None:
+        self._version: Optional[dict[str, int]] = None
+        self._levels: list[list[GeoCluster]] = []
+        self._lock = threading.Lock()
+
+    def _levels_for(self, db: Session) -> list[list[GeoCluster]]:
+        version = TableVersionRepository(db).get_versions({Institution.__tablename__})
+        with self._lock:
+            if self._version == version:
+                return self._levels
+            rows = InstitutionRepository(db).get_geo_points()
+            self._levels = [
+                cluster_points(rows, zoom) for zoom in range(MAX_CLUSTER_ZOOM + 1)
+            ]
+            self._version = version
+            return self._levels
+
+    def get(
+        self,
+        db: Session,
+        zoom: int,
+        bbox: Optional[tuple[float, float, float, float]] = None,
+    ) -> list[GeoCluster]:
+        levels = self._levels_for(db)
+        clusters = levels[min(zoom, MAX_CLUSTER_ZOOM)]
+        if bbox is None:
+            return clusters
+        return [c for c in clusters if _in_bbox(c, bbox)]
+
+
+institution_clusters = InstitutionClusterIndex()
@@ -0,0 +1,201 @@
+"""
+In-process background jobs persisted in the `jobs` table.
+
+Request handlers queue work with `enqueue` in their own transaction, so a
+job exists exactly when the change that needs it is committed. A pool of
+worker threads claims due jobs (FOR UPDATE SKIP LOCKED, so several
+processes can share the queue), runs the handler registered for the job's
+kind and retries failures with exponential backoff. Queued jobs survive
+restarts. While a handler runs, its worker renews the job's lock every
+third of JOB_LOCK_TIMEOUT_SECONDS; jobs whose lock was not renewed in that
+time, e.g. left running by a dead worker, are claimed again. A worker whose
+claim was taken over that way discards its result instead of completing
+the job twice.
+"""
+
+import logging
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.db.events import on_tables_committed, skip_table_versions
+from jeffersonlab_phonebook.db.models import Job
+from jeffersonlab_phonebook.db.session import SessionLocal
+from jeffersonlab_phonebook.repositories.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+# Handlers get a session and the job payload. Changes they make are
+# committed by the worker together with the job's completion, and what they
+# return is stored as the job's result.
+JobHandler = Callable[[Session, dict[str, Any]], Optional[dict[str, Any]]]
+
+_handlers: dict[str, JobHandler] = {}
+
+# The queue is written on every claim; caching on it would be pointless.
+skip_table_versions(Job.__tablename__)
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying the job cannot succeed."""
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Registers the decorated function as the handler for jobs of `kind`."""
+
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: dict[str, Any],
+    max_attempts: Optional[int] = None,
+    delay: Optional[timedelta] = None,
+) -> Job:
+    """
+    Queues a job in the caller's session; it becomes visible to workers when
+    the caller commits, and runs no sooner than `delay` after now.
+    """
+    if kind not in _handlers:
+        raise ValueError(f"No handler registered for job kind '{kind}'")
+    return JobRepository(db).enqueue(
+        kind,
+        payload,
+        max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_after=datetime.now(timezone.utc) + delay if delay else None,
+    )
+
+
+def retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, in seconds, after the given attempt."""
+    delay = min(
+        settings.JOB_RETRY_MAX_SECONDS, settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempt - 1)
+    )
+    return delay * random.uniform(0.5, 1.5)
+
+
+class JobWorkerPool:
+    """A fixed number of worker threads polling the jobs table."""
+
+    def __init__(
+        self,
+        workers: int,
+        poll_interval: float,
+        lock_timeout: timedelta,
+    ) -> None:
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lock_timeout = lock_timeout
+        self._threads: list[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def start(self) -> None:
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Lets running jobs finish and stops the workers."""
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def wake(self, tables: frozenset[str] = frozenset()) -> None:
+        """Ends the workers' poll wait, e.g. right after a job is queued."""
+        if not tables or Job.__tablename__ in tables:
+            self._wake.set()
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_next()
+            except Exception:
+                # e.g. the database is unreachable; try again after a pause.
+                logger.exception("Job worker failed to claim a job")
+                ran = False
+            if not ran:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def run_next(self) -> bool:
+        """Claims and runs one due job. Returns False if none was due."""
+        with SessionLocal() as db:
+            repo = JobRepository(db)
+            job = repo.claim(self.lock_timeout)
+            if job is None:
+                return False
+            job_id, kind, payload = job.id, job.kind, job.payload
+            attempts, max_attempts = job.attempts, job.max_attempts
+
+            handler = _handlers.get(kind)
+            finished = threading.Event()
+            heartbeat = threading.Thread(
+                target=self._heartbeat,
+                args=(job_id, attempts, finished),
+                name=f"job-heartbeat-{job_id}",
+                daemon=True,
+            )
+            heartbeat.start()
+            try:
+                if handler is None:
+                    raise PermanentJobError(f"No handler registered for job kind '{kind}'")
+                result = handler(db, payload)
+                if repo.mark_done(job_id, attempts, result):
+                    db.commit()
+                else:
+                    db.rollback()
+                    logger.warning(
+                        "Job %s (%s) attempt %s finished after it was claimed "
+                        "again; its changes were discarded",
+                        job_id, kind, attempts,
+                    )
+            except Exception as e:
+                db.rollback()
+                permanent = isinstance(e, PermanentJobError) or attempts >= max_attempts
+                logger.warning(
+                    "Job %s (%s) attempt %s/%s failed: %s",
+                    job_id, kind, attempts, max_attempts, e,
+                )
+                repo.mark_failed(
+                    job_id, attempts, repr(e), None if permanent else retry_delay(attempts)
+                )
+            finally:
+                finished.set()
+                heartbeat.join()
+        return True
+
+    def _heartbeat(self, job_id: int, attempt: int, finished: threading.Event) -> None:
+        """Renews the job's lock until `finished` is set or the claim ends."""
+        interval = self.lock_timeout.total_seconds() / 3
+        while not finished.wait(interval):
+            try:
+                with SessionLocal() as db:
+                    if not JobRepository(db).heartbeat(job_id, attempt):
+                        return
+            except Exception:
+                # The next beat may still be in time.
+                logger.exception("Job %s heartbeat failed", job_id)
+
+
+job_workers = JobWorkerPool(
+    workers=settings.JOB_WORKERS,
+    poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+    lock_timeout=timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS),
+)
+on_tables_committed(job_workers.wake)
@@ -0,0 +1,79 @@
+import smtplib
+from contextlib import contextmanager
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Iterator, Optional
+
+from jeffersonlab_phonebook.config.settings import settings
+
+
+class SmtpMailer:
+    """
+    Sends mail through one SMTP server. A batch of messages is sent over a
+    single connection opened with `connection()`.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        from_email: str,
+        from_name: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        tls: bool = False,
+        ssl: bool = False,
+        timeout: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.sender = formataddr((from_name or "", from_email))
+        self.user = user
+        self.password = password
+        self.tls = tls
+        self.ssl = ssl
+        self.timeout = timeout
+
+    def message(self, to: str, subject: str, body: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = to
+        message["Subject"] = subject
+        message.set_content(body)
+        return message
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        smtp: smtplib.SMTP
+        if self.ssl:
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.tls and not self.ssl:
+                smtp.starttls()
+            if self.user:
+                smtp.login(self.user, self.password or "")
+            yield smtp
+        finally:
+            try:
+                smtp.quit()
+            except smtplib.SMTPException:
+                smtp.close()
+
+
+def get_mailer() -> Optional[SmtpMailer]:
+    """The mailer configured in settings, or None when email is disabled."""
+    if not settings.emails_enabled:
+        return None
+    assert settings.SMTP_HOST and settings.EMAILS_FROM_EMAIL
+    return SmtpMailer(
+        host=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        from_email=settings.EMAILS_FROM_EMAIL,
+        from_name=settings.EMAILS_FROM_NAME,
+        user=settings.SMTP_USER,
+        password=settings.SMTP_PASSWORD,
+        tls=settings.SMTP_TLS,
+        ssl=settings.SMTP_SSL,
+    )
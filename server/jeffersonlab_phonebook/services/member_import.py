@@ -0,0 +1,178 @@
+"""
+Bulk import of members, e.g. when onboarding an institution.
+
+Every row is validated first and problems are reported per row instead of
+failing the import. Institutions named by name or ROR ID are resolved for
+all rows at once, and the valid rows are written with multi-row
+INSERT ... ON CONFLICT (email) statements in the caller's transaction.
+"""
+
+import csv
+import io
+from datetime import date
+from typing import Any, Optional, Sequence
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.repositories.institution_repository import (
+    InstitutionRepository,
+)
+from jeffersonlab_phonebook.repositories.member_repository import MemberRepository
+from jeffersonlab_phonebook.schemas.member_import_schemas import (
+    MemberImportConflict,
+    MemberImportResult,
+    MemberImportRow,
+    MemberImportRowResult,
+    MemberImportStatus,
+)
+from jeffersonlab_phonebook.services.ror_api_client import normalize_ror_id
+
+
+def parse_members_csv(text: str) -> list[dict[str, Any]]:
+    """
+    The rows of a CSV file with a header line naming MemberImportRow fields.
+    Empty cells are left out, so that optional fields take their defaults.
+    """
+    return [
+        {key.strip(): value for key, value in row.items() if key and value}
+        for row in csv.DictReader(io.StringIO(text))
+    ]
+
+
+def _errors(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" if e["loc"] else e["msg"]
+        for e in error.errors()
+    ]
+
+
+class _InstitutionResolver:
+    """Looks up the institutions referred to by all rows with a few queries."""
+
+    def __init__(self, db: Session, rows: Sequence[MemberImportRow]) -> None:
+        repo = InstitutionRepository(db)
+        ids = {row.institution_id for row in rows if row.institution_id is not None}
+        self.ids = repo.existing_ids(ids) if ids else set()
+
+        self.rorids: dict[str, int] = {}
+        if any(row.institution_ror for row in rows if row.institution_id is None):
+            for institution in repo.get_ror_linked(()):
+                self.rorids[normalize_ror_id(institution.rorid)] = institution.id
+
+        names = {
+            row.institution
+            for row in rows
+            if row.institution and row.institution_id is None and not row.institution_ror
+        }
+        # A name may match several institutions, e.g. a shared short name.
+        self.names: dict[str, set[int]] = {}
+        for institution in repo.get_by_names(names) if names else ():
+            for name in {institution.full_name, institution.short_name} & names:
+                self.names.setdefault(name, set()).add(institution.id)
+
+    def resolve(self, row: MemberImportRow) -> tuple[Optional[int], Optional[str]]:
+        """The institution's ID, or None and the reason it was not found."""
+        if row.institution_id is not None:
+            if row.institution_id in self.ids:
+                return row.institution_id, None
+            return None, f"institution_id: no institution with ID {row.institution_id}"
+        if row.institution_ror:
+            institution_id = self.rorids.get(normalize_ror_id(row.institution_ror))
+            if institution_id is None:
+                return None, f"institution_ror: no institution with ROR ID {row.institution_ror}"
+            return institution_id, None
+        matches = self.names.get(row.institution or "", set())
+        if len(matches) == 1:
+            return next(iter(matches)), None
+        if matches:
+            return None, f"institution: '{row.institution}' matches several institutions"
+        return None, f"institution: no institution named '{row.institution}'"
+
+
+def import_members(
+    db: Session,
+    records: Sequence[Any],
+    on_conflict: MemberImportConflict = MemberImportConflict.SKIP,
+) -> MemberImportResult:
+    """
+    Validates and writes `records` (MemberImportRow-shaped dicts) without
+    committing. Rows with an email already used by an earlier row of the
+    same import are invalid.
+    """
+    results: list[MemberImportRowResult] = []
+    valid: list[tuple[MemberImportRowResult, MemberImportRow]] = []
+    seen: dict[str, int] = {}
+    for number, record in enumerate(records, start=1):
+        result = MemberImportRowResult(row=number, status=MemberImportStatus.INVALID)
+        results.append(result)
+        if isinstance(record, dict) and isinstance(record.get("email"), str):
+            result.email = record["email"].strip()
+        try:
+            row = MemberImportRow.model_validate(record)
+        except ValidationError as e:
+            result.errors = _errors(e)
+            continue
+        if row.email in seen:
+            result.errors = [f"email: already used by row {seen[row.email]}"]
+            continue
+        seen[row.email] = number
+        valid.append((result, row))
+
+    resolver = _InstitutionResolver(db, [row for _, row in valid])
+    today = date.today()
+    to_write: list[tuple[MemberImportRowResult, dict[str, Any]]] = []
+    for result, row in valid:
+        institution_id, error = resolver.resolve(row)
+        if institution_id is None:
+            result.errors = [error or "institution: not found"]
+            continue
+        values: dict[str, Any] = {
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "email": row.email,
+            "orcid": row.orcid,
+            "preferred_author_name": row.preferred_author_name,
+            "institution_id": institution_id,
+            "date_joined": row.date_joined or today,
+            "date_left": row.date_left,
+            "experimental_data": {},
+        }
+        if row.is_active is not None:
+            values["is_active"] = row.is_active
+        to_write.append((result, values))
+
+    repo = MemberRepository(db)
+    written: dict[str, Any] = {}
+    # bulk_upsert needs rows with the same keys, so rows that set the active
+    # flag are written apart from those that leave it to its default.
+    for has_flag in (True, False):
+        rows = [values for _, values in to_write if ("is_active" in values) is has_flag]
+        if rows:
+            for member in repo.bulk_upsert(
+                rows, update_existing=on_conflict is MemberImportConflict.UPDATE
+            ):
+                written[member.email] = member
+    skipped = [values["email"] for _, values in to_write if values["email"] not in written]
+    existing = repo.ids_by_email(skipped) if skipped else {}
+    for result, values in to_write:
+        member = written.get(values["email"])
+        if member is None:
+            result.status = MemberImportStatus.SKIPPED
+            result.member_id = existing.get(values["email"])
+        else:
+            result.status = (
+                MemberImportStatus.CREATED if member.inserted else MemberImportStatus.UPDATED
+            )
+            result.member_id = member.id
+
+    counts = {status: 0 for status in MemberImportStatus}
+    for result in results:
+        counts[result.status] += 1
+    return MemberImportResult(
+        created=counts[MemberImportStatus.CREATED],
+        updated=counts[MemberImportStatus.UPDATED],
+        skipped=counts[MemberImportStatus.SKIPPED],
+        invalid=counts[MemberImportStatus.INVALID],
+        rows=results,
+    )
@@ -0,0 +1,188 @@
+"""
+Email notifications for talk assignments, group additions and board
+appointments.
+
+`notify` stores a pending notification in the caller's transaction and
+makes sure a dispatch job is queued NOTIFICATION_DIGEST_DELAY_SECONDS
+ahead. The dispatch job sends everything pending at that point: the events
+of each member are coalesced into one digest and all digests go out over a
+single SMTP connection. A digest the server rejects (e.g. an unknown
+recipient) marks that member's notifications failed; the others still go
+out.
+"""
+
+import logging
+import smtplib
+from datetime import timedelta
+from email.message import EmailMessage
+from itertools import groupby
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.db.models import (
+    Group,
+    Institution,
+    Member,
+    Notification,
+    Talk,
+)
+from jeffersonlab_phonebook.repositories.job_repository import JobRepository
+from jeffersonlab_phonebook.repositories.notification_repository import (
+    NotificationRepository,
+)
+from jeffersonlab_phonebook.repositories.role_registry import role_registry
+from jeffersonlab_phonebook.services.jobs import enqueue, job_handler
+from jeffersonlab_phonebook.services.mailer import SmtpMailer, get_mailer
+
+TALK_ASSIGNED = "talk_assigned"
+GROUP_ADDED = "group_added"
+BOARD_APPOINTED = "board_appointed"
+
+DISPATCH_JOB = "notifications.dispatch"
+
+# Errors about one message or recipient; the connection stays usable.
+REJECTED_MESSAGE_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError)
+
+logger = logging.getLogger(__name__)
+
+
+def notify(db: Session, member_id: int, kind: str, payload: dict[str, Any]) -> None:
+    """
+    Queues a notification for a member without committing. Does nothing when
+    email is not configured.
+    """
+    if not settings.emails_enabled:
+        return
+    NotificationRepository(db).add(member_id, kind, payload)
+    if not JobRepository(db).has_queued(DISPATCH_JOB):
+        enqueue(
+            db,
+            DISPATCH_JOB,
+            {},
+            delay=timedelta(seconds=settings.NOTIFICATION_DIGEST_DELAY_SECONDS),
+        )
+
+
+def _role_name(role_id: int) -> str:
+    role = role_registry.get(role_id)
+    return role.name if role else "member"
+
+
+class _Describer:
+    """Renders notifications as sentences, loading what they refer to in bulk."""
+
+    def __init__(self, db: Session, notifications: Sequence[Notification]) -> None:
+        def ids(kind: str, key: str) -> set[int]:
+            return {n.payload[key] for n in notifications if n.kind == kind}
+
+        talk_ids = ids(TALK_ASSIGNED, "talk_id")
+        group_ids = ids(GROUP_ADDED, "group_id")
+        institution_ids = ids(BOARD_APPOINTED, "institution_id")
+        self.talks = {
+            talk.id: talk
+            for talk in db.scalars(
+                select(Talk)
+                .where(Talk.id.in_(talk_ids))
+                .options(joinedload(Talk.conference))
+            )
+        } if talk_ids else {}
+        self.groups = {
+            group.id: group
+            for group in db.scalars(select(Group).where(Group.id.in_(group_ids)))
+        } if group_ids else {}
+        self.institutions = {
+            institution.id: institution
+            for institution in db.scalars(
+                select(Institution).where(Institution.id.in_(institution_ids))
+            )
+        } if institution_ids else {}
+
+    def describe(self, notification: Notification) -> Optional[str]:
+        """None when what the notification refers to no longer exists."""
+        payload = notification.payload
+        role = _role_name(payload["role_id"])
+        if notification.kind == TALK_ASSIGNED:
+            talk = self.talks.get(payload["talk_id"])
+            if talk is None:
+                return None
+            where = f" at {talk.conference.name}" if talk.conference else ""
+            return (
+                f'You have been assigned as {role} for the talk "{talk.title}"'
+                f"{where} on {talk.start_date.isoformat()}."
+            )
+        if notification.kind == GROUP_ADDED:
+            group = self.groups.get(payload["group_id"])
+            if group is None:
+                return None
+            return f"You have been added to the {group.name} group as {role}."
+        if notification.kind == BOARD_APPOINTED:
+            institution = self.institutions.get(payload["institution_id"])
+            if institution is None:
+                return None
+            return (
+                f"You have been appointed {role} on the {payload['board_type']} "
+                f"board of {institution.full_name}."
+            )
+        return None
+
+
+def build_digest(mailer: SmtpMailer, member: Member, lines: list[str]) -> EmailMessage:
+    """One email listing every event for the member."""
+    if len(lines) == 1:
+        subject = f"{settings.PROJECT_NAME}: {lines[0]}"
+    else:
+        subject = f"{settings.PROJECT_NAME}: {len(lines)} updates"
+    body = "\n".join(
+        [f"Hello {member.first_name},", "", *(f"- {line}" for line in lines), ""]
+    )
+    return mailer.message(member.email, subject, body)
+
+
+@job_handler(DISPATCH_JOB)
+def dispatch_notifications(db: Session, payload: dict[str, Any]) -> None:
+    mailer = get_mailer()
+    if mailer is None:
+        return
+    repo = NotificationRepository(db)
+    pending = repo.lock_pending(settings.NOTIFICATION_BATCH_SIZE)
+    if not pending:
+        return
+
+    describer = _Describer(db, pending)
+    # Notifications about deleted objects are marked sent without an email.
+    sent: list[int] = []
+    try:
+        with mailer.connection() as smtp:
+            for member_id, group in groupby(pending, key=lambda n: n.member_id):
+                notifications = list(group)
+                lines = [
+                    line
+                    for line in (describer.describe(n) for n in notifications)
+                    if line is not None
+                ]
+                if lines:
+                    try:
+                        smtp.send_message(
+                            build_digest(mailer, notifications[0].member, lines)
+                        )
+                    except REJECTED_MESSAGE_ERRORS as e:
+                        logger.warning(
+                            "Notification digest for member %s rejected: %r", member_id, e
+                        )
+                        repo.mark_failed([n.id for n in notifications], repr(e))
+                        continue
+                sent.extend(n.id for n in notifications)
+    except Exception:
+        # Keep a record of the digests that did go out; the job is retried
+        # for the rest.
+        repo.mark_sent(sent)
+        db.commit()
+        raise
+    repo.mark_sent(sent)
+
+    if len(pending) == settings.NOTIFICATION_BATCH_SIZE:
+        # There may be more; send them right after this batch is committed.
+        enqueue(db, DISPATCH_JOB, {})
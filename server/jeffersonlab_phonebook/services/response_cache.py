@@ -0,0 +1,212 @@
+"""
+Response cache for read-mostly list routes.
+
+Entries are stamped with the `table_versions` counters of the tables they
+were built from, the same counters TableETag reads. The counters live in the
+database, so a write committed by any worker moves them and an entry whose
+stamp differs from the current versions is a miss; no in-process
+invalidation is needed for correctness.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Protocol
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.repositories.table_version_repository import (
+    TableVersionRepository,
+)
+
+# (table, version) pairs, sorted by table.
+Stamp = tuple[tuple[str, int], ...]
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str, stamp: Stamp) -> Optional[bytes]:
+        """Returns the value stored under `key` for this stamp, if any."""
+        ...
+
+    def set(self, key: str, value: bytes, stamp: Stamp) -> None: ...
+
+
+class LRUCacheBackend:
+    """Bounded in-process backend; least recently used entries are evicted first."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Stamp, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, stamp: Stamp) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, stamp: Stamp) -> None:
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class KeyValueStore(Protocol):
+    """The subset of a Redis-like client used by SharedCacheBackend."""
+
+    def get(self, name: str) -> Optional[bytes]: ...
+
+    def set(self, name: str, value: bytes, ex: Optional[int] = None) -> object: ...
+
+
+class InMemoryKeyValueStore:
+    """Local stand-in for a shared store, e.g. for tests or a single worker."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[name]
+                return None
+            return value
+
+    def set(self, name: str, value: bytes, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            expires_at = time.monotonic() + ex if ex else None
+            self._data[name] = (expires_at, value)
+        return True
+
+
+class SharedCacheBackend:
+    """
+    Backend over a key-value store shared by all workers. The stamp is part
+    of the stored key, so entries of older table versions are never read
+    again and expire after `ttl` seconds.
+    """
+
+    def __init__(
+        self, store: KeyValueStore, prefix: str = "phonebook:cache:", ttl: int = 3600
+    ) -> None:
+        self.store = store
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _entry_key(self, key: str, stamp: Stamp) -> str:
+        versions = ",".join(f"{table}={version}" for table, version in stamp)
+        return f"{self.prefix}entry:{key}|{versions}"
+
+    def get(self, key: str, stamp: Stamp) -> Optional[bytes]:
+        return self.store.get(self._entry_key(key, stamp))
+
+    def set(self, key: str, value: bytes, stamp: Stamp) -> None:
+        self.store.set(self._entry_key(key, stamp), value, ex=self.ttl)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Caches rendered response bodies and counts hits per route."""
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self._stats: dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+
+    def get_or_render(
+        self,
+        namespace: str,
+        key: str,
+        stamp: Stamp,
+        render: Callable[[], bytes],
+    ) -> bytes:
+        """
+        `stamp` must be read before `render` runs, so that a body is never
+        stored under versions newer than the data it was built from.
+        """
+        body = self.backend.get(key, stamp)
+        with self._lock:
+            stats = self._stats.setdefault(namespace, CacheStats())
+            if body is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+        if body is None:
+            body = render()
+            self.backend.set(key, body, stamp)
+        return body
+
+    def stats(self) -> dict[str, CacheStats]:
+        with self._lock:
+            return {ns: CacheStats(s.hits, s.misses) for ns, s in self._stats.items()}
+
+
+def _default_backend() -> CacheBackend:
+    if settings.RESPONSE_CACHE_REDIS_URL:
+        # Optional dependency, only needed when a shared cache is configured.
+        import redis
+
+        return SharedCacheBackend(redis.Redis.from_url(settings.RESPONSE_CACHE_REDIS_URL))
+    return LRUCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(_default_backend())
+
+
+def table_stamp(request: Request, db: Session, tables: Iterable[str]) -> Stamp:
+    """
+    The current versions of `tables`. Versions TableETag already read for
+    this request are reused, so a route with a matching TableETag makes no
+    extra query.
+    """
+    known: dict[str, int] = getattr(request.state, "table_versions", {})
+    wanted = frozenset(tables)
+    versions = {table: known[table] for table in wanted if table in known}
+    missing = wanted.difference(versions)
+    if missing:
+        versions.update(TableVersionRepository(db).get_versions(missing))
+    return tuple(sorted(versions.items()))
+
+
+def cached_json_response(
+    request: Request,
+    db: Session,
+    tables: Iterable[str],
+    render: Callable[[], bytes],
+    etag: Optional[str] = None,
+) -> Response:
+    """
+    Returns the JSON body produced by `render`, served from the response cache
+    when it was built at the current versions of `tables`. The key is the
+    route path and its sorted query parameters.
+    """
+    route = request.scope.get("route")
+    namespace = getattr(route, "path", request.url.path)
+    key = f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+    stamp = table_stamp(request, db, tables)
+    body = response_cache.get_or_render(namespace, key, stamp, render)
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
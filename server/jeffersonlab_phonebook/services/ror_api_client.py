@@ -1,6 +1,21 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
 import requests
-from typing import Any
+from requests.adapters import HTTPAdapter
+
+from sqlalchemy.orm import Session
+
 from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.db.models import RorOrganization
+from jeffersonlab_phonebook.repositories.ror_repository import RorOrganizationRepository
+
+ROR_ID_PREFIX = "https://ror.org/"
 
 # --- Define Custom Exceptions (Recommended) ---
 class RorApiClientError(Exception):
@@ -21,91 +36,296 @@ class RorApiDataError(RorApiClientError):
         self.original_data = original_data
         self.original_exception = original_exception
 
-# --- Modified Functional Approach with Error Propagation ---
-def call_ror_api(rorid: str) -> dict[str, Any]:
+
+def normalize_ror_id(rorid: str) -> str:
+    """Accepts a bare ROR ID or its https://ror.org/ URL form."""
+    rorid = rorid.strip()
+    if rorid.startswith(ROR_ID_PREFIX):
+        rorid = rorid[len(ROR_ID_PREFIX):]
+    return rorid.lower()
+
+
+def parse_ror_record(data: dict[str, Any]) -> dict[str, Any]:
     """
-    Calls the ROR API and returns relevant data.
-    Raises RorApiNetworkError or RorApiDataError on failure.
+    Extracts the institution fields we store from a ROR v2 organization record.
     """
-    headers = {
-        "Client-Id": settings.ROR_CLIENT_ID
-    }
+    # --- Correct Data Extraction Logic ---
+    full_name = None
+    short_name = None
+
+    # Find the full_name from the names list
+    for name_obj in data.get("names", []):
+        if "ror_display" in name_obj.get("types", []):
+            full_name = name_obj.get("value")
+            break
 
-    try:
-        # In a real-world scenario, you would use this commented-out line.
-        response = requests.get(f"{settings.ROR_API_BASE_URL}/{rorid}", headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        
-        # --- Correct Data Extraction Logic ---
-        full_name = None
-        short_name = None
-
-        # Find the full_name from the names list
+    # Fallback to 'label' if 'ror_display' is not found
+    if full_name is None:
         for name_obj in data.get("names", []):
-            if "ror_display" in name_obj.get("types", []):
+            if "label" in name_obj.get("types", []):
                 full_name = name_obj.get("value")
                 break
-        
-        # Fallback to 'label' if 'ror_display' is not found
-        if full_name is None:
-            for name_obj in data.get("names", []):
-                if "label" in name_obj.get("types", []):
-                    full_name = name_obj.get("value")
-                    break
-        
-        # Find the short_name (acronym or alias)
+
+    # Find the short_name (acronym or alias)
+    for name_obj in data.get("names", []):
+        if "acronym" in name_obj.get("types", []):
+            short_name = name_obj.get("value")
+            break
+    if short_name is None: # Fallback to alias if no acronym
         for name_obj in data.get("names", []):
-            if "acronym" in name_obj.get("types", []):
+            if "alias" in name_obj.get("types", []):
                 short_name = name_obj.get("value")
                 break
-        if short_name is None: # Fallback to alias if no acronym
-            for name_obj in data.get("names", []):
-                if "alias" in name_obj.get("types", []):
-                    short_name = name_obj.get("value")
-                    break
-
-        first_location_details = data.get("locations", [{}])[0].get("geonames_details", {})
-
-        latitude = first_location_details.get("lat")
-        longitude = first_location_details.get("lng")
-        city = first_location_details.get("name")
-        address_line = first_location_details.get("name") # The provided data does not have an address line, so we can use city name as a proxy
-        country = first_location_details.get("country_name")
-        region = first_location_details.get("country_subdivision_name")
-
-        ret =  {
-            "full_name": full_name,
-            "short_name": short_name,
-            "country": country,
-            "region": region,
-            "latitude": latitude,
-            "longitude": longitude,
-            "city": city,
-            "address": address_line,
-        }
-        return ret
-        
-    except requests.exceptions.HTTPError as e:
-        raise RorApiNetworkError(
-            f"ROR API returned an HTTP error for ROR ID {rorid}: {e.response.status_code} - {e.response.text}",
-            status_code=e.response.status_code,
-            original_exception=e
-        ) from e
-    except requests.exceptions.ConnectionError as e:
-        raise RorApiNetworkError(
-            f"Failed to connect to ROR API for ROR ID {rorid}: {e}",
-            original_exception=e
-        ) from e
-    except requests.exceptions.RequestException as e:
-        raise RorApiNetworkError(
-            f"An unknown network error occurred with ROR API for ROR ID {rorid}: {e}",
-            original_exception=e
-        ) from e
-    except Exception as e:
-        original_content = data if 'data' in locals() else None
-        raise RorApiDataError(
-            f"An unexpected error occurred processing ROR API response for {rorid}: {e}",
-            original_exception=e,
-            original_data=original_content
-        ) from e
\ No newline at end of file
+
+    first_location_details = (data.get("locations") or [{}])[0].get("geonames_details", {})
+
+    latitude = first_location_details.get("lat")
+    longitude = first_location_details.get("lng")
+    city = first_location_details.get("name")
+    address_line = first_location_details.get("name") # The provided data does not have an address line, so we can use city name as a proxy
+    country = first_location_details.get("country_name")
+    region = first_location_details.get("country_subdivision_name")
+
+    return {
+        "full_name": full_name,
+        "short_name": short_name,
+        "country": country,
+        "region": region,
+        "latitude": latitude,
+        "longitude": longitude,
+        "city": city,
+        "address": address_line,
+    }
+
+
+class RorCache:
+    """
+    Two-tier TTL cache of ROR lookups: an LRU of up to `max_entries` in
+    memory backed by one JSON file per ROR ID on disk, so entries survive
+    restarts and evicted ones are read back from disk.
+    An entry holds either the parsed record or None for an ID the API
+    answered 404 for (negative caching, with its own shorter TTL).
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        negative_ttl: float,
+        directory: Optional[str] = None,
+        max_entries: int = 4096,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.directory = directory
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, tuple[float, Optional[dict[str, Any]]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _path(self, rorid: str) -> str:
+        assert self.directory is not None
+        # ROR IDs may arrive as full URLs; hash them into safe file names.
+        name = hashlib.sha256(rorid.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _remember(self, rorid: str, entry: tuple[float, Optional[dict[str, Any]]]) -> None:
+        with self._lock:
+            self._memory[rorid] = entry
+            self._memory.move_to_end(rorid)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, rorid: str) -> tuple[bool, Optional[dict[str, Any]]]:
+        """
+        Returns (hit, record). A hit with a None record is a cached 404.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(rorid)
+            if entry is not None:
+                self._memory.move_to_end(rorid)
+        if entry is not None and entry[0] > now:
+            return True, entry[1]
+        if not self.directory:
+            return False, None
+        try:
+            with open(self._path(rorid), encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        if stored.get("rorid") != rorid or stored.get("expires_at", 0) <= now:
+            return False, None
+        self._remember(rorid, (stored["expires_at"], stored["record"]))
+        return True, stored["record"]
+
+    def set(self, rorid: str, record: Optional[dict[str, Any]]) -> None:
+        ttl = self.ttl if record is not None else self.negative_ttl
+        expires_at = time.time() + ttl
+        self._remember(rorid, (expires_at, record))
+        if not self.directory:
+            return
+        path = self._path(rorid)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            # Created on first write rather than when the module is imported.
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"rorid": rorid, "expires_at": expires_at, "record": record}, f)
+            # Atomic, so concurrent readers never see a partial file.
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk tier is best effort; the memory tier still holds the entry.
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+
+
+class RorApiClient:
+    """
+    ROR API client with a pooled HTTP session, explicit timeouts and a
+    lookup cache. The base URL is configurable, e.g. to point it at a local
+    stub server.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        client_id: Optional[str] = None,
+        cache: Optional[RorCache] = None,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        pool_size: int = 10,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        if client_id:
+            self.session.headers["Client-Id"] = client_id
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _not_found(self, rorid: str) -> RorApiNetworkError:
+        return RorApiNetworkError(
+            f"ROR API returned an HTTP error for ROR ID {rorid}: 404 - not found",
+            status_code=404,
+        )
+
+    def fetch(self, rorid: str) -> dict[str, Any]:
+        """
+        Returns the parsed record for a ROR ID, from the cache when possible.
+        Raises RorApiNetworkError or RorApiDataError on failure.
+        """
+        if self.cache is not None:
+            hit, record = self.cache.get(rorid)
+            if hit:
+                if record is None:
+                    raise self._not_found(rorid)
+                return record
+
+        try:
+            response = self.session.get(f"{self.base_url}/{rorid}", timeout=self.timeout)
+            if response.status_code == 404 and self.cache is not None:
+                self.cache.set(rorid, None)
+            response.raise_for_status()
+            data = response.json()
+            record = parse_ror_record(data)
+        except requests.exceptions.HTTPError as e:
+            raise RorApiNetworkError(
+                f"ROR API returned an HTTP error for ROR ID {rorid}: {e.response.status_code} - {e.response.text}",
+                status_code=e.response.status_code,
+                original_exception=e
+            ) from e
+        except requests.exceptions.Timeout as e:
+            raise RorApiNetworkError(
+                f"ROR API timed out for ROR ID {rorid}: {e}",
+                original_exception=e
+            ) from e
+        except requests.exceptions.ConnectionError as e:
+            raise RorApiNetworkError(
+                f"Failed to connect to ROR API for ROR ID {rorid}: {e}",
+                original_exception=e
+            ) from e
+        except requests.exceptions.RequestException as e:
+            raise RorApiNetworkError(
+                f"An unknown network error occurred with ROR API for ROR ID {rorid}: {e}",
+                original_exception=e
+            ) from e
+        except Exception as e:
+            original_content = data if 'data' in locals() else None
+            raise RorApiDataError(
+                f"An unexpected error occurred processing ROR API response for {rorid}: {e}",
+                original_exception=e,
+                original_data=original_content
+            ) from e
+
+        if self.cache is not None:
+            self.cache.set(rorid, record)
+        return record
+
+    def close(self) -> None:
+        self.session.close()
+
+
+ror_api_client = RorApiClient(
+    settings.ROR_API_BASE_URL,
+    client_id=settings.ROR_CLIENT_ID,
+    cache=RorCache(
+        ttl=settings.ROR_CACHE_TTL_SECONDS,
+        negative_ttl=settings.ROR_CACHE_NEGATIVE_TTL_SECONDS,
+        directory=settings.ROR_CACHE_DIR,
+        max_entries=settings.ROR_CACHE_MAX_ENTRIES,
+    ),
+    connect_timeout=settings.ROR_CONNECT_TIMEOUT_SECONDS,
+    read_timeout=settings.ROR_READ_TIMEOUT_SECONDS,
+)
+
+
+def lookup_local_ror(db: Session, rorid: str) -> Optional[dict[str, Any]]:
+    """
+    Returns the institution data for a ROR ID from the imported ROR dump, or
+    None if the ID is not in it.
+    """
+    organization = RorOrganizationRepository(db).get(normalize_ror_id(rorid))
+    if organization is None:
+        return None
+    return ror_record_from_organization(organization)
+
+
+def ror_record_from_organization(organization: RorOrganization) -> dict[str, Any]:
+    """The fields parse_ror_record returns, from an imported organization."""
+    return {
+        "full_name": organization.full_name,
+        "short_name": organization.short_name,
+        "country": organization.country,
+        "region": organization.region,
+        "latitude": organization.latitude,
+        "longitude": organization.longitude,
+        "city": organization.city,
+        "address": organization.address,
+    }
+
+
+def call_ror_api(rorid: str, db: Optional[Session] = None) -> dict[str, Any]:
+    """
+    Returns the institution data for a ROR ID. With a session, the ID is
+    first resolved from the imported ROR dump; the ROR API is only called
+    for IDs that are not in it.
+    Raises RorApiNetworkError or RorApiDataError on failure.
+    """
+    if db is not None:
+        record = lookup_local_ror(db, rorid)
+        if record is not None:
+            return record
+    return ror_api_client.fetch(rorid)
@@ -0,0 +1,248 @@
+"""
+Async ROR API client for request handlers, so a slow ROR API does not tie
+up a threadpool worker per request.
+
+Transient failures (connection errors, timeouts, 429 and 5xx answers) are
+retried a bounded number of times with jittered exponential backoff. After
+repeated failures a circuit breaker fails calls fast for a while instead of
+piling more requests onto an API that is down.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Optional
+
+import httpx
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.services.ror_api_client import (
+    RorApiDataError,
+    RorApiNetworkError,
+    RorCache,
+    parse_ror_record,
+    ror_api_client,
+)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures. While open, calls
+    are refused until `reset_timeout` seconds have passed; then one trial
+    call is let through (half-open) and its outcome closes or reopens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return False
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def end_trial(self) -> None:
+        """
+        Ends a trial call that recorded no outcome, e.g. because it was
+        cancelled, so that the next call after it can be the trial.
+        """
+        self._trial_in_flight = False
+
+
+class AsyncRorApiClient:
+    """
+    Shares one httpx connection pool and the ROR lookup cache of the sync
+    client. At most `max_concurrency` requests are in flight at once.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        client_id: Optional[str] = None,
+        cache: Optional[RorCache] = None,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.2,
+        backoff_max: float = 2.0,
+        max_concurrency: int = 8,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_concurrency = max_concurrency
+        self.breaker = breaker or CircuitBreaker(failure_threshold=5, reset_timeout=30.0)
+        self._headers = {"Client-Id": client_id} if client_id else {}
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created on first use inside the running event loop, and again if
+        # the loop changes (pooled connections belong to their loop).
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._client
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": a random delay up to the exponential bound.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def _get(self, rorid: str) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                client = self.client
+                async with self._semaphore:
+                    response = await client.get(f"/{rorid}")
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+                error: Exception = httpx.HTTPStatusError(
+                    f"{response.status_code}", request=response.request, response=response
+                )
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                error = e
+            if attempt >= self.max_retries:
+                raise error
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    async def fetch(self, rorid: str) -> dict[str, Any]:
+        """
+        Returns the parsed record for a ROR ID, from the cache when possible.
+        Raises RorApiNetworkError or RorApiDataError on failure.
+        """
+        if self.cache is not None:
+            hit, record = self.cache.get(rorid)
+            if hit:
+                if record is None:
+                    raise RorApiNetworkError(
+                        f"ROR API returned an HTTP error for ROR ID {rorid}: 404 - not found",
+                        status_code=404,
+                    )
+                return record
+
+        if not self.breaker.allow():
+            raise RorApiNetworkError(
+                f"ROR API is unavailable after repeated failures; not calling it for ROR ID {rorid}",
+                status_code=503,
+            )
+        # Allowed while open means this call is the half-open trial.
+        trial = self.breaker.is_open
+        try:
+            response = await self._get(rorid)
+        except httpx.HTTPStatusError as e:
+            self.breaker.record_failure()
+            raise RorApiNetworkError(
+                f"ROR API returned an HTTP error for ROR ID {rorid}: {e.response.status_code} - {e.response.text}",
+                status_code=e.response.status_code,
+                original_exception=e,
+            ) from e
+        except httpx.TimeoutException as e:
+            self.breaker.record_failure()
+            raise RorApiNetworkError(
+                f"ROR API timed out for ROR ID {rorid}: {e!r}", original_exception=e
+            ) from e
+        except httpx.HTTPError as e:
+            self.breaker.record_failure()
+            raise RorApiNetworkError(
+                f"Failed to connect to ROR API for ROR ID {rorid}: {e!r}",
+                original_exception=e,
+            ) from e
+        finally:
+            # Cancellation or an unexpected error records no outcome.
+            if trial:
+                self.breaker.end_trial()
+        # The API answered; client errors are about the ID, not its health.
+        self.breaker.record_success()
+
+        if response.status_code == 404 and self.cache is not None:
+            self.cache.set(rorid, None)
+        if response.is_error:
+            raise RorApiNetworkError(
+                f"ROR API returned an HTTP error for ROR ID {rorid}: {response.status_code} - {response.text}",
+                status_code=response.status_code,
+            )
+        try:
+            data = response.json()
+            record = parse_ror_record(data)
+        except Exception as e:
+            raise RorApiDataError(
+                f"An unexpected error occurred processing ROR API response for {rorid}: {e}",
+                original_exception=e,
+                original_data=response.text,
+            ) from e
+
+        if self.cache is not None:
+            self.cache.set(rorid, record)
+        return record
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def new_async_ror_api_client() -> AsyncRorApiClient:
+    """
+    A client configured from the settings. Code running its own event loop
+    (e.g. a background job) needs its own client: pooled connections belong
+    to the loop they were opened in.
+    """
+    return AsyncRorApiClient(
+        settings.ROR_API_BASE_URL,
+        client_id=settings.ROR_CLIENT_ID,
+        cache=ror_api_client.cache,
+        connect_timeout=settings.ROR_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=settings.ROR_READ_TIMEOUT_SECONDS,
+        max_retries=settings.ROR_MAX_RETRIES,
+        max_concurrency=settings.ROR_MAX_CONCURRENCY,
+        breaker=CircuitBreaker(
+            failure_threshold=settings.ROR_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.ROR_CIRCUIT_RESET_SECONDS,
+        ),
+    )
+
+
+async_ror_api_client = new_async_ror_api_client()
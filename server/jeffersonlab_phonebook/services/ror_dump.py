@@ -0,0 +1,182 @@
+"""
+Import of the ROR data dump (https://ror.readme.io/docs/data-dump).
+
+The dump is a zip holding one JSON array with an object per organization,
+over a gigabyte once extracted. It is parsed incrementally, one object at a
+time, and written to the local ROR tables in batches.
+"""
+
+import io
+import json
+import re
+import unicodedata
+import zipfile
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.repositories.ror_repository import RorOrganizationRepository
+from jeffersonlab_phonebook.services.ror_api_client import (
+    normalize_ror_id,
+    parse_ror_record,
+)
+
+CHUNK_SIZE = 1 << 20
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase ASCII words separated by single spaces."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALPHANUMERIC.sub(" ", ascii_name.lower()).strip()
+
+
+def search_keys(name: str) -> list[tuple[str, int]]:
+    """
+    The normalized name starting at each of its words, with the word's
+    position: "Old Dominion University" gives "old dominion university",
+    "dominion university" and "university".
+    """
+    words = normalize_name(name).split(" ")
+    return [(" ".join(words[i:]), i) for i in range(len(words)) if words[i]]
+
+
+def iter_json_array(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the elements of a top-level JSON array one by one, keeping only
+    the unparsed part of the current chunk in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    started = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def next_char() -> Optional[str]:
+        # Skips whitespace and returns the next significant character.
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                return None
+
+    if next_char() != "[":
+        raise ValueError("ROR dump is not a JSON array")
+    pos += 1
+    while True:
+        char = next_char()
+        if char == "]":
+            return
+        if char is None:
+            raise ValueError("ROR dump ends before the closing bracket")
+        if started:
+            if char != ",":
+                raise ValueError(f"Expected ',' in ROR dump, found {char!r}")
+            pos += 1
+            next_char()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError:
+                # The element continues in the next chunk.
+                if not fill():
+                    raise
+        pos = end
+        started = True
+        yield value
+
+
+@contextmanager
+def _open_dump(path: str) -> Iterator[TextIO]:
+    """The dump's JSON as text, from a plain file or from the zip's member."""
+    if not zipfile.is_zipfile(path):
+        with open(path, encoding="utf-8") as stream:
+            yield stream
+        return
+    with zipfile.ZipFile(path) as archive:
+        members = [n for n in archive.namelist() if n.endswith(".json")]
+        if not members:
+            raise ValueError(f"No JSON file in {path}")
+        # Releases from 2024 ship both schema versions; we parse v2.
+        member = next((n for n in members if "v2" in n), members[0])
+        with io.TextIOWrapper(archive.open(member), encoding="utf-8") as stream:
+            yield stream
+
+
+def iter_dump_records(path: str) -> Iterator[dict[str, Any]]:
+    with _open_dump(path) as stream:
+        yield from iter_json_array(stream)
+
+
+def _organization_rows(
+    record: dict[str, Any],
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    ror_id = normalize_ror_id(record["id"])
+    organization = {
+        "ror_id": ror_id,
+        "status": record.get("status", "active"),
+        **parse_ror_record(record),
+    }
+    keys: dict[str, int] = {}
+    for name_obj in record.get("names", []):
+        for key, position in search_keys(name_obj.get("value") or ""):
+            keys[key] = min(position, keys.get(key, position))
+    names = [
+        {"ror_id": ror_id, "search_key": key, "word_position": position}
+        for key, position in keys.items()
+    ]
+    return organization, names
+
+
+def import_ror_dump(
+    db: Session,
+    path: str,
+    batch_size: int = 1000,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Loads a ROR dump (zip or extracted JSON) into the local ROR tables,
+    replacing organizations that are already there. Commits after each batch
+    and returns the number of organizations imported.
+    """
+    repo = RorOrganizationRepository(db)
+    organizations: list[dict[str, Any]] = []
+    names: list[dict[str, Any]] = []
+    count = 0
+
+    def flush() -> None:
+        repo.upsert_batch(organizations, names)
+        db.commit()
+        organizations.clear()
+        names.clear()
+        if progress is not None:
+            progress(count)
+
+    for record in iter_dump_records(path):
+        organization, organization_names = _organization_rows(record)
+        organizations.append(organization)
+        names.extend(organization_names)
+        count += 1
+        if len(organizations) >= batch_size:
+            flush()
+    if organizations:
+        flush()
+    return count
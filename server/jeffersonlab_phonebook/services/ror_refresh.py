@@ -0,0 +1,228 @@
+"""
+Batch refresh of institution names and locations from ROR.
+
+Every institution with a ROR ID is resolved, from the imported ROR dump
+when possible and otherwise from the ROR API (concurrently, under a rate
+limit). Fields that differ from the stored row are then written in one
+commit, with a bulk UPDATE per set of changed fields.
+"""
+
+import asyncio
+from typing import Any, Callable, Optional
+
+from sqlalchemy import String
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.db.models import Institution
+from jeffersonlab_phonebook.repositories.institution_repository import (
+    InstitutionRepository,
+)
+from jeffersonlab_phonebook.repositories.ror_repository import RorOrganizationRepository
+from jeffersonlab_phonebook.schemas.ror_schemas import (
+    RorRefreshChange,
+    RorRefreshFailure,
+    RorRefreshReport,
+)
+from jeffersonlab_phonebook.services.jobs import PermanentJobError, job_handler
+from jeffersonlab_phonebook.services.ror_api_client import (
+    RorApiClientError,
+    RorApiDataError,
+    RorApiNetworkError,
+    call_ror_api,
+    normalize_ror_id,
+    ror_record_from_organization,
+)
+from jeffersonlab_phonebook.services.ror_async_client import (
+    AsyncRorApiClient,
+    async_ror_api_client,
+    new_async_ror_api_client,
+)
+
+# Columns filled from ROR records, as in update_institution.
+ROR_FIELDS = (
+    "full_name",
+    "short_name",
+    "country",
+    "region",
+    "latitude",
+    "longitude",
+    "city",
+    "address",
+)
+
+# Background job filling an institution's fields from its ROR record.
+ROR_ENRICH_JOB = "ror_enrich"
+# Background job refreshing every institution; its result is the report.
+ROR_REFRESH_JOB = "ror_refresh"
+
+# Called with (institutions resolved so far, total).
+ProgressCallback = Callable[[int, int], None]
+
+
+class AsyncRateLimiter:
+    """Spaces the start of successive calls at least 1/rate seconds apart."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        self.interval = 1.0 / rate_per_second
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def diff_ror_fields(row: Any, record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Fields whose ROR value differs from the row. Missing ROR values never
+    clear a field, and strings too long for their column are left out.
+    """
+    changes = {}
+    for name in ROR_FIELDS:
+        value = record.get(name)
+        if value is None or value == getattr(row, name):
+            continue
+        column_type = Institution.__table__.c[name].type
+        if (
+            isinstance(column_type, String)
+            and column_type.length is not None
+            and len(value) > column_type.length
+        ):
+            continue
+        changes[name] = value
+    return changes
+
+
+@job_handler(ROR_ENRICH_JOB)
+def enrich_institution_from_ror(db: Session, payload: dict[str, Any]) -> None:
+    """
+    Copies the ROR record's fields onto the institution, unless it was
+    deleted or given another ROR ID since the job was queued.
+    """
+    institution = InstitutionRepository(db).get(payload["institution_id"])
+    if institution is None or institution.rorid != payload["rorid"]:
+        return
+    try:
+        record = call_ror_api(payload["rorid"], db)
+    except RorApiNetworkError as e:
+        if e.status_code == 404:
+            raise PermanentJobError(str(e)) from e
+        raise
+    except RorApiDataError as e:
+        raise PermanentJobError(str(e)) from e
+    for name, value in diff_ror_fields(institution, record).items():
+        setattr(institution, name, value)
+
+
+async def refresh_institutions_from_ror(
+    db: Session,
+    client: AsyncRorApiClient = async_ror_api_client,
+    rate_per_second: float = settings.ROR_REFRESH_RATE_PER_SECOND,
+    dry_run: bool = False,
+    progress: Optional[ProgressCallback] = None,
+) -> RorRefreshReport:
+    """
+    Refreshes every institution with a ROR ID and reports what changed.
+    Database work runs in a worker thread, so the event loop stays free.
+    """
+    repo = InstitutionRepository(db)
+    rows = await asyncio.to_thread(repo.get_ror_linked, ROR_FIELDS)
+    total = len(rows)
+    records: dict[int, dict[str, Any]] = {}
+    failed: list[RorRefreshFailure] = []
+
+    def resolve_locally() -> dict[int, dict[str, Any]]:
+        organizations = RorOrganizationRepository(db).get_many(
+            normalize_ror_id(row.rorid) for row in rows
+        )
+        found = {}
+        for row in rows:
+            organization = organizations.get(normalize_ror_id(row.rorid))
+            if organization is not None:
+                found[row.id] = ror_record_from_organization(organization)
+        return found
+
+    records.update(await asyncio.to_thread(resolve_locally))
+    resolved_locally = len(records)
+    done = resolved_locally
+    if progress is not None:
+        progress(done, total)
+
+    limiter = AsyncRateLimiter(rate_per_second)
+
+    async def fetch(row: Any) -> None:
+        nonlocal done
+        # Only calls that reach the ROR API count against the rate limit.
+        if client.cache is None or not client.cache.get(row.rorid)[0]:
+            await limiter.wait()
+        try:
+            records[row.id] = await client.fetch(row.rorid)
+        except RorApiClientError as e:
+            failed.append(
+                RorRefreshFailure(institution_id=row.id, rorid=row.rorid, error=str(e))
+            )
+        done += 1
+        if progress is not None:
+            progress(done, total)
+
+    await asyncio.gather(*(fetch(row) for row in rows if row.id not in records))
+
+    updated: list[RorRefreshChange] = []
+    # Rows to update by the columns that changed, so that a column edited
+    # while the refresh ran is only written when ROR changed it too.
+    update_rows: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        record = records.get(row.id)
+        if record is None:
+            continue
+        changes = diff_ror_fields(row, record)
+        if not changes:
+            continue
+        updated.append(
+            RorRefreshChange(institution_id=row.id, rorid=row.rorid, changes=changes)
+        )
+        update_rows.setdefault(tuple(changes), []).append({"id": row.id, **changes})
+
+    if update_rows and not dry_run:
+
+        def apply() -> None:
+            for columns, rows_to_update in update_rows.items():
+                repo.bulk_update(columns, rows_to_update)
+            db.commit()
+
+        await asyncio.to_thread(apply)
+
+    return RorRefreshReport(
+        dry_run=dry_run,
+        total=total,
+        resolved_locally=resolved_locally,
+        fetched=total - resolved_locally - len(failed),
+        unchanged=total - len(updated) - len(failed),
+        updated=updated,
+        failed=failed,
+    )
+
+
+@job_handler(ROR_REFRESH_JOB)
+def refresh_institutions_job(db: Session, payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Runs the refresh in the worker thread's own event loop, with its own ROR
+    client, and returns the report.
+    """
+
+    async def refresh() -> RorRefreshReport:
+        client = new_async_ror_api_client()
+        try:
+            return await refresh_institutions_from_ror(
+                db, client=client, dry_run=payload.get("dry_run", False)
+            )
+        finally:
+            await client.aclose()
+
+    return asyncio.run(refresh()).model_dump(mode="json")
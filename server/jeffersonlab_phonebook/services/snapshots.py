@@ -0,0 +1,345 @@
+"""
+Downloadable snapshots of the directory: columnar Parquet files for
+analytics, and a SQLite file of the active directory for offline use.
+
+Each snapshot is one of the flat tables in SNAPSHOT_QUERIES, stored as
+SNAPSHOT_DIR/<name>-<version>.parquet. The version is derived from the
+version counters of the tables the snapshot is read from, so a snapshot is
+only rebuilt after one of them changed. Builds run as a background job:
+rows are read from a server-side cursor and each batch is written as one
+Parquet row group, so memory use does not grow with the table.
+
+Parquet snapshots require the optional `pyarrow` package (the `snapshots`
+extra).
+
+The SQLite directory (DIRECTORY_QUERIES) is versioned the same way and
+rebuilt incrementally: the previous file is copied and only the tables whose
+sources changed are reloaded, with bulk inserts, before indexes are created
+and the file is vacuumed.
+"""
+
+import glob
+import hashlib
+import importlib.util
+import logging
+import os
+import shutil
+import sqlite3
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, Select
+from sqlalchemy.orm import Session
+from sqlalchemy.types import TypeEngine
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.repositories.job_repository import JobRepository
+from jeffersonlab_phonebook.repositories.snapshot_repository import (
+    DIRECTORY_QUERIES,
+    DIRECTORY_TABLES,
+    SNAPSHOT_QUERIES,
+    SNAPSHOT_TABLES,
+    SnapshotRepository,
+)
+from jeffersonlab_phonebook.repositories.table_version_repository import (
+    TableVersionRepository,
+)
+from jeffersonlab_phonebook.services.jobs import PermanentJobError, enqueue, job_handler
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_JOB = "snapshots.build"
+SNAPSHOT_NAMES = tuple(SNAPSHOT_QUERIES)
+
+DIRECTORY_JOB = "snapshots.build_directory"
+# Created after the rows are loaded, which is faster than keeping them up
+# to date during the inserts.
+DIRECTORY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_institutions_short_name ON institutions (short_name)",
+    "CREATE INDEX IF NOT EXISTS ix_members_name ON members (last_name, first_name)",
+    "CREATE INDEX IF NOT EXISTS ix_members_email ON members (email)",
+    "CREATE INDEX IF NOT EXISTS ix_members_institution_id ON members (institution_id)",
+    "CREATE INDEX IF NOT EXISTS ix_group_members_group_id ON group_members (group_id)",
+    "CREATE INDEX IF NOT EXISTS ix_group_members_member_id ON group_members (member_id)",
+    "CREATE INDEX IF NOT EXISTS ix_board_members_institution_id ON board_members (institution_id)",
+    "CREATE INDEX IF NOT EXISTS ix_board_members_member_id ON board_members (member_id)",
+)
+# Records the source version each table of the SQLite file was loaded at.
+_DIRECTORY_META = "snapshot_versions"
+
+
+class SnapshotsUnavailable(Exception):
+    """Raised when pyarrow is not installed."""
+
+
+def snapshots_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _fingerprint(versions: dict[str, Any]) -> str:
+    joined = "|".join(f"{key}={versions[key]}" for key in sorted(versions))
+    return hashlib.sha256(joined.encode()).hexdigest()[:16]
+
+
+def snapshot_version(db: Session, name: str) -> str:
+    return _fingerprint(TableVersionRepository(db).get_versions(SNAPSHOT_TABLES[name]))
+
+
+def snapshot_path(name: str, version: str) -> str:
+    return os.path.join(settings.SNAPSHOT_DIR, f"{name}-{version}.parquet")
+
+
+def current_snapshot(db: Session, name: str) -> tuple[str, Optional[str]]:
+    """
+    The snapshot's current version and the path of its file, or None for the
+    path if that version has not been built yet.
+    """
+    version = snapshot_version(db, name)
+    path = snapshot_path(name, version)
+    return version, path if os.path.exists(path) else None
+
+
+def request_build(db: Session, kind: str = SNAPSHOT_JOB) -> None:
+    """
+    Queues a build job (SNAPSHOT_JOB or DIRECTORY_JOB) in the caller's
+    session unless one is already queued; the caller commits.
+    """
+    if not JobRepository(db).has_queued(kind):
+        enqueue(db, kind, {})
+
+
+def _arrow_type(pa: Any, type_: TypeEngine[Any]) -> Any:
+    if isinstance(type_, Boolean):
+        return pa.bool_()
+    if isinstance(type_, Integer):
+        return pa.int64()
+    if isinstance(type_, Float):
+        return pa.float64()
+    if isinstance(type_, DateTime):
+        return pa.timestamp("us", tz="UTC" if type_.timezone else None)
+    if isinstance(type_, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def _converter(type_: TypeEngine[Any]) -> Optional[Callable[[Any], Any]]:
+    if isinstance(type_, Enum) and type_.enum_class is not None:
+        return lambda value: None if value is None else value.value
+    return None
+
+
+def _sqlite_type(type_: TypeEngine[Any]) -> str:
+    if isinstance(type_, (Boolean, Integer)):
+        return "INTEGER"
+    if isinstance(type_, Float):
+        return "REAL"
+    return "TEXT"
+
+
+def _sqlite_converter(type_: TypeEngine[Any]) -> Optional[Callable[[Any], Any]]:
+    if isinstance(type_, (Date, DateTime)):
+        return lambda value: None if value is None else value.isoformat()
+    return _converter(type_)
+
+
+def _mtime(path: str) -> float:
+    """The file's modification time, or 0 if a concurrent build removed it."""
+    try:
+        return os.path.getmtime(path)
+    except FileNotFoundError:
+        return 0.0
+
+
+def _remove_older(pattern: str, path: str, started: float) -> None:
+    """
+    Removes the files matching `pattern` in SNAPSHOT_DIR dated before
+    `started`, other than `path`. Files of builds that read their rows
+    later than this one are newer and kept.
+    """
+    for old in glob.glob(os.path.join(settings.SNAPSHOT_DIR, pattern)):
+        try:
+            if old != path and os.path.getmtime(old) < started:
+                os.remove(old)
+        except FileNotFoundError:
+            # Removed by a concurrent build.
+            pass
+
+
+def build_snapshot(db: Session, name: str, version: str) -> str:
+    """Writes the snapshot's current rows to its file and returns the path."""
+    try:
+        # Optional dependency, only needed for snapshots.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise SnapshotsUnavailable("Parquet snapshots require the pyarrow package") from e
+
+    query: Select[Any] = SNAPSHOT_QUERIES[name]()
+    columns = list(query.selected_columns)
+    schema = pa.schema([(column.name, _arrow_type(pa, column.type)) for column in columns])
+    converters = [_converter(column.type) for column in columns]
+
+    os.makedirs(settings.SNAPSHOT_DIR, exist_ok=True)
+    path = snapshot_path(name, version)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    started = time.time()
+    result = SnapshotRepository(db).stream(query, settings.SNAPSHOT_BATCH_SIZE)
+    try:
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for rows in result.partitions():
+                arrays = []
+                for i, (field, convert) in enumerate(zip(schema, converters)):
+                    values = [row[i] for row in rows]
+                    if convert is not None:
+                        values = [convert(value) for value in values]
+                    arrays.append(pa.array(values, type=field.type))
+                writer.write_batch(pa.record_batch(arrays, schema=schema))
+        # Dated by when its rows were read, so that a slower concurrent build
+        # of older rows never counts as newer.
+        os.utime(tmp_path, (started, started))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        result.close()
+
+    _remove_older(f"{name}-*.parquet", path, started)
+    return path
+
+
+@job_handler(SNAPSHOT_JOB)
+def build_snapshots(db: Session, payload: dict[str, Any]) -> None:
+    """Builds every snapshot whose current version has no file yet."""
+    for name in SNAPSHOT_NAMES:
+        version, path = current_snapshot(db, name)
+        if path is not None:
+            continue
+        try:
+            path = build_snapshot(db, name, version)
+        except SnapshotsUnavailable as e:
+            raise PermanentJobError(str(e)) from e
+        logger.info("Built snapshot %s", path)
+
+
+def directory_versions(db: Session) -> dict[str, str]:
+    """The source version of each table of the SQLite directory."""
+    versions = TableVersionRepository(db).get_versions(
+        frozenset().union(*DIRECTORY_TABLES.values())
+    )
+    return {
+        name: _fingerprint({table: versions[table] for table in tables})
+        for name, tables in DIRECTORY_TABLES.items()
+    }
+
+
+def directory_path(version: str) -> str:
+    return os.path.join(settings.SNAPSHOT_DIR, f"directory-{version}.sqlite")
+
+
+def current_directory(db: Session) -> tuple[str, dict[str, str], Optional[str]]:
+    """
+    The directory's current version, the versions of its tables, and the
+    path of its file, or None for the path if it has not been built yet.
+    """
+    table_versions = directory_versions(db)
+    version = _fingerprint(table_versions)
+    path = directory_path(version)
+    return version, table_versions, path if os.path.exists(path) else None
+
+
+def _load_directory_table(
+    db: Session, conn: sqlite3.Connection, name: str, query: Select[Any]
+) -> None:
+    columns = list(query.selected_columns)
+    definitions = ", ".join(
+        f'"{column.name}" {_sqlite_type(column.type)}'
+        + (" PRIMARY KEY" if column.name == "id" else "")
+        for column in columns
+    )
+    converters = [_sqlite_converter(column.type) for column in columns]
+    insert = f'INSERT INTO "{name}" VALUES ({", ".join("?" * len(columns))})'
+
+    conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+    conn.execute(f'CREATE TABLE "{name}" ({definitions})')
+    result = SnapshotRepository(db).stream(query, settings.SNAPSHOT_BATCH_SIZE)
+    try:
+        for rows in result.partitions():
+            conn.executemany(
+                insert,
+                [
+                    [
+                        value if convert is None else convert(value)
+                        for value, convert in zip(row, converters)
+                    ]
+                    for row in rows
+                ],
+            )
+    finally:
+        result.close()
+
+
+def build_directory(db: Session, version: str, table_versions: dict[str, str]) -> str:
+    """
+    Writes the SQLite directory for `version`, starting from the most recent
+    earlier file so that only tables whose sources changed are reloaded.
+    """
+    os.makedirs(settings.SNAPSHOT_DIR, exist_ok=True)
+    path = directory_path(version)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    started = time.time()
+    previous = sorted(
+        glob.glob(os.path.join(settings.SNAPSHOT_DIR, "directory-*.sqlite")),
+        key=_mtime,
+    )
+    if previous:
+        try:
+            shutil.copyfile(previous[-1], tmp_path)
+        except FileNotFoundError:
+            # Removed by a concurrent build; every table is loaded instead.
+            pass
+    try:
+        conn = sqlite3.connect(tmp_path)
+        try:
+            # A temporary file that is discarded on failure needs no journal.
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {_DIRECTORY_META} "
+                "(table_name TEXT PRIMARY KEY, version TEXT NOT NULL)"
+            )
+            loaded = dict(conn.execute(f"SELECT table_name, version FROM {_DIRECTORY_META}"))
+            for name, query in DIRECTORY_QUERIES.items():
+                if loaded.get(name) == table_versions[name]:
+                    continue
+                _load_directory_table(db, conn, name, query())
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {_DIRECTORY_META} VALUES (?, ?)",
+                    (name, table_versions[name]),
+                )
+            for ddl in DIRECTORY_INDEXES:
+                conn.execute(ddl)
+            conn.commit()
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        # Dated by when its rows were read, as in build_snapshot.
+        os.utime(tmp_path, (started, started))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    _remove_older("directory-*.sqlite", path, started)
+    return path
+
+
+@job_handler(DIRECTORY_JOB)
+def build_directory_snapshot(db: Session, payload: dict[str, Any]) -> None:
+    version, table_versions, path = current_directory(db)
+    if path is None:
+        path = build_directory(db, version, table_versions)
+        logger.info("Built directory snapshot %s", path)
@@ -0,0 +1,27 @@
+"""
+The application's modules read their settings when imported. Without a
+configuration (environment or ../.env), placeholders are used so that the
+unit tests can import them; the database tests are then skipped, as the
+placeholder server does not resolve.
+"""
+
+import os
+
+from pydantic import ValidationError
+
+PLACEHOLDER_SETTINGS = {
+    "PROJECT_NAME": "phonebook-tests",
+    "POSTGRES_SERVER": "postgres.invalid",
+    "POSTGRES_USER": "phonebook",
+    "FIRST_SUPERUSER": "admin@example.org",
+    "FIRST_SUPERUSER_PASSWORD": "tests",
+    "CILOGON_CLIENT_ID": "tests",
+    "CILOGON_CLIENT_SECRET": "tests",
+    "ROR_CLIENT_ID": "tests",
+}
+
+try:
+    import jeffersonlab_phonebook.config.settings  # noqa: F401
+except ValidationError:
+    for name, value in PLACEHOLDER_SETTINGS.items():
+        os.environ.setdefault(name, value)
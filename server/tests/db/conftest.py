@@ -0,0 +1,76 @@
+"""
+Fixtures for tests that need PostgreSQL. They run against the database the
+app is configured for (the usual POSTGRES_* settings) and every test is
+rolled back, so the data already in it is left alone. Without a configured
+database these tests are not collected.
+"""
+
+from typing import Any, Callable, Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+try:
+    from jeffersonlab_phonebook.db.session import engine
+except Exception:  # No settings or no server reachable.
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture
+def connection() -> Iterator[Connection]:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            yield connection
+        finally:
+            transaction.rollback()
+
+
+@pytest.fixture
+def db(connection: Connection) -> Iterator[Session]:
+    """A session whose commits are savepoints of the test's transaction."""
+    session = Session(
+        bind=connection, join_transaction_mode="create_savepoint", autoflush=False
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.enabled = False
+
+    def __call__(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if self.enabled:
+            self.statements.append(statement)
+
+    def __enter__(self) -> "StatementCounter":
+        self.statements.clear()
+        self.enabled = True
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.enabled = False
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_statements(connection: Connection) -> Iterator[Callable[[], StatementCounter]]:
+    """
+    `with count_statements() as counter:` records the SQL statements the
+    test's connection executes inside the block.
+    """
+    counter = StatementCounter()
+    event.listen(connection, "before_cursor_execute", counter)
+    try:
+        yield lambda: counter
+    finally:
+        event.remove(connection, "before_cursor_execute", counter)
@@ -0,0 +1,57 @@
+"""Minimal model factories for the database tests."""
+
+import itertools
+from datetime import date
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import Institution, Member, Role
+
+_ids = itertools.count(1)
+
+
+def _unique() -> int:
+    return next(_ids)
+
+
+def make_institution(db: Session, **values: Any) -> Institution:
+    n = _unique()
+    institution = Institution(
+        **{
+            "entityid": f"test-inst-{n}",
+            "full_name": f"Test Institution {n}",
+            "short_name": f"TI{n}",
+            "country": "US",
+            "date_added": date(2020, 1, 1),
+            **values,
+        }
+    )
+    db.add(institution)
+    db.flush()
+    return institution
+
+
+def make_member(db: Session, institution: Institution, **values: Any) -> Member:
+    n = _unique()
+    member = Member(
+        **{
+            "first_name": "Test",
+            "last_name": f"Member {n}",
+            "email": f"test-member-{n}@example.org",
+            "institution_id": institution.id,
+            "date_joined": date(2020, 1, 1),
+            **values,
+        }
+    )
+    db.add(member)
+    db.flush()
+    return member
+
+
+def make_role(db: Session, **values: Any) -> Role:
+    n = _unique()
+    role = Role(**{"name": f"test-role-{n}", "description": "", **values})
+    db.add(role)
+    db.flush()
+    return role
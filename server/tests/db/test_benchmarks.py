@@ -0,0 +1,35 @@
+"""
+Runs every benchmark script once with a single timed call, so that scripts
+calling code whose signature has since changed fail here rather than when
+someone next runs them.
+"""
+
+import importlib
+import pkgutil
+
+import pytest
+
+import benchmarks
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        module.name
+        for module in pkgutil.iter_modules(benchmarks.__path__)
+        if module.name.startswith("bench_")
+    ],
+)
+def test_benchmark_runs(name, monkeypatch, capsys):
+    module = importlib.import_module(f"benchmarks.{name}")
+
+    def call_once(fn, number, repeat=5):
+        fn()
+        return 1.0
+
+    monkeypatch.setattr(module, "NUMBER", 1)
+    monkeypatch.setattr(module, "best_ms", call_once)
+
+    module.main()
+
+    assert "ms" in capsys.readouterr().out
@@ -0,0 +1,38 @@
+from datetime import date
+
+from jeffersonlab_phonebook.db.models import MemberInstitutionHistory
+from jeffersonlab_phonebook.repositories.institution_repository import (
+    InstitutionRepository,
+)
+
+from .factories import make_institution, make_member
+
+
+def test_full_reports_totals_of_capped_collections(db):
+    institution = make_institution(db)
+    for _ in range(3):
+        member = make_member(db, institution)
+        db.add(
+            MemberInstitutionHistory(
+                member_id=member.id,
+                institution_id=institution.id,
+                start_date=date(2020, 1, 1),
+            )
+        )
+    db.flush()
+    db.expunge_all()
+
+    full = InstitutionRepository(db).get_full(
+        institution.id, members_limit=2, board_limit=2, history_limit=5
+    )
+
+    assert len(full.members) == 2
+    assert full.members_total == 3
+    assert full.board_memberships == []
+    assert full.board_memberships_total == 0
+    assert len(full.institution_memberships) == 3
+    assert full.institution_memberships_total == 3
+
+
+def test_full_of_missing_institution(db):
+    assert InstitutionRepository(db).get_full(0) is None
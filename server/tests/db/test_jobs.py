@@ -0,0 +1,121 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.constants import JobStatus
+from jeffersonlab_phonebook.db.models import Institution, Job
+from jeffersonlab_phonebook.repositories.job_repository import JobRepository
+from jeffersonlab_phonebook.services import jobs
+
+from .factories import make_institution
+
+LOCK_TIMEOUT = timedelta(minutes=10)
+KIND = "test_job"
+
+
+def _running_job(db, locked_at, attempts=1):
+    # Due before anything else in the queue, so claim() picks it first.
+    job = Job(
+        kind=KIND,
+        payload={},
+        max_attempts=5,
+        status=JobStatus.RUNNING,
+        attempts=attempts,
+        run_after=datetime(2000, 1, 1, tzinfo=timezone.utc),
+        locked_at=locked_at,
+    )
+    db.add(job)
+    db.commit()
+    return job
+
+
+def _other_session(connection):
+    return Session(bind=connection, join_transaction_mode="create_savepoint")
+
+
+def test_heartbeat_keeps_a_long_job_from_being_claimed_again(db):
+    stale = datetime.now(timezone.utc) - 2 * LOCK_TIMEOUT
+    job = _running_job(db, locked_at=stale)
+    repo = JobRepository(db)
+
+    assert repo.heartbeat(job.id, 1)
+    db.refresh(job)
+    assert job.locked_at > stale
+    claimed = repo.claim(LOCK_TIMEOUT)
+    assert claimed is None or claimed.id != job.id
+
+
+def test_completion_of_a_claim_taken_over_is_rejected(db):
+    job = _running_job(db, locked_at=datetime.now(timezone.utc) - 2 * LOCK_TIMEOUT)
+    repo = JobRepository(db)
+
+    assert repo.claim(LOCK_TIMEOUT).id == job.id
+    assert job.attempts == 2
+    assert not repo.heartbeat(job.id, 1)
+    assert not repo.mark_done(job.id, 1, {"stale": True})
+    assert not repo.mark_failed(job.id, 1, "stale", retry_in=None)
+    db.refresh(job)
+    assert (job.status, job.result, job.last_error) == (JobStatus.RUNNING, None, None)
+
+    assert repo.mark_done(job.id, 2, {"ok": True})
+    db.commit()
+    db.refresh(job)
+    assert (job.status, job.result) == (JobStatus.DONE, {"ok": True})
+
+
+def test_worker_renews_the_lock_while_the_handler_runs(db, connection, monkeypatch):
+    job = _running_job(db, locked_at=datetime.now(timezone.utc) - LOCK_TIMEOUT)
+    locked_at = job.locked_at
+    monkeypatch.setattr(jobs, "SessionLocal", lambda: _other_session(connection))
+    beats = []
+    heartbeat = JobRepository.heartbeat
+
+    def counting_heartbeat(self, job_id, attempt):
+        beats.append(job_id)
+        return heartbeat(self, job_id, attempt)
+
+    monkeypatch.setattr(JobRepository, "heartbeat", counting_heartbeat)
+    pool = jobs.JobWorkerPool(workers=1, poll_interval=1, lock_timeout=timedelta(seconds=0.3))
+    finished = threading.Event()
+    thread = threading.Thread(target=pool._heartbeat, args=(job.id, 1, finished))
+
+    thread.start()
+    # Only the heartbeat thread uses the connection until it is joined.
+    while not beats:
+        time.sleep(0.01)
+    finished.set()
+    thread.join()
+
+    db.refresh(job)
+    assert job.locked_at > locked_at
+
+
+def test_worker_discards_a_job_claimed_again_while_it_ran(
+    db, connection, monkeypatch
+):
+    institution_id = make_institution(db, city="Unchanged").id
+    job = _running_job(db, locked_at=datetime.now(timezone.utc) - 2 * LOCK_TIMEOUT)
+    job_id = job.id
+    monkeypatch.setattr(jobs, "SessionLocal", lambda: _other_session(connection))
+
+    def handler(session, payload):
+        session.get(Institution, institution_id).city = "Changed"
+        session.flush()
+        # Meanwhile another worker claims the job again.
+        with _other_session(connection) as other:
+            other.execute(
+                update(Job).where(Job.id == job_id).values(attempts=Job.attempts + 1)
+            )
+            other.commit()
+        return {"done": True}
+
+    monkeypatch.setitem(jobs._handlers, KIND, handler)
+
+    assert jobs.JobWorkerPool(1, 1, LOCK_TIMEOUT).run_next()
+
+    db.refresh(job)
+    assert (job.status, job.result) == (JobStatus.RUNNING, None)
+    assert db.get(Institution, institution_id).city == "Unchanged"
@@ -0,0 +1,114 @@
+from datetime import date
+
+from jeffersonlab_phonebook.schemas.member_import_schemas import (
+    MemberImportConflict,
+    MemberImportStatus,
+)
+from jeffersonlab_phonebook.services.member_import import import_members
+
+from .factories import make_institution, make_member
+
+
+def _row(institution, **values):
+    return {
+        "first_name": "Imported",
+        "last_name": "Member",
+        "institution_id": institution.id,
+        **values,
+    }
+
+
+def test_existing_members_are_skipped(db):
+    institution = make_institution(db)
+    member = make_member(db, institution, first_name="Original")
+
+    result = import_members(
+        db,
+        [
+            _row(institution, email=member.email),
+            _row(institution, email="test-import-new@example.org"),
+        ],
+    )
+
+    assert (result.created, result.skipped, result.updated, result.invalid) == (1, 1, 0, 0)
+    skipped, created = result.rows
+    assert skipped.status is MemberImportStatus.SKIPPED
+    assert skipped.member_id == member.id
+    assert created.status is MemberImportStatus.CREATED
+    db.refresh(member)
+    assert member.first_name == "Original"
+
+
+def test_update_keeps_the_active_flag_unless_given(db):
+    institution = make_institution(db)
+    other = make_institution(db)
+    left = make_member(db, institution, is_active=False, date_left=date(2023, 6, 30))
+    kept = make_member(db, institution, orcid="0000-0000-0000-0001")
+    new_email = "test-import-created@example.org"
+
+    result = import_members(
+        db,
+        [
+            _row(other, email=left.email, first_name="Renamed"),
+            _row(institution, email=kept.email),
+            _row(institution, email=new_email),
+        ],
+        MemberImportConflict.UPDATE,
+    )
+
+    assert (result.created, result.updated) == (1, 2)
+    for member in (left, kept):
+        db.refresh(member)
+    assert left.first_name == "Renamed"
+    assert left.institution_id == other.id
+    assert left.is_active is False
+    assert left.date_left == date(2023, 6, 30)
+    assert kept.orcid == "0000-0000-0000-0001"
+    assert db.get(type(left), result.rows[2].member_id).is_active is True
+
+
+def test_update_with_an_active_flag(db):
+    institution = make_institution(db)
+    rejoined = make_member(db, institution, is_active=False, date_left=date(2023, 6, 30))
+    leaving = make_member(db, institution)
+
+    result = import_members(
+        db,
+        [
+            _row(institution, email=rejoined.email, is_active=True),
+            _row(institution, email=leaving.email, is_active=False, date_left="2024-01-31"),
+        ],
+        MemberImportConflict.UPDATE,
+    )
+
+    assert result.updated == 2
+    for member in (rejoined, leaving):
+        db.refresh(member)
+    assert (rejoined.is_active, rejoined.date_left) == (True, None)
+    assert (leaving.is_active, leaving.date_left) == (False, date(2024, 1, 31))
+
+
+def test_invalid_rows_are_reported_and_not_written(db):
+    institution = make_institution(db)
+
+    result = import_members(
+        db,
+        [
+            {"first_name": "No", "last_name": "Email", "institution_id": institution.id},
+            _row(institution, email="test-import-a@example.org"),
+            _row(institution, email="test-import-a@example.org"),
+            {"first_name": "No", "last_name": "Institution", "email": "test-import-b@example.org"},
+            _row(institution, email="test-import-c@example.org", institution_id=-1),
+        ],
+    )
+
+    assert (result.created, result.invalid) == (1, 4)
+    missing, created, duplicate, no_institution, unknown = result.rows
+    assert created.status is MemberImportStatus.CREATED
+    for row in (missing, duplicate, no_institution, unknown):
+        assert row.status is MemberImportStatus.INVALID
+        assert row.member_id is None
+    assert missing.errors == ["email: Field required"]
+    assert duplicate.errors == ["email: already used by row 2"]
+    assert unknown.errors == ["institution_id: no institution with ID -1"]
+    assert no_institution.errors
@@ -0,0 +1,107 @@
+import json
+from datetime import date
+
+import pytest
+
+from jeffersonlab_phonebook.api.serialization import OrmJSON
+from jeffersonlab_phonebook.db.constants import BoardType
+from jeffersonlab_phonebook.db.models import (
+    Conference,
+    Group,
+    GroupMember,
+    InstitutionalBoardMember,
+    MemberInstitutionHistory,
+    Role,
+    Talk,
+    TalkAssignment,
+)
+from jeffersonlab_phonebook.repositories.member_repository import MemberRepository
+from jeffersonlab_phonebook.schemas.response_schemas import MemberResponse
+
+from .factories import make_institution, make_member, make_role
+
+# The roles counter, the member, the institution's three capped collections
+# and their totals, and one query per collection of the member: groups,
+# board seats, talks given and assigned.
+PROFILE_STATEMENTS = 10
+
+
+def _profile_graph(db, size: int) -> tuple[int, int]:
+    """A member whose every relationship has `size` rows."""
+    role = make_role(db)
+    institution = make_institution(db)
+    member = make_member(db, institution)
+    colleagues = [make_member(db, make_institution(db)) for _ in range(size)]
+    conference = Conference(name="Test Conference", start_date=date(2024, 1, 1))
+    db.add(conference)
+    db.flush()
+    for i, colleague in enumerate(colleagues):
+        group = Group(name=f"test-group-{member.id}-{i}", date_created=date(2020, 1, 1))
+        talk = Talk(title=f"Talk {i}", start_date=date(2024, 1, 1), conference_id=conference.id)
+        db.add_all([group, talk])
+        db.flush()
+        db.add_all(
+            [
+                GroupMember(group_id=group.id, member_id=member.id, role_id=role.id, start_date=date(2020, 1, 1)),
+                InstitutionalBoardMember(
+                    member_id=member.id,
+                    institution_id=colleague.institution_id,
+                    board_type=BoardType.INSTITUTIONAL,
+                    role_id=role.id,
+                    start_date=date(2020, 1, 1),
+                ),
+                InstitutionalBoardMember(
+                    member_id=colleague.id,
+                    institution_id=institution.id,
+                    board_type=BoardType.INSTITUTIONAL,
+                    role_id=role.id,
+                    start_date=date(2020, 1, 1),
+                ),
+                MemberInstitutionHistory(
+                    member_id=colleague.id, institution_id=institution.id, start_date=date(2020, 1, 1)
+                ),
+                TalkAssignment(
+                    talk_id=talk.id, member_id=member.id, role_id=role.id,
+                    assigned_by_id=colleague.id, assignment_date=date(2024, 1, 1),
+                ),
+                TalkAssignment(
+                    talk_id=talk.id, member_id=colleague.id, role_id=role.id,
+                    assigned_by_id=member.id, assignment_date=date(2024, 1, 1),
+                ),
+            ]
+        )
+        make_member(db, institution)
+    db.flush()
+    db.expunge_all()
+    return member.id, role.id
+
+
+@pytest.mark.parametrize("size", [1, 30])
+def test_profile_issues_a_fixed_number_of_statements(db, count_statements, size):
+    member_id, role_id = _profile_graph(db, size)
+    # The test role is not in the role registry; keep it in the identity map
+    # like the registry does for real roles.
+    role = db.get(Role, role_id)
+    repo = MemberRepository(db)
+    serializer = OrmJSON(MemberResponse)
+
+    with count_statements() as counter:
+        member = repo.get_profile(member_id, institution_limit=20)
+        body = json.loads(serializer.dump(member))
+
+    assert counter.count == PROFILE_STATEMENTS, counter.statements
+    assert role.id == role_id
+    assert len(body["group_memberships"]) == size
+    assert len(body["talk_assignments"]) == size
+    assert len(body["talk_assignments_given"]) == size
+    # The institution's collections are capped.
+    assert len(body["institution"]["members"]) == min(size + 1, 20)
+    assert len(body["institution"]["board_memberships"]) == min(size, 20)
+    assert len(body["institution"]["institution_memberships"]) == min(size, 20)
+    assert body["institution"]["members_total"] == size + 1
+    assert body["institution"]["board_memberships_total"] == size
+    assert body["institution"]["institution_memberships_total"] == size
+
+
+def test_missing_profile(db):
+    assert MemberRepository(db).get_profile(0) is None
@@ -0,0 +1,69 @@
+import smtplib
+from contextlib import contextmanager
+from datetime import date
+
+from jeffersonlab_phonebook.db.models import Group, Notification
+from jeffersonlab_phonebook.services import notifications
+from jeffersonlab_phonebook.services.mailer import SmtpMailer
+
+from .factories import make_institution, make_member, make_role
+
+
+class _FakeSmtp:
+    def __init__(self, refused: set[str]) -> None:
+        self.refused = refused
+        self.sent: list[str] = []
+
+    def send_message(self, message) -> None:
+        if message["To"] in self.refused:
+            raise smtplib.SMTPRecipientsRefused({message["To"]: (550, b"No such user")})
+        self.sent.append(message["To"])
+
+
+def _mailer(smtp: _FakeSmtp) -> SmtpMailer:
+    mailer = SmtpMailer("smtp.invalid", 25, "phonebook@example.org")
+
+    @contextmanager
+    def connection():
+        yield smtp
+
+    mailer.connection = connection  # type: ignore[method-assign]
+    return mailer
+
+
+def test_rejected_digest_does_not_block_the_others(db, monkeypatch):
+    role = make_role(db)
+    institution = make_institution(db)
+    group = Group(name="test-notifications-group", date_created=date(2020, 1, 1))
+    db.add(group)
+    db.flush()
+    members = [make_member(db, institution) for _ in range(3)]
+    for member in members:
+        db.add(
+            Notification(
+                member_id=member.id,
+                kind=notifications.GROUP_ADDED,
+                payload={"group_id": group.id, "role_id": role.id},
+            )
+        )
+    db.flush()
+    smtp = _FakeSmtp(refused={members[0].email})
+    monkeypatch.setattr(notifications, "get_mailer", lambda: _mailer(smtp))
+
+    notifications.dispatch_notifications(db, {})
+
+    assert {members[1].email, members[2].email} <= set(smtp.sent)
+    assert members[0].email not in smtp.sent
+    rows = {
+        n.member_id: n
+        for n in db.query(Notification).filter(
+            Notification.member_id.in_([m.id for m in members])
+        )
+    }
+    db.expire_all()
+    refused = rows[members[0].id]
+    assert refused.sent_at is None and refused.failed_at is not None
+    assert "No such user" in refused.error
+    for member in members[1:]:
+        assert rows[member.id].sent_at is not None
+        assert rows[member.id].failed_at is None
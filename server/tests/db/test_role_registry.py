@@ -0,0 +1,42 @@
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.repositories.role_registry import RoleRegistry
+
+from .factories import make_role
+
+
+def _registry(monkeypatch) -> tuple[RoleRegistry, list[int]]:
+    registry = RoleRegistry()
+    registry.load()
+    loads = []
+    load = registry.load
+
+    def counting_load():
+        loads.append(1)
+        load()
+
+    monkeypatch.setattr(registry, "load", counting_load)
+    return registry, loads
+
+
+def test_sync_reloads_after_a_role_write_elsewhere(db, connection, monkeypatch):
+    registry, loads = _registry(monkeypatch)
+    registry.sync(db)
+    assert loads == []
+
+    # Another worker's write moves the counter; no hook runs in this process.
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as other:
+        make_role(other)
+        other.commit()
+
+    registry.sync(db)
+    assert loads == [1]
+
+
+def test_prime_syncs_once_per_session(db, count_statements, monkeypatch):
+    registry, _ = _registry(monkeypatch)
+    with count_statements() as counter:
+        registry.prime(db)
+        registry.prime(db)
+    queries = [s for s in counter.statements if not s.startswith("SAVEPOINT")]
+    assert len(queries) == 1, queries
@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+from sqlalchemy.orm import Session
+
+from jeffersonlab_phonebook.db.models import Institution
+from jeffersonlab_phonebook.services import ror_refresh
+from jeffersonlab_phonebook.services.ror_api_client import RorApiNetworkError
+from jeffersonlab_phonebook.services.ror_async_client import AsyncRorApiClient
+
+from .factories import make_institution
+
+
+class _StubClient(AsyncRorApiClient):
+    def __init__(self) -> None:
+        super().__init__("http://ror.invalid")
+        self.closed = False
+
+    async def fetch(self, rorid):
+        if rorid == "0test0001":
+            return {"city": "Refreshed City"}
+        raise RorApiNetworkError("not found", status_code=404)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_refresh_job_returns_the_report(db, monkeypatch):
+    institution = make_institution(db, rorid="0test0001", city="Old City")
+    client = _StubClient()
+    monkeypatch.setattr(ror_refresh, "new_async_ror_api_client", lambda: client)
+
+    result = ror_refresh.refresh_institutions_job(db, {"dry_run": True})
+
+    # Stored as the job's JSONB result.
+    assert json.loads(json.dumps(result)) == result
+    assert result["dry_run"] is True
+    assert {
+        "institution_id": institution.id,
+        "rorid": "0test0001",
+        "changes": {"city": "Refreshed City"},
+    } in result["updated"]
+    assert client.closed
+    db.refresh(institution)
+    assert institution.city == "Old City"
+
+
+def test_refresh_keeps_fields_edited_while_it_runs(db, connection):
+    institution = make_institution(
+        db, rorid="0test0001", city="Old City", full_name="Before Edit"
+    )
+    db.commit()
+
+    class EditingClient(_StubClient):
+        async def fetch(self, rorid):
+            # An admin renames the institution after the refresh read it.
+            with Session(bind=connection, join_transaction_mode="create_savepoint") as other:
+                other.get(Institution, institution.id).full_name = "Edited"
+                other.commit()
+            return await super().fetch(rorid)
+
+    report = asyncio.run(
+        ror_refresh.refresh_institutions_from_ror(
+            db, client=EditingClient(), rate_per_second=1000
+        )
+    )
+
+    changes = {change.institution_id: change.changes for change in report.updated}
+    assert changes[institution.id] == {"city": "Refreshed City"}
+    db.refresh(institution)
+    assert (institution.full_name, institution.city) == ("Edited", "Refreshed City")
@@ -0,0 +1,57 @@
+import os
+import time
+
+import pytest
+
+from jeffersonlab_phonebook.config.settings import settings
+from jeffersonlab_phonebook.services import snapshots
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SNAPSHOT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _touch(path, mtime: float) -> str:
+    path.write_bytes(b"")
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_only_older_snapshots_are_removed(snapshot_dir):
+    started = time.time()
+    older = _touch(snapshot_dir / "members-old.parquet", started - 60)
+    written = _touch(snapshot_dir / "members-new.parquet", started)
+    # Written by a build that read its rows after this one.
+    newer = _touch(snapshot_dir / "members-newer.parquet", started + 1)
+    other = _touch(snapshot_dir / "institutions-old.parquet", started - 60)
+
+    snapshots._remove_older("members-*.parquet", written, started)
+
+    assert not os.path.exists(older)
+    assert all(os.path.exists(path) for path in (written, newer, other))
+
+
+def test_build_keeps_newer_snapshots(db, snapshot_dir):
+    pytest.importorskip("pyarrow")
+    name = snapshots.SNAPSHOT_NAMES[0]
+    older = _touch(snapshot_dir / f"{name}-old.parquet", time.time() - 60)
+    newer = _touch(snapshot_dir / f"{name}-newer.parquet", time.time() + 60)
+
+    path = snapshots.build_snapshot(db, name, "current")
+
+    assert os.path.exists(path) and os.path.exists(newer)
+    assert not os.path.exists(older)
+
+
+def test_directory_build_keeps_newer_files(db, snapshot_dir):
+    older = _touch(snapshot_dir / "directory-old.sqlite", time.time() - 60)
+    # Written by a concurrent build that read its rows after this one.
+    newer = _touch(snapshot_dir / "directory-newer.sqlite", time.time() + 60)
+
+    path = snapshots.build_directory(db, "current", snapshots.directory_versions(db))
+
+    assert os.path.exists(path) and os.path.exists(newer)
+    assert not os.path.exists(older)
+    assert os.path.getmtime(path) < os.path.getmtime(newer)
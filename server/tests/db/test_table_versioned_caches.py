@@ -0,0 +1,85 @@
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from jeffersonlab_phonebook.db.models import Institution
+from jeffersonlab_phonebook.services.cache import TableVersionedCache
+from jeffersonlab_phonebook.services.response_cache import (
+    LRUCacheBackend,
+    ResponseCache,
+    table_stamp,
+)
+
+from .factories import make_institution
+
+TABLES = {Institution.__tablename__}
+
+
+def _write_from_another_worker(connection) -> None:
+    """Commits a write in a separate session, as another process would."""
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as other:
+        make_institution(other)
+        other.commit()
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+def test_cache_entry_is_a_miss_after_a_write_elsewhere(db, connection):
+    cache = TableVersionedCache()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return len(loads)
+
+    assert cache.get_or_load(db, "key", TABLES, load) == 1
+    assert cache.get_or_load(db, "key", TABLES, load) == 1
+
+    _write_from_another_worker(connection)
+
+    assert cache.get_or_load(db, "key", TABLES, load) == 2
+    assert cache.get_or_load(db, "key", {"roles"}, load) == 3
+
+
+def test_cache_evicts_least_recently_used_keys(db):
+    cache = TableVersionedCache(max_entries=2)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return len(loads)
+
+    cache.get_or_load(db, "a", TABLES, load)
+    cache.get_or_load(db, "b", TABLES, load)
+    cache.get_or_load(db, "a", TABLES, load)
+    cache.get_or_load(db, "c", TABLES, load)
+
+    assert cache.get_or_load(db, "a", TABLES, load) == 1
+    assert cache.get_or_load(db, "b", TABLES, load) == 4
+    assert len(loads) == 4
+
+
+def test_response_cache_is_stamped_with_table_versions(db, connection):
+    cache = ResponseCache(LRUCacheBackend())
+    bodies = iter([b"first", b"second"])
+
+    def render() -> bytes:
+        return next(bodies)
+
+    def get() -> bytes:
+        return cache.get_or_render("/", "/?", table_stamp(_request(), db, TABLES), render)
+
+    assert get() == b"first"
+    assert get() == b"first"
+
+    _write_from_another_worker(connection)
+
+    assert get() == b"second"
+    assert cache.stats()["/"].hits == 1
+
+
+def test_stamp_reuses_versions_read_by_the_etag(db):
+    request = _request()
+    request.state.table_versions = {Institution.__tablename__: 41}
+    assert table_stamp(request, db, TABLES) == ((Institution.__tablename__, 41),)
@@ -0,0 +1,106 @@
+import gzip
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from jeffersonlab_phonebook.api.compression import CompressionMiddleware
+
+ETAG = '"0123456789abcdef"'
+LARGE = {"rows": ["x" * 40] * 100}
+
+
+async def small(request: Request) -> Response:
+    return JSONResponse({"ok": True})
+
+
+async def large(request: Request) -> Response:
+    return JSONResponse(LARGE)
+
+
+async def streamed(request: Request) -> Response:
+    async def chunks():
+        for i in range(3):
+            yield f'{{"chunk": {i}}}\n'.encode()
+
+    return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+
+async def tagged(request: Request) -> Response:
+    """Answers like a route with TableETag."""
+    if request.headers.get("if-none-match") == ETAG:
+        return Response(status_code=304, headers={"ETag": ETAG})
+    return JSONResponse(LARGE, headers={"ETag": ETAG})
+
+
+def _client() -> TestClient:
+    app = Starlette(
+        routes=[
+            Route("/small", small),
+            Route("/large", large),
+            Route("/streamed", streamed),
+            Route("/tagged", tagged),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return TestClient(app)
+
+
+def _get(client: TestClient, path: str, **headers: str):
+    return client.get(path, headers={"Accept-Encoding": "gzip", **headers})
+
+
+def test_body_below_the_threshold_is_not_compressed():
+    response = _get(_client(), "/small")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == {"ok": True}
+
+
+def test_body_above_the_threshold_is_compressed():
+    with _client().stream("GET", "/large", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert gzip.decompress(raw) == JSONResponse(LARGE).body
+
+
+def test_client_without_gzip_gets_identity():
+    response = _get(_client(), "/large", **{"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_streamed_body_is_compressed_without_buffering():
+    with _client().stream("GET", "/streamed", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw) == b'{"chunk": 0}\n{"chunk": 1}\n{"chunk": 2}\n'
+
+
+def test_compressed_etag_revalidates():
+    client = _client()
+    response = _get(client, "/tagged")
+    assert response.headers["etag"] == '"0123456789abcdef-gzip"'
+
+    revalidated = _get(client, "/tagged", **{"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == '"0123456789abcdef-gzip"'
+    assert revalidated.headers["vary"] == "Accept-Encoding"
+
+
+def test_identity_etag_revalidates():
+    client = _client()
+    revalidated = _get(client, "/tagged", **{"Accept-Encoding": "identity", "If-None-Match": ETAG})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == ETAG
+    assert revalidated.headers["vary"] == "Accept-Encoding"
+
+
+def test_etag_of_another_encoding_does_not_match():
+    response = _get(_client(), "/tagged", **{"If-None-Match": '"0123456789abcdef-br"'})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
@@ -0,0 +1,72 @@
+from jeffersonlab_phonebook.services import response_cache as cache_module
+from jeffersonlab_phonebook.services.response_cache import (
+    InMemoryKeyValueStore,
+    ResponseCache,
+    SharedCacheBackend,
+)
+
+STAMP = (("institutions", 1), ("members", 4))
+
+
+class _Renderer:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> bytes:
+        self.calls += 1
+        return f'{{"render": {self.calls}}}'.encode()
+
+
+def _cache(ttl: int = 60) -> ResponseCache:
+    return ResponseCache(SharedCacheBackend(InMemoryKeyValueStore(), ttl=ttl))
+
+
+def test_shared_backend_hit():
+    cache = _cache()
+    render = _Renderer()
+
+    first = cache.get_or_render("/members", "/members?", STAMP, render)
+    second = cache.get_or_render("/members", "/members?", STAMP, render)
+
+    assert first == second == b'{"render": 1}'
+    assert render.calls == 1
+    stats = cache.stats()["/members"]
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_shared_backend_entries_are_shared_across_caches():
+    store = InMemoryKeyValueStore()
+    render = _Renderer()
+
+    ResponseCache(SharedCacheBackend(store)).get_or_render("ns", "key", STAMP, render)
+    body = ResponseCache(SharedCacheBackend(store)).get_or_render("ns", "key", STAMP, render)
+
+    assert body == b'{"render": 1}'
+    assert render.calls == 1
+
+
+def test_shared_backend_misses_after_a_table_version_bump():
+    cache = _cache()
+    render = _Renderer()
+    cache.get_or_render("ns", "key", STAMP, render)
+
+    bumped = (("institutions", 1), ("members", 5))
+    body = cache.get_or_render("ns", "key", bumped, render)
+
+    assert body == b'{"render": 2}'
+    assert cache.get_or_render("ns", "key", bumped, render) == body
+    assert render.calls == 2
+
+
+def test_shared_backend_misses_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = _cache(ttl=60)
+    render = _Renderer()
+    cache.get_or_render("ns", "key", STAMP, render)
+
+    now[0] += 59
+    assert cache.get_or_render("ns", "key", STAMP, render) == b'{"render": 1}'
+    now[0] += 1
+    assert cache.get_or_render("ns", "key", STAMP, render) == b'{"render": 2}'
+    assert render.calls == 2
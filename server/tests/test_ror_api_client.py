@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from jeffersonlab_phonebook.services.ror_api_client import (
+    RorApiClient,
+    RorApiNetworkError,
+    RorCache,
+)
+
+RECORD = {
+    "names": [
+        {"value": "Thomas Jefferson National Accelerator Facility", "types": ["ror_display"]},
+        {"value": "JLab", "types": ["acronym"]},
+    ],
+    "locations": [
+        {
+            "geonames_details": {
+                "name": "Newport News",
+                "country_name": "United States",
+                "country_subdivision_name": "Virginia",
+                "lat": 37.09,
+                "lng": -76.47,
+            }
+        }
+    ],
+}
+
+
+class _RorStub(BaseHTTPRequestHandler):
+    """/slow answers after a second, /<id> with RECORD, anything else 404."""
+
+    requests: list[str]
+
+    def do_GET(self) -> None:
+        self.server.requests.append(self.path)  # type: ignore[attr-defined]
+        if self.path == "/slow":
+            time.sleep(1)
+        if self.path in ("/02afjh072", "/slow"):
+            body, status = json.dumps(RECORD).encode(), 200
+        else:
+            body, status = b'{"errors": ["not found"]}', 404
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RorStub)
+    server.requests = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(stub: ThreadingHTTPServer, cache: RorCache | None = None, **options) -> RorApiClient:
+    host, port = stub.server_address[:2]
+    return RorApiClient(f"http://{host}:{port}/", cache=cache, **options)
+
+
+def test_fetch_parses_the_record(stub):
+    record = _client(stub).fetch("02afjh072")
+    assert record["full_name"] == "Thomas Jefferson National Accelerator Facility"
+    assert record["short_name"] == "JLab"
+    assert record["city"] == "Newport News"
+
+
+def test_read_timeout(stub):
+    client = _client(stub, read_timeout=0.1)
+    started = time.monotonic()
+    with pytest.raises(RorApiNetworkError, match="timed out"):
+        client.fetch("slow")
+    assert time.monotonic() - started < 1
+
+
+def test_not_found_is_cached(stub):
+    client = _client(stub, cache=RorCache(ttl=60, negative_ttl=60))
+    for _ in range(2):
+        with pytest.raises(RorApiNetworkError) as error:
+            client.fetch("0missing00")
+        assert error.value.status_code == 404
+    assert stub.requests == ["/0missing00"]
+
+
+def test_not_found_expires_after_the_negative_ttl(stub):
+    client = _client(stub, cache=RorCache(ttl=60, negative_ttl=0))
+    for _ in range(2):
+        with pytest.raises(RorApiNetworkError):
+            client.fetch("0missing00")
+    assert len(stub.requests) == 2
+
+
+def test_disk_cache_round_trip(stub, tmp_path):
+    directory = tmp_path / "ror"
+    first = RorCache(ttl=60, negative_ttl=60, directory=str(directory))
+    assert not directory.exists()
+    record = _client(stub, cache=first).fetch("02afjh072")
+
+    # A new process starts with an empty memory tier.
+    second = RorCache(ttl=60, negative_ttl=60, directory=str(directory))
+    assert _client(stub, cache=second).fetch("02afjh072") == record
+    assert stub.requests == ["/02afjh072"]
+
+
+def test_disk_cache_ignores_expired_entries(tmp_path):
+    RorCache(ttl=-1, negative_ttl=60, directory=str(tmp_path)).set("x", {"a": 1})
+    assert RorCache(ttl=60, negative_ttl=60, directory=str(tmp_path)).get("x") == (False, None)
+
+
+def test_disk_write_replaces_atomically(tmp_path, monkeypatch):
+    cache = RorCache(ttl=60, negative_ttl=60, directory=str(tmp_path))
+    cache.set("x", {"version": 1})
+
+    def failing_replace(src: str, dst: str) -> None:
+        # The new file is complete before it would replace the old one.
+        with open(src, encoding="utf-8") as f:
+            assert json.load(f)["record"] == {"version": 2}
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    cache.set("x", {"version": 2})
+    monkeypatch.undo()
+
+    # The failed write left the previous file intact and no temporary file.
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+    fresh = RorCache(ttl=60, negative_ttl=60, directory=str(tmp_path))
+    assert fresh.get("x") == (True, {"version": 1})
+    # The memory tier still holds the newest value.
+    assert cache.get("x") == (True, {"version": 2})
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = RorCache(ttl=60, negative_ttl=60, max_entries=2)
+    cache.set("a", {"id": "a"})
+    cache.set("b", {"id": "b"})
+    cache.get("a")
+    cache.set("c", {"id": "c"})
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, {"id": "a"})
+    assert cache.get("c") == (True, {"id": "c"})
+
+    # With a directory, evicted entries are read back from disk.
+    backed = RorCache(ttl=60, negative_ttl=60, directory=str(tmp_path), max_entries=1)
+    backed.set("a", {"id": "a"})
+    backed.set("b", {"id": "b"})
+    assert list(backed._memory) == ["b"]
+    assert backed.get("a") == (True, {"id": "a"})
@@ -0,0 +1,72 @@
+import asyncio
+
+import httpx
+import pytest
+
+from jeffersonlab_phonebook.services.ror_api_client import RorApiNetworkError
+from jeffersonlab_phonebook.services.ror_async_client import (
+    AsyncRorApiClient,
+    CircuitBreaker,
+)
+
+
+def _open_client(monkeypatch, get) -> AsyncRorApiClient:
+    """A client whose breaker is open and past its reset timeout."""
+    client = AsyncRorApiClient(
+        "http://ror.invalid",
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0),
+    )
+    client.breaker.record_failure()
+    monkeypatch.setattr(client, "_get", get)
+    return client
+
+
+def test_breaker_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow() and not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open and breaker.allow()
+
+
+def test_failed_trial_reopens_the_breaker(monkeypatch):
+    async def get(rorid):
+        raise httpx.ConnectError("down")
+
+    client = _open_client(monkeypatch, get)
+    with pytest.raises(RorApiNetworkError, match="Failed to connect"):
+        asyncio.run(client.fetch("02afjh072"))
+    assert client.breaker.is_open
+    assert client.breaker.allow()
+
+
+def test_cancelled_trial_frees_the_breaker(monkeypatch):
+    async def get(rorid):
+        await asyncio.sleep(10)
+
+    client = _open_client(monkeypatch, get)
+
+    async def cancel_trial():
+        task = asyncio.create_task(client.fetch("02afjh072"))
+        await asyncio.sleep(0)
+        assert not client.breaker.allow()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_trial())
+    assert client.breaker.allow()
+
+
+def test_trial_raising_unexpectedly_frees_the_breaker(monkeypatch):
+    async def get(rorid):
+        raise RuntimeError("bug")
+
+    client = _open_client(monkeypatch, get)
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.fetch("02afjh072"))
+    assert client.breaker.allow()
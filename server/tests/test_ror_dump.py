@@ -0,0 +1,61 @@
+import json
+import zipfile
+
+import pytest
+
+from jeffersonlab_phonebook.services import ror_dump
+from jeffersonlab_phonebook.services.ror_dump import iter_dump_records
+
+RECORDS = [{"id": f"https://ror.org/0{i}", "names": []} for i in range(3)]
+
+
+@pytest.fixture
+def opened_archives(monkeypatch):
+    """The ZipFile objects opened for reading."""
+    archives = []
+
+    class TrackedZipFile(zipfile.ZipFile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if self.mode == "r":
+                archives.append(self)
+
+    monkeypatch.setattr(ror_dump.zipfile, "ZipFile", TrackedZipFile)
+    return archives
+
+
+def _zip(path, members):
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return str(path)
+
+
+def test_reads_the_v2_member_of_a_zip(tmp_path, opened_archives):
+    path = _zip(
+        tmp_path / "dump.zip",
+        {"v1.json": "[]", "v2.json": json.dumps(RECORDS)},
+    )
+    assert list(iter_dump_records(path)) == RECORDS
+    assert [archive.fp for archive in opened_archives] == [None]
+
+
+def test_closes_the_zip_when_reading_stops_early(tmp_path, opened_archives):
+    path = _zip(tmp_path / "dump.zip", {"v2.json": json.dumps(RECORDS)})
+    records = iter_dump_records(path)
+    assert next(records) == RECORDS[0]
+    records.close()
+    assert opened_archives[0].fp is None
+
+
+def test_zip_without_json(tmp_path, opened_archives):
+    path = _zip(tmp_path / "dump.zip", {"README": "no data"})
+    with pytest.raises(ValueError, match="No JSON file"):
+        list(iter_dump_records(path))
+    assert opened_archives[0].fp is None
+
+
+def test_reads_a_plain_json_file(tmp_path):
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps(RECORDS), encoding="utf-8")
+    assert list(iter_dump_records(str(path))) == RECORDS